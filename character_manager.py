@@ -10,7 +10,21 @@ This module handles character creation, loading, and saving.
 """
 
 import os
+import math
+import time
+import zlib
+import bisect
+import atexit
+import sqlite3
+import threading
+from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
+try:
+    import numpy as np
+except ImportError:  # CharacterPool is optional
+    np = None
 from custom_exceptions import (
+    GameError,
     InvalidCharacterClassError,
     CharacterNotFoundError,
     SaveFileCorruptedError,
@@ -18,16 +32,50 @@ from custom_exceptions import (
     CharacterDeadError
 )
 
+# fsync policy for saves: True forces each save to disk before
+# save_character returns; False leaves flushing to the operating system.
+SAVE_FSYNC = True
+
+SAVE_SUFFIX = "_save.txt"
+# The save manifest lives next to the save directory, not inside it,
+# so updating it doesn't change the directory it describes
+MANIFEST_SUFFIX = ".manifest"
+MANIFEST_VERSION = 1
+
+# Delta saves append only the changed fields to {name}_save.journal;
+# after JOURNAL_COMPACT_ENTRIES appends the journal is compacted into a
+# full save. DELTA_SAVES is the default for save_character's delta flag.
+DELTA_SAVES = False
+JOURNAL_SUFFIX = "_save.journal"
+JOURNAL_COMPACT_ENTRIES = 50
+
+# Save encodings: "text" (KEY: value lines) or "binary" (see BINARY SAVE
+# FORMAT). Both use {name}_save.txt; load_character detects which it is.
+SAVE_FORMAT = "text"
+SAVE_FORMATS = ("text", "binary")
+BINARY_SAVE_COMPRESS = False
+
+# Keys every character has, in save file order (see Character)
+CHARACTER_FIELDS = (
+    "name", "class", "level", "health", "max_health", "strength", "magic",
+    "experience", "gold", "inventory", "active_quests", "completed_quests",
+)
+
 # ============================================================================
 # CHARACTER MANAGEMENT FUNCTIONS
 # ============================================================================
 
-def create_character(name, character_class):
+def create_character(name, character_class, compact=False):
     """
     Create a new character with stats based on class
     
     Valid classes: Warrior, Mage, Rogue, Cleric
     
+    Args:
+        name: Character name
+        character_class: One of the valid classes
+        compact: Return a slotted Character instead of a dictionary
+    
     Returns: Dictionary with character data including:
             - name, class, level, health, max_health, strength, magic
             - experience, gold, inventory, active_quests, completed_quests
@@ -61,10 +109,97 @@ def create_character(name, character_class):
         "active_quests": [],
         "completed_quests": []
     }
+    if compact:
+        return Character(character)
     return character
 
 
-def save_character(character, save_directory="data/save_games"):
+class Character(MutableMapping):
+    """
+    Character whose fixed fields (CHARACTER_FIELDS) live in __slots__
+    
+    Behaves like the character dictionary (char["gold"], char.get("level"),
+    "inventory" in char, iteration, ==) so every existing call site keeps
+    working, but uses a fraction of a dict's memory. Code that owns a
+    Character can also read fixed fields as attributes (char.gold); the
+    "class" key is the character_class attribute. Other keys (e.g.
+    equipped_weapon) go into a small dictionary created on first use.
+    """
+    __slots__ = ("name", "character_class", "level", "health", "max_health",
+                 "strength", "magic", "experience", "gold", "inventory",
+                 "active_quests", "completed_quests", "_extra")
+    _slot_names = dict(zip(CHARACTER_FIELDS, __slots__))
+
+    def __init__(self, data=(), **kwargs):
+        self._extra = None
+        self.update(data, **kwargs)
+
+    def __getitem__(self, key):
+        slot = self._slot_names.get(key)
+        if slot is not None:
+            try:
+                return getattr(self, slot)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is None:
+            raise KeyError(key)
+        return self._extra[key]
+
+    def __setitem__(self, key, value):
+        slot = self._slot_names.get(key)
+        if slot is not None:
+            setattr(self, slot, value)
+        elif self._extra is None:
+            self._extra = {key: value}
+        else:
+            self._extra[key] = value
+
+    def __delitem__(self, key):
+        slot = self._slot_names.get(key)
+        if slot is not None:
+            try:
+                delattr(self, slot)
+            except AttributeError:
+                raise KeyError(key) from None
+        elif self._extra is None:
+            raise KeyError(key)
+        else:
+            del self._extra[key]
+
+    def __contains__(self, key):
+        slot = self._slot_names.get(key)
+        if slot is not None:
+            return hasattr(self, slot)
+        return self._extra is not None and key in self._extra
+
+    def __iter__(self):
+        for key, slot in self._slot_names.items():
+            if hasattr(self, slot):
+                yield key
+        if self._extra:
+            yield from list(self._extra)
+
+    def __len__(self):
+        count = sum(1 for slot in self._slot_names.values() if hasattr(self, slot))
+        return count + (len(self._extra) if self._extra else 0)
+
+    def __reduce__(self):
+        return (type(self), (self.to_dict(),))
+
+    def __repr__(self):
+        return f"Character({self.to_dict()!r})"
+
+    def copy(self):
+        """Return a shallow copy (lists are shared, as with dict.copy)"""
+        return Character(self)
+
+    def to_dict(self):
+        """Return the character as a plain dictionary"""
+        return dict(self.items())
+
+
+def save_character(character, save_directory="data/save_games", fsync=None,
+                   backend=None, delta=None, save_format=None):
     """
     Save character to file
     
@@ -84,41 +219,208 @@ def save_character(character, save_directory="data/save_games"):
     ACTIVE_QUESTS: quest1,quest2
     COMPLETED_QUESTS: quest1,quest2
     
+    The save is written to a temporary file and renamed over the old
+    save, so a crash mid-save never leaves a truncated file behind.
+    fsync (default: SAVE_FSYNC) controls whether the data is forced to
+    disk before returning.
+    
+    With delta=True (default: DELTA_SAVES) only the fields that changed
+    since this process last saved or loaded the character are appended
+    to {character_name}_save.journal; load_character replays the journal
+    on top of the save file. The journal is compacted into a new full
+    save every JOURNAL_COMPACT_ENTRIES saves.
+    
+    save_format (default: SAVE_FORMAT) selects "text" or "binary"
+    encoding. Binary saves are always full saves, so delta only applies
+    to the text format.
+    
+    If backend is given (e.g. a SQLiteSaveBackend), the character is
+    saved there instead and save_directory/fsync/delta are ignored.
+    
     Returns: True if successful
     Raises: PermissionError, IOError (let them propagate or handle)
     """
+    if backend is not None:
+        return backend.save(character)
+    if fsync is None:
+        fsync = SAVE_FSYNC
+    if delta is None:
+        delta = DELTA_SAVES
+    if save_format is None:
+        save_format = SAVE_FORMAT
+    if save_format not in SAVE_FORMATS:
+        raise ValueError(f"Unknown save format: {save_format}")
+
     os.makedirs(save_directory, exist_ok=True)
-    filename = f"{character['name']}_save.txt"
-    path = os.path.join(save_directory, filename)
+    manifest = find_save_manifest(save_directory)
+    before = manifest.directory_mtime() if manifest is not None else None
 
-    # Lists as comma-separated strings (may be empty)
-    inv_str = ",".join(character.get("inventory", []))
-    active_str = ",".join(character.get("active_quests", []))
-    completed_str = ",".join(character.get("completed_quests", []))
-
-    with open(path, "w") as f:
-        f.write(f"NAME: {character['name']}\n")
-        f.write(f"CLASS: {character['class']}\n")
-        f.write(f"LEVEL: {character['level']}\n")
-        f.write(f"HEALTH: {character['health']}\n")
-        f.write(f"MAX_HEALTH: {character['max_health']}\n")
-        f.write(f"STRENGTH: {character['strength']}\n")
-        f.write(f"MAGIC: {character['magic']}\n")
-        f.write(f"EXPERIENCE: {character['experience']}\n")
-        f.write(f"GOLD: {character['gold']}\n")
-        f.write(f"INVENTORY: {inv_str}\n")
-        f.write(f"ACTIVE_QUESTS: {active_str}\n")
-        f.write(f"COMPLETED_QUESTS: {completed_str}\n")
+    directory_changed = write_character_files(character, save_directory, fsync,
+                                              delta, save_format)
+    if fsync and directory_changed:
+        fsync_directory(save_directory)
 
+    if manifest is not None:
+        manifest.record_change(before, saved=[character["name"]])
     return True
 
-def load_character(character_name, save_directory="data/save_games"):
+
+def write_character_files(character, save_directory, fsync, delta, save_format):
+    """
+    Write a character's save (or journal entry) without touching the
+    manifest or syncing the directory
+    
+    Returns: True if a file was created or replaced (directory changed)
+    """
+    name = character["name"]
+    if delta and save_format == "text":
+        return write_delta_save(character, save_directory, fsync)
+    write_save_file(get_save_path(name, save_directory),
+                    encode_character_save(character, save_format), fsync)
+    discard_journal(name, save_directory)
+    return True
+
+
+def character_save_fields(character):
+    """
+    Get a character's save file fields as text
+    
+    Returns: List of (KEY, value) string pairs in save file order
+    """
+    # Lists as comma-separated strings (may be empty)
+    return [
+        ("NAME", character["name"]),
+        ("CLASS", character["class"]),
+        ("LEVEL", str(character["level"])),
+        ("HEALTH", str(character["health"])),
+        ("MAX_HEALTH", str(character["max_health"])),
+        ("STRENGTH", str(character["strength"])),
+        ("MAGIC", str(character["magic"])),
+        ("EXPERIENCE", str(character["experience"])),
+        ("GOLD", str(character["gold"])),
+        ("INVENTORY", ",".join(character.get("inventory", []))),
+        ("ACTIVE_QUESTS", ",".join(character.get("active_quests", []))),
+        ("COMPLETED_QUESTS", ",".join(character.get("completed_quests", []))),
+    ]
+
+
+def format_character_save(character, save_id=None):
+    """
+    Build the complete text of a character's save file
+    
+    Args:
+        character: Character dictionary
+        save_id: Snapshot ID linking a delta-mode save to its journal
+    
+    Returns: Save file contents as one string
+    """
+    fields = character_save_fields(character)
+    if save_id is not None:
+        fields.append(("SAVE_ID", save_id))
+    return "".join(f"{key}: {value}\n" for key, value in fields)
+
+
+def encode_character_save(character, save_format="text"):
+    """
+    Encode a character's full save in the given format
+    
+    Returns: str for "text", bytes for "binary"
+    """
+    if save_format == "binary":
+        return encode_binary_save(character, BINARY_SAVE_COMPRESS)
+    return format_character_save(character)
+
+
+class GroupCommit:
+    """
+    Batches many character saves into one fsync window
+    
+    Saves added to the group are all written to temporary files before
+    any of them is synced, so the disk flushes them in one window; they
+    are then renamed into place, followed by a single directory sync. Adding the same character twice keeps only the latest state.
+    
+    Usage:
+        with GroupCommit("data/save_games") as group:
+            group.add(character_a)
+            group.add(character_b)
+    """
+    
+    def __init__(self, save_directory="data/save_games", fsync=None,
+                 save_format=None):
+        """Start an empty group for save_directory"""
+        self.save_directory = save_directory
+        self.fsync = SAVE_FSYNC if fsync is None else fsync
+        self.save_format = SAVE_FORMAT if save_format is None else save_format
+        self.pending = {}
+
+    def add(self, character):
+        """Stage a character's save (the contents are captured now)"""
+        self.pending[character["name"]] = encode_character_save(
+            character, self.save_format)
+
+    def commit(self):
+        """
+        Write every staged save
+        
+        Returns: Number of characters saved
+        Raises: PermissionError, IOError (saves not yet renamed into place
+            are discarded)
+        """
+        if not self.pending:
+            return 0
+
+        os.makedirs(self.save_directory, exist_ok=True)
+        manifest = find_save_manifest(self.save_directory)
+        before = manifest.directory_mtime() if manifest is not None else None
+        staged = []
+        renamed = 0
+        try:
+            # Write every save, sync them all, then make them all visible
+            for name, data in self.pending.items():
+                path = get_save_path(name, self.save_directory)
+                staged.append((write_temp_file(path, data, fsync=False), path))
+            if self.fsync:
+                for temp_path, _ in staged:
+                    fsync_file(temp_path)
+
+            for temp_path, path in staged:
+                os.replace(temp_path, path)
+                renamed += 1
+        finally:
+            for temp_path, _ in staged[renamed:]:
+                remove_quietly(temp_path)
+
+        for name in self.pending:
+            discard_journal(name, self.save_directory)
+        if self.fsync:
+            fsync_directory(self.save_directory)
+        if manifest is not None:
+            manifest.record_change(before, saved=list(self.pending))
+        count = len(self.pending)
+        self.pending = {}
+        return count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.commit()
+        return False
+
+def load_character(character_name, save_directory="data/save_games",
+                   backend=None, compact=False):
     """
     Load character from save file
     
+    Text and binary saves are both accepted; binary saves are
+    recognized by their BINARY_SAVE_MAGIC header.
+    
     Args:
         character_name: Name of character to load
         save_directory: Directory containing save files
+        backend: Optional storage backend to load from instead
+        compact: Return a slotted Character instead of a dictionary
     
     Returns: Character dictionary
     Raises: 
@@ -126,20 +428,49 @@ def load_character(character_name, save_directory="data/save_games"):
         SaveFileCorruptedError if file exists but can't be read
         InvalidSaveDataError if data format is wrong
     """
-    filename = f"{character_name}_save.txt"
-    path = os.path.join(save_directory, filename)
+    if backend is not None:
+        data = backend.load(character_name)
+    else:
+        data = read_character_save(character_name, save_directory)
+    if compact:
+        return Character(data)
+    return data
+
+
+def read_character_save(character_name, save_directory="data/save_games"):
+    """
+    Read and validate a character's save file (see load_character)
+    
+    Returns: Character dictionary
+    """
+    path = get_save_path(character_name, save_directory)
 
     if not os.path.exists(path):
         raise CharacterNotFoundError(f"Save file for {character_name} not found")
 
     try:
-        with open(path, "r") as f:
-            # Skip blank lines
-            lines = [line.strip() for line in f.readlines() if line.strip()]
+        with open(path, "rb") as f:
+            raw = f.read()
     except OSError as e:
         raise SaveFileCorruptedError("Could not read save file") from e
 
+    if raw.startswith(BINARY_SAVE_MAGIC):
+        data = decode_binary_save(raw)
+        try:
+            validate_character_data(data)
+        except InvalidSaveDataError as e:
+            raise InvalidSaveDataError("Invalid data in save file") from e
+        return data
+
+    try:
+        text = raw.decode("utf-8")
+    except UnicodeDecodeError as e:
+        raise SaveFileCorruptedError("Save file is not valid text") from e
+    # Skip blank lines
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+
     data = {}
+    save_id = None
     try:
         for line in lines:
             # Accept lines like "KEY: value" or "KEY:" with no value
@@ -149,31 +480,15 @@ def load_character(character_name, save_directory="data/save_games"):
             key, value = line.split(":", 1)
             key = key.strip().upper()
             value = value.strip()
+            if key == "SAVE_ID":
+                save_id = value
+            else:
+                parse_save_field(data, key, value)
 
-            if key == "NAME":
-                data["name"] = value
-            elif key == "CLASS":
-                data["class"] = value
-            elif key == "LEVEL":
-                data["level"] = int(value)
-            elif key == "HEALTH":
-                data["health"] = int(value)
-            elif key == "MAX_HEALTH":
-                data["max_health"] = int(value)
-            elif key == "STRENGTH":
-                data["strength"] = int(value)
-            elif key == "MAGIC":
-                data["magic"] = int(value)
-            elif key == "EXPERIENCE":
-                data["experience"] = int(value)
-            elif key == "GOLD":
-                data["gold"] = int(value)
-            elif key == "INVENTORY":
-                data["inventory"] = value.split(",") if value else []
-            elif key == "ACTIVE_QUESTS":
-                data["active_quests"] = value.split(",") if value else []
-            elif key == "COMPLETED_QUESTS":
-                data["completed_quests"] = value.split(",") if value else []
+        # Changes saved in delta mode since this snapshot
+        entries = 0
+        if save_id is not None:
+            entries = replay_journal(data, character_name, save_directory, save_id)
 
         # Validate structure
         validate_character_data(data)
@@ -182,40 +497,1298 @@ def load_character(character_name, save_directory="data/save_games"):
         # Bad integer or missing fields → invalid save
         raise InvalidSaveDataError("Invalid data in save file") from e
 
+    if save_id is not None:
+        remember_saved_state(path, data, save_id, entries)
     return data
 
-def list_saved_characters(save_directory="data/save_games"):
+
+def parse_save_field(data, key, value):
+    """
+    Store one save file field in a character dictionary
+    
+    Unknown keys are ignored.
+    Raises: ValueError if a numeric field is not an integer
+    """
+    if key == "NAME":
+        data["name"] = value
+    elif key == "CLASS":
+        data["class"] = value
+    elif key == "LEVEL":
+        data["level"] = int(value)
+    elif key == "HEALTH":
+        data["health"] = int(value)
+    elif key == "MAX_HEALTH":
+        data["max_health"] = int(value)
+    elif key == "STRENGTH":
+        data["strength"] = int(value)
+    elif key == "MAGIC":
+        data["magic"] = int(value)
+    elif key == "EXPERIENCE":
+        data["experience"] = int(value)
+    elif key == "GOLD":
+        data["gold"] = int(value)
+    elif key == "INVENTORY":
+        data["inventory"] = value.split(",") if value else []
+    elif key == "ACTIVE_QUESTS":
+        data["active_quests"] = value.split(",") if value else []
+    elif key == "COMPLETED_QUESTS":
+        data["completed_quests"] = value.split(",") if value else []
+
+def list_saved_characters(save_directory="data/save_games", backend=None,
+                          prefix=None, sort_by="name", offset=0, limit=None):
     """
     Get list of all saved character names
     
+    Names come from the save directory's manifest (see SaveManifest)
+    rather than a directory scan.
+    
+    Args:
+        save_directory: Directory containing save files
+        backend: Optional storage backend to list instead
+        prefix: Only include names starting with this string
+        sort_by: "name" (alphabetical) or "modified" (most recent first)
+        offset, limit: Return only one page of the results
+    
     Returns: List of character names (without _save.txt extension)
     """
-    if not os.path.isdir(save_directory):
-        return []
+    if backend is not None:
+        return backend.list_names(prefix, sort_by, offset, limit)
+    return get_save_manifest(save_directory).names(prefix, sort_by, offset, limit)
 
-    names = []
-    for filename in os.listdir(save_directory):
-        if filename.endswith("_save.txt"):
-            names.append(filename[:-9])  # remove "_save.txt"
-    return names
+
+def character_exists(character_name, save_directory="data/save_games"):
+    """
+    Check whether a character has a save file, using the save manifest
+    
+    Returns: True if saved, False otherwise
+    """
+    return get_save_manifest(save_directory).contains(character_name)
 
 
-def delete_character(character_name, save_directory="data/save_games"):
+def delete_character(character_name, save_directory="data/save_games",
+                     backend=None):
     """
     Delete a character's save file
     
     Returns: True if deleted successfully
     Raises: CharacterNotFoundError if character doesn't exist
     """
-    filename = f"{character_name}_save.txt"
-    path = os.path.join(save_directory, filename)
+    if backend is not None:
+        return backend.delete(character_name)
+    path = get_save_path(character_name, save_directory)
 
     if not os.path.exists(path):
         raise CharacterNotFoundError(f"Save file for {character_name} not found")
 
+    manifest = find_save_manifest(save_directory)
+    before = manifest.directory_mtime() if manifest is not None else None
     os.remove(path)
+    discard_journal(character_name, save_directory)
+    if manifest is not None:
+        manifest.record_change(before, deleted=[character_name])
     return True
 
+# ============================================================================
+# SAVE FILE HELPERS
+# ============================================================================
+
+def get_save_path(character_name, save_directory="data/save_games"):
+    """Return the path of a character's save file"""
+    return os.path.join(save_directory, f"{character_name}{SAVE_SUFFIX}")
+
+
+def write_temp_file(path, data, fsync=True):
+    """
+    Write data to a new temporary file next to path
+    
+    Args:
+        path: File the temporary file will later replace
+        data: Complete file contents (str or bytes)
+        fsync: Force the contents to disk before returning
+    
+    Returns: Path of the temporary file
+    """
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    mode = "wb" if isinstance(data, bytes) else "w"
+    try:
+        with open(temp_path, mode) as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+    except BaseException:
+        remove_quietly(temp_path)
+        raise
+    return temp_path
+
+
+def write_save_file(path, data, fsync=True):
+    """
+    Atomically replace the file at path with data
+    
+    Args:
+        path: Destination file
+        data: Complete file contents
+        fsync: Force the contents to disk before the rename
+    """
+    temp_path = write_temp_file(path, data, fsync)
+    try:
+        os.replace(temp_path, path)
+    except BaseException:
+        remove_quietly(temp_path)
+        raise
+
+
+def fsync_file(path):
+    """Force a file already written (and closed) to disk"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def fsync_directory(directory):
+    """Force a directory's entries (e.g. a rename) to disk, where supported"""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def remove_quietly(path):
+    """Delete a file, ignoring errors"""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+# ============================================================================
+# BINARY SAVE FORMAT
+# ============================================================================
+
+# Layout (all integers are LEB128 varints, signed ones zigzag-encoded):
+#   header:  BINARY_SAVE_MAGIC, version byte, flags byte
+#   body:    string table  - count, then (length, UTF-8 bytes) per string
+#            fields        - (tag, payload length, payload) per field
+# Item and quest IDs are stored once in the string table and referenced
+# by index. With BINARY_FLAG_ZLIB set the body is zlib-compressed.
+# Readers skip fields with unknown tags.
+BINARY_SAVE_MAGIC = b"\x89QCS"
+BINARY_SAVE_VERSION = 1
+BINARY_FLAG_ZLIB = 0x01
+
+# (tag, character key, kind): "str", "int" or "ids" (string table indexes)
+BINARY_SAVE_FIELDS = (
+    (1, "name", "str"),
+    (2, "class", "str"),
+    (3, "level", "int"),
+    (4, "health", "int"),
+    (5, "max_health", "int"),
+    (6, "strength", "int"),
+    (7, "magic", "int"),
+    (8, "experience", "int"),
+    (9, "gold", "int"),
+    (10, "inventory", "ids"),
+    (11, "active_quests", "ids"),
+    (12, "completed_quests", "ids"),
+)
+_BINARY_FIELDS_BY_TAG = {tag: (key, kind) for tag, key, kind in BINARY_SAVE_FIELDS}
+
+
+def write_varint(buffer, value):
+    """Append an unsigned integer to a bytearray as a varint"""
+    if value < 0x80:
+        buffer.append(value)
+        return
+    while value > 0x7F:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def read_varint(data, pos):
+    """
+    Read a varint from data at pos
+    
+    Returns: (value, position after the varint)
+    Raises: IndexError if data ends inside the varint
+    """
+    byte = data[pos]
+    if byte < 0x80:
+        return byte, pos + 1
+    result = byte & 0x7F
+    shift = 7
+    pos += 1
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def encode_binary_save(character, compress=False):
+    """
+    Encode a character as a binary save
+    
+    Args:
+        character: Character dictionary
+        compress: zlib-compress the body
+    
+    Returns: Save file contents as bytes
+    """
+    strings = {}
+    fields = bytearray()
+    payload = bytearray()
+    for tag, key, kind in BINARY_SAVE_FIELDS:
+        value = character.get(key, []) if kind == "ids" else character[key]
+        payload.clear()
+        if kind == "int":
+            write_varint(payload, (value << 1) if value >= 0 else ((-value << 1) - 1))
+        elif kind == "str":
+            payload += value.encode("utf-8")
+        else:
+            write_varint(payload, len(value))
+            for string in value:
+                index = strings.get(string)
+                if index is None:
+                    index = strings[string] = len(strings)
+                write_varint(payload, index)
+        write_varint(fields, tag)
+        write_varint(fields, len(payload))
+        fields += payload
+
+    body = bytearray()
+    write_varint(body, len(strings))
+    for string in strings:
+        encoded = string.encode("utf-8")
+        write_varint(body, len(encoded))
+        body += encoded
+    body += fields
+
+    flags = 0
+    if compress:
+        body = zlib.compress(bytes(body))
+        flags |= BINARY_FLAG_ZLIB
+    return BINARY_SAVE_MAGIC + bytes((BINARY_SAVE_VERSION, flags)) + bytes(body)
+
+
+def decode_binary_save(data):
+    """
+    Decode a binary save
+    
+    Returns: Character dictionary (not yet validated)
+    Raises: InvalidSaveDataError if the data is malformed or its version
+            is newer than BINARY_SAVE_VERSION
+    """
+    header = len(BINARY_SAVE_MAGIC)
+    if len(data) < header + 2 or not data.startswith(BINARY_SAVE_MAGIC):
+        raise InvalidSaveDataError("Not a binary save file")
+    version = data[header]
+    flags = data[header + 1]
+    if version > BINARY_SAVE_VERSION:
+        raise InvalidSaveDataError(f"Unsupported binary save version {version}")
+
+    try:
+        body = data[header + 2:]
+        if flags & BINARY_FLAG_ZLIB:
+            body = zlib.decompress(body)
+
+        count, pos = read_varint(body, 0)
+        strings = []
+        for _ in range(count):
+            length, pos = read_varint(body, pos)
+            end = pos + length
+            if end > len(body):
+                raise ValueError("String table runs past the end of the save")
+            strings.append(body[pos:end].decode("utf-8"))
+            pos = end
+
+        character = {}
+        while pos < len(body):
+            tag, pos = read_varint(body, pos)
+            length, pos = read_varint(body, pos)
+            end = pos + length
+            if end > len(body):
+                raise ValueError("Field runs past the end of the save")
+            field = _BINARY_FIELDS_BY_TAG.get(tag)
+            if field is not None:
+                key, kind = field
+                if kind == "int":
+                    value, _ = read_varint(body, pos)
+                    character[key] = (value >> 1) ^ -(value & 1)
+                elif kind == "str":
+                    character[key] = body[pos:end].decode("utf-8")
+                else:
+                    ids, item_pos = read_varint(body, pos)
+                    values = []
+                    for _ in range(ids):
+                        index, item_pos = read_varint(body, item_pos)
+                        values.append(strings[index])
+                    character[key] = values
+            pos = end
+    except (IndexError, ValueError, zlib.error) as e:
+        # UnicodeDecodeError is a ValueError
+        raise InvalidSaveDataError("Corrupted binary save data") from e
+    return character
+
+# ============================================================================
+# DELTA SAVES
+# ============================================================================
+
+# Last persisted state of characters saved or loaded in delta mode:
+# {save_path: {"fields": {KEY: value}, "save_id": str, "entries": int}}
+_saved_states = {}
+_saved_states_lock = threading.Lock()
+# One lock per save path: delta saves of different characters write in
+# parallel, saves of the same character one at a time
+_save_path_locks = {}
+
+
+def get_save_path_lock(path):
+    """Return the lock that serializes delta-save file I/O for one path"""
+    with _saved_states_lock:
+        lock = _save_path_locks.get(path)
+        if lock is None:
+            lock = _save_path_locks[path] = threading.Lock()
+        return lock
+
+
+def get_journal_path(character_name, save_directory="data/save_games"):
+    """Return the path of a character's delta-save journal"""
+    return os.path.join(save_directory, f"{character_name}{JOURNAL_SUFFIX}")
+
+
+def remember_saved_state(path, character, save_id, entries):
+    """Record what is on disk for a character saved in delta mode"""
+    with _saved_states_lock:
+        _saved_states[path] = {
+            "fields": dict(character_save_fields(character)),
+            "save_id": save_id,
+            "entries": entries,
+        }
+
+
+def discard_journal(character_name, save_directory="data/save_games"):
+    """Delete a character's journal and forget its delta-save state"""
+    with _saved_states_lock:
+        _saved_states.pop(get_save_path(character_name, save_directory), None)
+    remove_quietly(get_journal_path(character_name, save_directory))
+
+
+def write_delta_save(character, save_directory, fsync):
+    """
+    Save a character in delta mode
+    
+    Appends the fields that differ from the last persisted state to the
+    journal as one entry. A full save (with a new SAVE_ID) is written
+    instead when there is no known persisted state or the journal has
+    reached JOURNAL_COMPACT_ENTRIES entries.
+    
+    Returns: True if a file was created or replaced (directory changed)
+    """
+    name = character["name"]
+    path = get_save_path(name, save_directory)
+    journal_path = get_journal_path(name, save_directory)
+    fields = character_save_fields(character)
+
+    with get_save_path_lock(path):
+        with _saved_states_lock:
+            state = _saved_states.get(path)
+        if state is not None and state["entries"] < JOURNAL_COMPACT_ENTRIES:
+            known = state["fields"]
+            changed = [(key, value) for key, value in fields if known.get(key) != value]
+            if not changed:
+                return False
+
+            entry = [f"ENTRY: {state['save_id']}\n"]
+            entry.extend(f"{key}: {value}\n" for key, value in changed)
+            entry.append("END\n")
+            created = not trim_torn_journal(journal_path)
+            with open(journal_path, "a") as f:
+                f.write("".join(entry))
+                if fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            with _saved_states_lock:
+                known.update(changed)
+                state["entries"] += 1
+            return created
+
+        # Compact: write a new snapshot; older journal entries no longer match
+        save_id = os.urandom(8).hex()
+        write_save_file(path, format_character_save(character, save_id), fsync)
+        remove_quietly(journal_path)
+        with _saved_states_lock:
+            _saved_states[path] = {"fields": dict(fields), "save_id": save_id,
+                                   "entries": 0}
+        return True
+
+
+def trim_torn_journal(journal_path):
+    """
+    Cut a torn last entry (one not ending in END) off a journal
+    
+    Without this, the next append would be glued onto the torn line and
+    replay would merge the torn entry into the new one.
+    
+    Returns: True if the journal exists
+    """
+    try:
+        with open(journal_path, "rb+") as f:
+            size = f.seek(0, os.SEEK_END)
+            if size == 0:
+                return True
+            f.seek(max(0, size - 5))
+            if f.read() == b"\nEND\n":
+                return True
+            f.seek(0)
+            end = f.read().rfind(b"\nEND\n")
+            f.truncate(end + 5 if end >= 0 else 0)
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def replay_journal(data, character_name, save_directory, save_id):
+    """
+    Apply a character's journal entries on top of loaded save data
+    
+    Only complete entries (terminated by END) written for save_id are
+    applied; a partly written last entry is ignored.
+    
+    Returns: Number of entries applied
+    Raises: SaveFileCorruptedError if the journal can't be read,
+            ValueError if it holds a bad integer
+    """
+    journal_path = get_journal_path(character_name, save_directory)
+    try:
+        with open(journal_path, "r") as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return 0
+    except OSError as e:
+        raise SaveFileCorruptedError("Could not read save journal") from e
+
+    entries = 0
+    pending = None
+    for line in lines:
+        if line.startswith("ENTRY:"):
+            entry_id = line.split(":", 1)[1].strip()
+            pending = [] if entry_id == save_id else None
+        elif line == "END":
+            if pending is not None:
+                for key, value in pending:
+                    parse_save_field(data, key, value)
+                entries += 1
+            pending = None
+        elif pending is not None and ":" in line:
+            key, value = line.split(":", 1)
+            pending.append((key.strip().upper(), value.strip()))
+    return entries
+
+# ============================================================================
+# SAVE MANIFEST
+# ============================================================================
+
+class SaveManifest:
+    """
+    Index of the characters saved in a save directory
+    
+    Holds every saved name (kept sorted, for prefix search and paging)
+    with its last-modified time. save_character, delete_character and
+    GroupCommit update it in place. It is checked against the
+    directory's modification time before each query and rebuilt with a
+    scan if anything else changed the directory.
+    
+    A copy is stored in {save_directory}.manifest so a new process can
+    start without scanning; it is written whenever the manifest is
+    rebuilt and by flush().
+    """
+    
+    def __init__(self, save_directory):
+        """Load the stored manifest, or scan the directory if it is stale"""
+        self.save_directory = save_directory
+        self.manifest_path = os.path.normpath(save_directory) + MANIFEST_SUFFIX
+        self._lock = threading.RLock()
+        self._modified = {}
+        self._names = []
+        self._by_modified = None
+        self._dir_mtime = None
+        self._dirty = False
+        if not self._load_file():
+            self.rebuild()
+
+    def directory_mtime(self):
+        """Return the save directory's mtime in ns, or None if missing"""
+        try:
+            return os.stat(self.save_directory).st_mtime_ns
+        except OSError:
+            return None
+
+    def _set_entries(self, modified, dir_mtime):
+        """Replace all entries"""
+        self._modified = modified
+        self._names = sorted(modified)
+        self._by_modified = None
+        self._dir_mtime = dir_mtime
+
+    def _load_file(self):
+        """Load the stored manifest; returns False if missing or stale"""
+        current = self.directory_mtime()
+        try:
+            with open(self.manifest_path, "r") as f:
+                lines = f.read().splitlines()
+        except OSError:
+            return False
+
+        try:
+            tag, version, dir_mtime = lines[0].split(" ")
+            if (tag != "SAVE_MANIFEST" or int(version) != MANIFEST_VERSION
+                    or int(dir_mtime) != current):
+                return False
+            modified = {}
+            for line in lines[1:]:
+                name, mtime = line.rsplit("\t", 1)
+                modified[name] = int(mtime)
+        except (IndexError, ValueError):
+            return False
+
+        self._set_entries(modified, current)
+        return True
+
+    def rebuild(self):
+        """Rescan the save directory and store the result"""
+        with self._lock:
+            # Taken before scanning: a change during the scan shows up as
+            # a mismatch on the next query
+            dir_mtime = self.directory_mtime()
+            modified = {}
+            if dir_mtime is not None:
+                with os.scandir(self.save_directory) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(SAVE_SUFFIX) and entry.is_file():
+                            name = entry.name[:-len(SAVE_SUFFIX)]
+                            modified[name] = entry.stat().st_mtime_ns
+            self._set_entries(modified, dir_mtime)
+            self._dirty = True
+            self.flush()
+
+    def flush(self):
+        """
+        Store the manifest next to the save directory if it changed
+        
+        Returns: True if written, False if unchanged or not writable
+        """
+        with self._lock:
+            if not self._dirty or self._dir_mtime is None:
+                return False
+            lines = [f"SAVE_MANIFEST {MANIFEST_VERSION} {self._dir_mtime}"]
+            for name in self._names:
+                lines.append(f"{name}\t{self._modified[name]}")
+            try:
+                write_save_file(self.manifest_path, "\n".join(lines) + "\n",
+                                fsync=False)
+            except OSError:
+                return False
+            self._dirty = False
+            return True
+
+    def _ensure_current(self):
+        """Rebuild if the directory changed behind the manifest's back"""
+        if self.directory_mtime() != self._dir_mtime:
+            self.rebuild()
+
+    def record_change(self, dir_mtime_before, saved=(), deleted=()):
+        """
+        Apply this process's own saves/deletes to the manifest
+        
+        Args:
+            dir_mtime_before: directory_mtime() taken just before the change;
+                if it doesn't match, another writer got there first (e.g. an
+                overlapping save batch) and the manifest is marked stale so
+                the next query rebuilds it
+            saved: Names whose save files were written
+            deleted: Names whose save files were removed
+        """
+        with self._lock:
+            if dir_mtime_before != self._dir_mtime:
+                self._dir_mtime = None
+                return
+            for name in saved:
+                try:
+                    mtime = os.stat(get_save_path(name, self.save_directory)).st_mtime_ns
+                except OSError:
+                    continue
+                if name not in self._modified:
+                    bisect.insort(self._names, name)
+                self._modified[name] = mtime
+            for name in deleted:
+                if self._modified.pop(name, None) is not None:
+                    index = bisect.bisect_left(self._names, name)
+                    del self._names[index]
+            self._by_modified = None
+            self._dir_mtime = self.directory_mtime()
+            self._dirty = True
+
+    def contains(self, character_name):
+        """Return True if the character has a save file"""
+        with self._lock:
+            self._ensure_current()
+            return character_name in self._modified
+
+    def __len__(self):
+        with self._lock:
+            self._ensure_current()
+            return len(self._modified)
+
+    def names(self, prefix=None, sort_by="name", offset=0, limit=None):
+        """
+        Return saved names, optionally filtered by prefix and paged
+        
+        Args:
+            prefix: Only include names starting with this string
+            sort_by: "name" or "modified" (most recently saved first)
+            offset, limit: Slice of the result to return
+        """
+        if sort_by not in ("name", "modified"):
+            raise ValueError(f"Unknown sort order: {sort_by}")
+        end = None if limit is None else offset + limit
+
+        with self._lock:
+            self._ensure_current()
+            if sort_by == "name":
+                names = self._names
+                if prefix:
+                    low = bisect.bisect_left(names, prefix)
+                    high = bisect.bisect_left(names, prefix + "\U0010ffff")
+                    names = names[low:high]
+                return names[offset:end]
+
+            if self._by_modified is None:
+                self._by_modified = sorted(self._modified,
+                                           key=self._modified.__getitem__,
+                                           reverse=True)
+            names = self._by_modified
+            if prefix:
+                names = [name for name in names if name.startswith(prefix)]
+            return names[offset:end]
+
+
+_save_manifests = {}
+_save_manifests_lock = threading.Lock()
+
+
+def find_save_manifest(save_directory):
+    """Return the manifest already open for a directory, or None"""
+    return _save_manifests.get(os.path.abspath(save_directory))
+
+
+def get_save_manifest(save_directory="data/save_games"):
+    """Return the manifest for a save directory, opening it if needed"""
+    key = os.path.abspath(save_directory)
+    with _save_manifests_lock:
+        manifest = _save_manifests.get(key)
+        if manifest is None:
+            manifest = SaveManifest(save_directory)
+            _save_manifests[key] = manifest
+        return manifest
+
+# ============================================================================
+# STORAGE BACKENDS
+# ============================================================================
+
+class TextSaveBackend:
+    """
+    Storage backend using one {name}_save.txt file per character
+    
+    This is the format save_character/load_character use by default.
+    """
+    
+    def __init__(self, save_directory="data/save_games", fsync=None):
+        self.save_directory = save_directory
+        self.fsync = fsync
+
+    def save(self, character):
+        """Save one character; returns True"""
+        return save_character(character, self.save_directory, self.fsync)
+
+    def save_many(self, characters):
+        """Save several characters in one group commit; returns the count"""
+        group = GroupCommit(self.save_directory, self.fsync)
+        for character in characters:
+            group.add(character)
+        return group.commit()
+
+    def load(self, character_name):
+        """Load one character (see load_character for exceptions)"""
+        return load_character(character_name, self.save_directory)
+
+    def load_many(self, names):
+        """
+        Load several characters
+        
+        Returns: Dictionary {name: character}; names without a save are
+                 left out
+        """
+        characters = {}
+        for name in names:
+            try:
+                characters[name] = load_character(name, self.save_directory)
+            except CharacterNotFoundError:
+                pass
+        return characters
+
+    def list_names(self, prefix=None, sort_by="name", offset=0, limit=None):
+        """Return saved names (arguments as for list_saved_characters)"""
+        return list_saved_characters(self.save_directory, prefix=prefix,
+                                     sort_by=sort_by, offset=offset, limit=limit)
+
+    def delete(self, character_name):
+        """Delete one character; raises CharacterNotFoundError if missing"""
+        return delete_character(character_name, self.save_directory)
+
+    def close(self):
+        """Nothing to release for text files"""
+        pass
+
+
+class SQLiteSaveBackend:
+    """
+    Storage backend keeping every character in one SQLite database
+    
+    Characters are rows indexed by name, so lookups, bulk loads and
+    multi-character transactional saves don't touch the filesystem per
+    character. Safe to share between threads.
+    """
+    
+    COLUMNS = (
+        "name", "class", "level", "health", "max_health", "strength",
+        "magic", "experience", "gold", "inventory", "active_quests",
+        "completed_quests"
+    )
+    LIST_COLUMNS = ("inventory", "active_quests", "completed_quests")
+    # Stay below SQLite's limit on parameters per statement
+    BATCH_SIZE = 500
+
+    def __init__(self, path="data/save_games.db"):
+        """
+        Open (and create if needed) the database at path
+        
+        Raises: SaveFileCorruptedError if the database can't be opened
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        try:
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            with self._conn:
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS characters ("
+                    "name TEXT PRIMARY KEY, class TEXT NOT NULL, "
+                    "level INTEGER, health INTEGER, max_health INTEGER, "
+                    "strength INTEGER, magic INTEGER, experience INTEGER, "
+                    "gold INTEGER, inventory TEXT, active_quests TEXT, "
+                    "completed_quests TEXT)"
+                )
+        except sqlite3.DatabaseError as e:
+            raise SaveFileCorruptedError(f"Could not open save database {path}") from e
+
+    def _to_row(self, character):
+        """Convert a character to a tuple in COLUMNS order"""
+        row = []
+        for column in self.COLUMNS:
+            value = character[column]
+            if column in self.LIST_COLUMNS:
+                value = ",".join(value)
+            row.append(value)
+        return tuple(row)
+
+    def _from_row(self, row):
+        """Convert a database row back to a validated character dict"""
+        character = dict(zip(self.COLUMNS, row))
+        for column in self.LIST_COLUMNS:
+            value = character[column]
+            character[column] = value.split(",") if value else []
+        try:
+            validate_character_data(character)
+        except InvalidSaveDataError as e:
+            raise InvalidSaveDataError("Invalid data in save database") from e
+        return character
+
+    def _write(self, characters):
+        """Insert or replace characters in one transaction"""
+        rows = [self._to_row(character) for character in characters]
+        placeholders = ", ".join("?" * len(self.COLUMNS))
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO characters VALUES ({placeholders})", rows)
+        return len(rows)
+
+    def save(self, character):
+        """Save one character; returns True"""
+        self._write([character])
+        return True
+
+    def save_many(self, characters):
+        """
+        Save several characters in one transaction (all or nothing)
+        
+        Returns: Number of characters saved
+        """
+        return self._write(characters)
+
+    def _select(self, where, params):
+        """Run a SELECT of all columns and return the rows"""
+        try:
+            with self._lock:
+                return self._conn.execute(
+                    f"SELECT {', '.join(self.COLUMNS)} FROM characters {where}",
+                    params).fetchall()
+        except sqlite3.DatabaseError as e:
+            raise SaveFileCorruptedError("Could not read save database") from e
+
+    def load(self, character_name):
+        """
+        Load one character
+        
+        Raises: CharacterNotFoundError, SaveFileCorruptedError,
+                InvalidSaveDataError
+        """
+        rows = self._select("WHERE name = ?", (character_name,))
+        if not rows:
+            raise CharacterNotFoundError(f"Save for {character_name} not found")
+        return self._from_row(rows[0])
+
+    def load_many(self, names):
+        """
+        Load several characters with as few queries as possible
+        
+        Returns: Dictionary {name: character}; names without a save are
+                 left out
+        """
+        names = list(names)
+        characters = {}
+        for start in range(0, len(names), self.BATCH_SIZE):
+            batch = names[start:start + self.BATCH_SIZE]
+            marks = ", ".join("?" * len(batch))
+            for row in self._select(f"WHERE name IN ({marks})", batch):
+                character = self._from_row(row)
+                characters[character["name"]] = character
+        return characters
+
+    def list_names(self, prefix=None, sort_by="name", offset=0, limit=None):
+        """
+        Return saved names (arguments as for list_saved_characters)
+        
+        INSERT OR REPLACE gives a saved row the next rowid, so "modified"
+        order is rowid order, newest first.
+        """
+        if sort_by not in ("name", "modified"):
+            raise ValueError(f"Unknown sort order: {sort_by}")
+        where, params = "", []
+        if prefix:
+            where = "WHERE name >= ? AND name < ?"
+            params = [prefix, prefix + "\U0010ffff"]
+        order = "name" if sort_by == "name" else "rowid DESC"
+        params += [-1 if limit is None else limit, offset]
+        try:
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT name FROM characters {where} ORDER BY {order} "
+                    "LIMIT ? OFFSET ?", params).fetchall()
+        except sqlite3.DatabaseError as e:
+            raise SaveFileCorruptedError("Could not read save database") from e
+        return [row[0] for row in rows]
+
+    def delete(self, character_name):
+        """Delete one character; raises CharacterNotFoundError if missing"""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM characters WHERE name = ?", (character_name,))
+        if cursor.rowcount == 0:
+            raise CharacterNotFoundError(f"Save for {character_name} not found")
+        return True
+
+    def close(self):
+        """Close the database connection"""
+        self._conn.close()
+
+# ============================================================================
+# BULK LOAD / SAVE
+# ============================================================================
+
+# Per-character failures reported by the bulk functions instead of raised
+BULK_ERRORS = (GameError, OSError)
+
+
+def load_characters(names, save_directory="data/save_games", workers=None,
+                    backend=None):
+    """
+    Load many characters on a thread pool
+    
+    Results are yielded as each load finishes (not in input order). A
+    character that can't be loaded is reported and the batch continues.
+    
+    Args:
+        names: Character names to load
+        save_directory: Directory containing save files
+        workers: Thread count (default: ThreadPoolExecutor's default)
+        backend: Optional storage backend to load from instead
+    
+    Yields: (name, character, None) on success, or (name, None, error)
+            where error is e.g. CharacterNotFoundError or
+            InvalidSaveDataError
+    """
+    def load_one(name):
+        return load_character(name, save_directory, backend)
+
+    yield from run_character_batch(load_one, [(name, name) for name in names],
+                                   workers)
+
+
+def save_characters(characters, save_directory="data/save_games", workers=None,
+                    fsync=None, backend=None, delta=None, save_format=None):
+    """
+    Save many characters on a thread pool
+    
+    Every save is started before this returns and runs to completion
+    whether or not the results are read; the returned iterator only
+    reports them. Each save is atomic as in save_character. The save
+    directory is synced and the manifest updated once, after the last
+    save and before its result is reported.
+    
+    Args:
+        characters: Character dictionaries to save
+        workers: Thread count (default: ThreadPoolExecutor's default)
+        Other arguments: as for save_character
+    
+    Returns: Iterator of (name, True, None) on success, or
+             (name, None, error), in completion order
+    """
+    jobs = [(character["name"], character) for character in characters]
+    if backend is not None:
+        return submit_character_batch(backend.save, jobs, workers)
+    if fsync is None:
+        fsync = SAVE_FSYNC
+    if delta is None:
+        delta = DELTA_SAVES
+    if save_format is None:
+        save_format = SAVE_FORMAT
+    if save_format not in SAVE_FORMATS:
+        raise ValueError(f"Unknown save format: {save_format}")
+
+    os.makedirs(save_directory, exist_ok=True)
+    manifest = find_save_manifest(save_directory)
+    before = manifest.directory_mtime() if manifest is not None else None
+
+    def save_one(character):
+        write_character_files(character, save_directory, fsync, delta, save_format)
+        return True
+
+    def finish(saved):
+        if saved:
+            if fsync:
+                fsync_directory(save_directory)
+            if manifest is not None:
+                manifest.record_change(before, saved=saved)
+
+    return submit_character_batch(save_one, jobs, workers, finish)
+
+
+def submit_character_batch(func, jobs, workers=None, finish=None):
+    """
+    Start func(arg) for each (name, arg) job on a thread pool
+    
+    All jobs are submitted at once and none is ever cancelled, so they
+    all run even if the results are never read.
+    
+    Args:
+        func: Function run for each job
+        jobs: Iterable of (name, arg) pairs
+        workers: Thread count
+        finish: Optional function called with the names of the jobs that
+                succeeded, once all jobs are done (before the last
+                job's result is reported)
+    
+    Returns: Iterator of (name, result, error) in completion order;
+             BULK_ERRORS are reported as error, anything else propagates
+    """
+    jobs = list(jobs)
+    lock = threading.Lock()
+    state = {"remaining": len(jobs), "succeeded": []}
+
+    def run(name, arg):
+        succeeded = False
+        try:
+            result = func(arg)
+            succeeded = True
+            return result
+        finally:
+            with lock:
+                if succeeded:
+                    state["succeeded"].append(name)
+                state["remaining"] -= 1
+                last = state["remaining"] == 0
+            if last and finish is not None:
+                finish(state["succeeded"])
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    futures = {executor.submit(run, name, arg): name for name, arg in jobs}
+    # Submitted jobs still run; the threads exit once they are done
+    executor.shutdown(wait=False)
+    return iter_batch_results(futures)
+
+
+def iter_batch_results(futures):
+    """Yield (name, result, error) for {future: name} as each finishes"""
+    for future in as_completed(futures):
+        try:
+            result = (futures[future], future.result(), None)
+        except BULK_ERRORS as e:
+            result = (futures[future], None, e)
+        yield result
+
+
+def run_character_batch(func, jobs, workers=None):
+    """
+    Run func(arg) for each (name, arg) job on a thread pool
+    
+    Used for reads: jobs not yet started are cancelled if the caller
+    stops reading the results.
+    
+    Yields: (name, result, error) as each job finishes; BULK_ERRORS are
+            reported as error, anything else propagates
+    """
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        futures = {executor.submit(func, arg): name for name, arg in jobs}
+        yield from iter_batch_results(futures)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+# ============================================================================
+# WRITE-BEHIND SAVE QUEUE
+# ============================================================================
+
+def snapshot_character(character):
+    """
+    Copy a character so later changes don't affect a queued save
+    
+    Returns: Shallow copy of the character with its lists, dictionaries
+             (e.g. stat_modifiers) and stacked inventory copied
+    """
+    from inventory_system import StackedInventory  # deferred: avoids an import cycle
+
+    snapshot = {}
+    for key, value in character.items():
+        if isinstance(value, list):
+            value = list(value)
+        elif isinstance(value, dict):
+            value = dict(value)
+        elif isinstance(value, StackedInventory):
+            value = value.copy()
+        snapshot[key] = value
+    return snapshot
+
+
+class SaveQueue:
+    """
+    Write-behind layer over save_character
+    
+    enqueue() copies the character and returns immediately. A background
+    worker writes pending saves every flush_interval seconds, or as soon
+    as max_pending characters are waiting. Saves for the same character
+    that are still pending are coalesced, so only the latest is written.
+    
+    Call flush() to write everything queued so far and close() on
+    shutdown to drain the queue and stop the worker. A queue that is
+    never closed is drained at interpreter exit. After a failed batch
+    the worker waits flush_interval before retrying, however full the
+    queue is.
+    """
+    
+    def __init__(self, save_directory="data/save_games", flush_interval=1.0,
+                 max_pending=100, backend=None, delta=None, fsync=None):
+        """
+        Start the background writer
+        
+        Args:
+            save_directory: Where the text backend writes saves
+            flush_interval: Seconds between background flushes
+            max_pending: Queue size that triggers an early flush
+            backend: Optional storage backend (batches use save_many)
+            delta: Use delta saves (text backend only)
+            fsync: fsync policy for text saves (default: SAVE_FSYNC)
+        """
+        self.save_directory = save_directory
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.backend = backend
+        self.delta = DELTA_SAVES if delta is None else delta
+        self.fsync = fsync
+        self._pending = {}
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._closing = False
+        self._stats = {
+            "enqueued": 0, "coalesced": 0, "written": 0, "failed_batches": 0,
+            "batches": 0, "total_write_time": 0.0, "max_write_time": 0.0,
+            "last_write_time": 0.0, "last_error": None,
+        }
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+        atexit.register(self.close)
+
+    def enqueue(self, character):
+        """
+        Queue a save of the character's current state
+        
+        Raises: RuntimeError if the queue has been closed
+        """
+        snapshot = snapshot_character(character)
+        with self._cond:
+            if self._closing:
+                raise RuntimeError("Save queue is closed")
+            name = snapshot["name"]
+            if name in self._pending:
+                self._stats["coalesced"] += 1
+            self._pending[name] = snapshot
+            self._stats["enqueued"] += 1
+            if len(self._pending) >= self.max_pending:
+                self._cond.notify()
+
+    def flush(self):
+        """
+        Write every save queued so far, in the calling thread
+        
+        Returns: Number of characters written
+        Raises: Whatever the save raised (failed saves stay queued)
+        """
+        return self._write_pending()
+
+    def close(self):
+        """
+        Drain the queue, stop the worker and store the save manifest
+        
+        Safe to call more than once; later calls retry any saves that
+        are still queued.
+        """
+        atexit.unregister(self.close)
+        with self._cond:
+            self._closing = True
+            self._cond.notify()
+        self._worker.join()
+        self._write_pending()
+        manifest = find_save_manifest(self.save_directory)
+        if manifest is not None:
+            manifest.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    @property
+    def depth(self):
+        """Number of characters waiting to be written"""
+        with self._cond:
+            return len(self._pending)
+
+    def metrics(self):
+        """
+        Get queue statistics
+        
+        Returns: Dictionary with queue_depth, enqueued, coalesced, written,
+                 batches, failed_batches, avg/max/last_write_time (seconds
+                 per batch) and last_error
+        """
+        with self._cond:
+            stats = dict(self._stats)
+            stats["queue_depth"] = len(self._pending)
+        total = stats.pop("total_write_time")
+        ok_batches = stats["batches"] - stats["failed_batches"]
+        stats["avg_write_time"] = total / ok_batches if ok_batches else 0.0
+        return stats
+
+    def _run(self):
+        """Background worker: flush on the timer or when the queue fills"""
+        failed = False
+        while True:
+            with self._cond:
+                if failed:
+                    # Back off even when the queue is full; only close() cuts it short
+                    self._cond.wait_for(lambda: self._closing, self.flush_interval)
+                elif not self._closing and len(self._pending) < self.max_pending:
+                    self._cond.wait(self.flush_interval)
+                closing = self._closing
+            try:
+                self._write_pending()
+                failed = False
+            except Exception:
+                # Recorded in metrics; the saves stay queued for a retry
+                failed = True
+            if closing:
+                return
+
+    def _write_pending(self):
+        """Take the pending saves and write them as one batch"""
+        with self._write_lock:
+            with self._cond:
+                batch = self._pending
+                self._pending = {}
+            if not batch:
+                return 0
+
+            start = time.perf_counter()
+            try:
+                self._write_batch(list(batch.values()))
+            except Exception as e:
+                with self._cond:
+                    # Newer snapshots queued meanwhile take precedence
+                    for name, snapshot in batch.items():
+                        self._pending.setdefault(name, snapshot)
+                    self._stats["batches"] += 1
+                    self._stats["failed_batches"] += 1
+                    self._stats["last_error"] = e
+                raise
+            elapsed = time.perf_counter() - start
+
+            with self._cond:
+                stats = self._stats
+                stats["batches"] += 1
+                stats["written"] += len(batch)
+                stats["total_write_time"] += elapsed
+                stats["last_write_time"] = elapsed
+                stats["max_write_time"] = max(stats["max_write_time"], elapsed)
+            return len(batch)
+
+    def _write_batch(self, characters):
+        """Write a batch through the configured backend or save mode"""
+        if self.backend is not None:
+            self.backend.save_many(characters)
+        elif self.delta:
+            for character in characters:
+                save_character(character, self.save_directory, self.fsync,
+                               delta=True)
+        else:
+            group = GroupCommit(self.save_directory, self.fsync)
+            for character in characters:
+                group.add(character)
+            group.commit()
+
 # ============================================================================
 # CHARACTER OPERATIONS
 # ============================================================================
@@ -232,6 +1805,9 @@ def gain_experience(character, xp_amount):
     - Increase magic by 2
     - Restore health to max_health
     
+    Large grants can level up many times; all the level ups are applied
+    in one step (see levels_gained).
+    
     Raises: CharacterDeadError if character health is 0
     """
     if character.get("health", 0) <= 0:
@@ -240,16 +1816,84 @@ def gain_experience(character, xp_amount):
     if xp_amount <= 0:
         return
 
-    character["experience"] += xp_amount
+    apply_experience(character, xp_amount)
+
+
+def gain_experience_batch(characters, xp_amount):
+    """
+    Add experience to many characters
+    
+    Args:
+        characters: Sequence of characters
+        xp_amount: XP for every character, or a sequence with one amount
+                   per character
+    
+    Returns: List with the number of levels each character gained
+    Raises: CharacterDeadError if any character is dead (no character is
+            changed in that case)
+    """
+    if isinstance(xp_amount, (int, float)):
+        amounts = [xp_amount] * len(characters)
+    else:
+        amounts = list(xp_amount)
+        if len(amounts) != len(characters):
+            raise ValueError("Need one XP amount per character")
+
+    for character in characters:
+        if character.get("health", 0) <= 0:
+            raise CharacterDeadError(
+                f"Dead characters cannot gain experience: {character.get('name')}")
 
-    # Can level up multiple times
-    while character["experience"] >= character["level"] * 100:
-        character["experience"] -= character["level"] * 100
-        character["level"] += 1
-        character["max_health"] += 10
-        character["strength"] += 2
-        character["magic"] += 2
+    return [apply_experience(character, amount) if amount > 0 else 0
+            for character, amount in zip(characters, amounts)]
+
+
+def levels_gained(level, experience):
+    """
+    Count the level ups available to a character
+    
+    Going from level L up k levels costs 100 * (k*L + k*(k-1)/2) XP, so
+    the answer is the largest k with k^2 + (2L-1)*k <= experience / 50,
+    found by solving the quadratic and correcting the integer rounding.
+    
+    Args:
+        level: Current level
+        experience: Current experience (may be more than one level's worth)
+    
+    Returns: (levels gained, experience cost of those levels)
+    """
+    a = 2 * level - 1
+    limit = int(experience // 50)
+    if limit <= 0 and level > 0:
+        return 0, 0
+    k = max(0, (math.isqrt(max(0, a * a + 4 * limit)) - a) // 2)
+
+    def cost(n):
+        return 100 * (n * level + n * (n - 1) // 2)
+
+    while cost(k + 1) <= experience:
+        k += 1
+    while k > 0 and cost(k) > experience:
+        k -= 1
+    return k, cost(k)
+
+
+def apply_experience(character, xp_amount):
+    """
+    Add XP to a living character and apply every resulting level up
+    
+    Returns: Number of levels gained
+    """
+    experience = character["experience"] + xp_amount
+    gained, spent = levels_gained(character["level"], experience)
+    character["experience"] = experience - spent
+    if gained:
+        character["level"] += gained
+        character["max_health"] += 10 * gained
+        character["strength"] += 2 * gained
+        character["magic"] += 2 * gained
         character["health"] = character["max_health"]
+    return gained
 
 
 def add_gold(character, amount):
@@ -311,13 +1955,176 @@ def revive_character(character):
     character["health"] = half_health
     return True
 
+# ============================================================================
+# CHARACTER POOL
+# ============================================================================
+
+class CharacterPool:
+    """
+    Columnar store for bulk stat operations on many characters
+    
+    The numeric stats (POOL_FIELDS) are held as one NumPy int64 array per
+    stat in columns; row i is the character names[i]. The pool methods
+    apply the character operations to every member at once. Everything
+    else (class, inventory, quests, equipment...) is kept per character
+    and returned unchanged by to_characters().
+    
+    Requires NumPy.
+    """
+    POOL_FIELDS = ("level", "health", "max_health", "strength", "magic",
+                   "experience", "gold")
+
+    def __init__(self, characters=()):
+        """
+        Build a pool from character dictionaries
+        
+        Raises: ImportError if NumPy is not installed,
+                InvalidSaveDataError if a character fails validation
+        """
+        if np is None:
+            raise ImportError("NumPy is required for CharacterPool")
+        characters = list(characters)
+        for character in characters:
+            validate_character_data(character)
+        self.names = [character["name"] for character in characters]
+        self._index = {name: i for i, name in enumerate(self.names)}
+        self.columns = {
+            field: np.array([character[field] for character in characters],
+                            dtype=np.int64)
+            for field in self.POOL_FIELDS
+        }
+        self._other = [
+            {key: value for key, value in snapshot_character(character).items()
+             if key not in self.columns}
+            for character in characters
+        ]
+
+    def __len__(self):
+        return len(self.names)
+
+    def index(self, character_name):
+        """Return the row of a character; raises CharacterNotFoundError"""
+        try:
+            return self._index[character_name]
+        except KeyError:
+            raise CharacterNotFoundError(f"{character_name} is not in the pool") from None
+
+    def character(self, character_name):
+        """Return one member as a character dictionary"""
+        return self._make_character(self.index(character_name))
+
+    def to_characters(self):
+        """Return every member as a character dictionary"""
+        return [self._make_character(i) for i in range(len(self.names))]
+
+    def _make_character(self, row):
+        other = self._other[row]
+        character = {}
+        for key in CHARACTER_FIELDS:
+            if key in self.columns:
+                character[key] = int(self.columns[key][row])
+            elif key in other:
+                character[key] = other[key]
+        for key, value in other.items():
+            character.setdefault(key, value)
+        return snapshot_character(character)
+
+    def is_dead(self):
+        """Return a boolean array: True where health is 0 or below"""
+        return self.columns["health"] <= 0
+
+    def gain_experience(self, xp_amount):
+        """
+        Add experience to every living member and apply level ups
+        
+        Dead members are skipped (gain_experience would raise for them).
+        
+        Args:
+            xp_amount: XP for everyone, or an array with one amount per member
+        
+        Returns: Array with the number of levels each member gained
+        """
+        cols = self.columns
+        xp = np.broadcast_to(np.asarray(xp_amount, dtype=np.int64), (len(self),))
+        active = (cols["health"] > 0) & (xp > 0)
+        experience = np.where(active, cols["experience"] + xp, cols["experience"])
+        level = cols["level"]
+
+        # Same closed form as levels_gained, with float sqrt then fix-up
+        a = 2 * level - 1
+        limit = np.maximum(experience // 50, 0)
+        root = np.sqrt((a * a + 4 * limit).astype(np.float64))
+        gained = np.maximum(np.floor((root - a) / 2).astype(np.int64), 0)
+
+        def cost(n):
+            return 100 * (n * level + n * (n - 1) // 2)
+
+        while True:
+            grow = cost(gained + 1) <= experience
+            if not grow.any():
+                break
+            gained += grow
+        while True:
+            shrink = (gained > 0) & (cost(gained) > experience)
+            if not shrink.any():
+                break
+            gained -= shrink
+        gained = np.where(active, gained, 0)
+
+        cols["experience"] = np.where(active, experience - cost(gained),
+                                      cols["experience"])
+        cols["level"] = level + gained
+        cols["max_health"] = cols["max_health"] + 10 * gained
+        cols["strength"] = cols["strength"] + 2 * gained
+        cols["magic"] = cols["magic"] + 2 * gained
+        cols["health"] = np.where(gained > 0, cols["max_health"], cols["health"])
+        return gained
+
+    def heal(self, amount):
+        """
+        Heal every member (health cannot exceed max_health)
+        
+        Returns: Array with the amount each member was healed
+        """
+        cols = self.columns
+        amount = np.broadcast_to(np.asarray(amount, dtype=np.int64), (len(self),))
+        healed = np.where(amount > 0,
+                          np.minimum(amount, cols["max_health"] - cols["health"]), 0)
+        cols["health"] = cols["health"] + healed
+        return healed
+
+    def add_gold(self, amount):
+        """
+        Add gold to every member (negative amounts spend it)
+        
+        Returns: Array of new gold totals
+        Raises: ValueError if any total would be negative (nothing changes)
+        """
+        new_totals = self.columns["gold"] + np.asarray(amount, dtype=np.int64)
+        if (new_totals < 0).any():
+            raise ValueError("Gold cannot be negative")
+        self.columns["gold"] = new_totals
+        return new_totals
+
+    def revive(self):
+        """
+        Revive every dead member with 50% health
+        
+        Returns: Boolean array: True where a member was revived
+        """
+        cols = self.columns
+        dead = self.is_dead()
+        cols["health"] = np.where(dead, np.maximum(1, cols["max_health"] // 2),
+                                  cols["health"])
+        return dead
+
 # ============================================================================
 # VALIDATION
 # ============================================================================
 
 def validate_character_data(character):
     """
-    Validate that character dictionary has all required fields
+    Validate that character dictionary (or Character) has all required fields
     
     Required fields: name, class, level, health, max_health, 
                     strength, magic, experience, gold, inventory,
@@ -344,16 +2151,69 @@ def validate_character_data(character):
         if not isinstance(character[key], (int, float)):
             raise InvalidSaveDataError(f"Field {key} must be numeric")
 
+    from inventory_system import StackedInventory  # deferred: avoids an import cycle
+
     list_fields = ["inventory", "active_quests", "completed_quests"]
     for key in list_fields:
         if not isinstance(character[key], list):
+            if key == "inventory" and isinstance(character[key], StackedInventory):
+                continue
             raise InvalidSaveDataError(f"Field {key} must be a list")
 
     return True
 
 # ============================================================================
-# TESTING
+# TESTING / BENCHMARKS
 # ============================================================================
 
+def benchmark_save_formats(count=20000):
+    """
+    Compare the text and binary save encodings on a sample character
+    
+    Returns: Dictionary {format: {"encode_us", "decode_us", "bytes"}}
+             with microseconds per save and the encoded size
+    """
+    character = create_character("Benchmark", "Warrior")
+    character.update(level=12, experience=5400, gold=1375)
+    character["inventory"] = ["health_potion"] * 8 + ["iron_sword", "leather_armor"]
+    character["active_quests"] = ["goblin_camp", "lost_amulet"]
+    character["completed_quests"] = ["first_steps", "rat_problem", "village_guard"]
+
+    def decode_text(text):
+        data = {}
+        for line in text.splitlines():
+            key, value = line.split(":", 1)
+            parse_save_field(data, key.strip().upper(), value.strip())
+        return data
+
+    codecs = {
+        "text": (format_character_save, decode_text),
+        "binary": (encode_binary_save, decode_binary_save),
+        "binary+zlib": (lambda c: encode_binary_save(c, True), decode_binary_save),
+    }
+    results = {}
+    for name, (encode, decode) in codecs.items():
+        start = time.perf_counter()
+        for _ in range(count):
+            encoded = encode(character)
+        encode_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(count):
+            decode(encoded)
+        decode_time = time.perf_counter() - start
+
+        results[name] = {
+            "encode_us": encode_time / count * 1e6,
+            "decode_us": decode_time / count * 1e6,
+            "bytes": len(encoded),
+        }
+    return results
+
+
 if __name__ == "__main__":
     print("=== CHARACTER MANAGER TEST ===")
+
+    for name, result in benchmark_save_formats().items():
+        print(f"{name:12} encode {result['encode_us']:6.1f}us  "
+              f"decode {result['decode_us']:6.1f}us  {result['bytes']} bytes")
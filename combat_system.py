@@ -164,6 +164,9 @@ class SimpleBattle:
         Damage formula: attacker['strength'] - (defender['strength'] // 4)
         Minimum damage: 1
         
+        'strength' is the effective value, equipment modifiers included
+        (kept current by inventory_system.add_stat_modifier).
+        
         Returns: Integer damage amount
         """
         att_str = attacker.get("strength", 0)
@@ -10,17 +10,53 @@ This module handles loading and validating game data from text files.
 """
 
 import os
+import sys
+import time
+import hashlib
+import threading
+import mmap
+import marshal
+import struct
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from collections.abc import Mapping
+
+try:
+    import numpy as np
+except ImportError:  # columnar views are optional
+    np = None
 from custom_exceptions import (
     InvalidDataFormatError,
     MissingDataFileError,
-    CorruptedDataError
+    CorruptedDataError,
+    QuestNotFoundError
+)
+
+# Field order used when records are stored as rows (compiled cache)
+QUEST_FIELDS = (
+    "quest_id", "title", "description",
+    "reward_xp", "reward_gold", "required_level", "prerequisite"
 )
+ITEM_FIELDS = (
+    "item_id", "name", "type", "effect", "cost", "description", "effects",
+    "slot"
+)
+ITEM_TYPES = ("weapon", "armor", "consumable")
+# Equipment slot used when an item has no SLOT line ("" = not equippable)
+DEFAULT_ITEM_SLOTS = {"weapon": "weapon", "armor": "armor"}
+
+# Compiled catalog cache, stored next to the source file
+CACHE_SUFFIX = ".cache"
+CACHE_VERSION = 3
+_CACHE_MAGIC = b"QCCACHE\0"
+# magic, cache version, marshal version, source mtime (ns), source size
+_CACHE_HEADER = struct.Struct("<8sHHqq")
 
 # ============================================================================
 # DATA LOADING FUNCTIONS
 # ============================================================================
 
-def load_quests(filename="data/quests.txt"):
+def load_quests(filename="data/quests.txt", use_cache=True, compact=False):
     """
     Load quest data from file
     
@@ -33,48 +69,39 @@ def load_quests(filename="data/quests.txt"):
     REQUIRED_LEVEL: 1
     PREREQUISITE: previous_quest_id (or NONE)
     
+    If use_cache is True, a compiled copy of the parsed quests is kept in
+    {filename}.cache and reused while the source file is unchanged.
+    If compact is True, quests are returned as read-only QuestRecord
+    objects instead of dicts.
+    
     Returns: Dictionary of quests {quest_id: quest_data_dict}
     Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
     """
     if not os.path.exists(filename):
         raise MissingDataFileError(f"Quest file {filename} not found")
 
+    if use_cache:
+        cached = read_catalog_cache(filename, QUEST_FIELDS)
+        if cached is not None:
+            return make_compact_catalog(cached, "quest") if compact else cached
+
     try:
-        with open(filename, "r") as f:
-            raw_lines = f.readlines()
+        source_stat = os.stat(filename)
     except OSError as e:
         raise CorruptedDataError("Could not read quest data file") from e
 
     quests = {}
-    current_block = []
-
-    try:
-        for line in raw_lines:
-            stripped = line.strip()
-            if stripped == "":
-                if current_block:
-                    q = parse_quest_block(current_block)
-                    validate_quest_data(q)
-                    quests[q["quest_id"]] = q
-                    current_block = []
-            else:
-                current_block.append(stripped)
-
-        # Last block (if file doesn't end with blank line)
-        if current_block:
-            q = parse_quest_block(current_block)
-            validate_quest_data(q)
-            quests[q["quest_id"]] = q
-
-    except InvalidDataFormatError:
-        raise
-    except Exception as e:
-        raise InvalidDataFormatError("Invalid quest data format") from e
+    for quest in iter_quests(filename):
+        quests[quest["quest_id"]] = quest
 
+    if use_cache:
+        write_catalog_cache(filename, source_stat, QUEST_FIELDS, quests)
+    if compact:
+        return make_compact_catalog(quests, "quest")
     return quests
 
 
-def load_items(filename="data/items.txt"):
+def load_items(filename="data/items.txt", use_cache=True, compact=False):
     """
     Load item data from file
     
@@ -85,6 +112,17 @@ def load_items(filename="data/items.txt"):
     EFFECT: stat_name:value (e.g., strength:5 or health:20)
     COST: 100
     DESCRIPTION: Item description
+    SLOT: helmet (optional equipment slot)
+    
+    EFFECT may list several effects separated by commas. Each item's
+    effects are also stored pre-parsed under 'effects' as a tuple of
+    (stat_name, value) pairs. Items without a SLOT line get their type's
+    default slot (DEFAULT_ITEM_SLOTS), or "" if they can't be equipped.
+    
+    If use_cache is True, a compiled copy of the parsed items is kept in
+    {filename}.cache and reused while the source file is unchanged.
+    If compact is True, items are returned as read-only ItemRecord
+    objects instead of dicts.
     
     Returns: Dictionary of items {item_id: item_data_dict}
     Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
@@ -92,38 +130,152 @@ def load_items(filename="data/items.txt"):
     if not os.path.exists(filename):
         raise MissingDataFileError(f"Item file {filename} not found")
 
+    if use_cache:
+        cached = read_catalog_cache(filename, ITEM_FIELDS)
+        if cached is not None:
+            return make_compact_catalog(cached, "item") if compact else cached
+
     try:
-        with open(filename, "r") as f:
-            raw_lines = f.readlines()
+        source_stat = os.stat(filename)
     except OSError as e:
         raise CorruptedDataError("Could not read item data file") from e
 
     items = {}
-    current_block = []
+    for item in iter_items(filename):
+        items[item["item_id"]] = item
+
+    if use_cache:
+        write_catalog_cache(filename, source_stat, ITEM_FIELDS, items)
+    if compact:
+        return make_compact_catalog(items, "item")
+    return items
+
+
+def iter_quests(filename="data/quests.txt"):
+    """
+    Yield quests one at a time while reading the file incrementally
+    
+    Each blank-line-delimited block is parsed and validated as soon as it
+    has been read, so the first quests are available before the rest of
+    the file is read and the whole file is never held in memory.
+    
+    Yields: Quest data dictionaries, in file order
+    Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+    """
+    if not os.path.exists(filename):
+        raise MissingDataFileError(f"Quest file {filename} not found")
 
     try:
-        for line in raw_lines:
-            stripped = line.strip()
-            if stripped == "":
-                if current_block:
-                    item = parse_item_block(current_block)
-                    validate_item_data(item)
-                    items[item["item_id"]] = item
-                    current_block = []
-            else:
-                current_block.append(stripped)
-
-        if current_block:
-            item = parse_item_block(current_block)
-            validate_item_data(item)
-            items[item["item_id"]] = item
+        f = open(filename, "r")
+    except OSError as e:
+        raise CorruptedDataError("Could not read quest data file") from e
 
-    except InvalidDataFormatError:
-        raise
-    except Exception as e:
-        raise InvalidDataFormatError("Invalid item data format") from e
+    with f:
+        try:
+            for block in iter_data_blocks(f):
+                yield parse_record_block(parse_quest_block, block, "quest")
+        except OSError as e:
+            raise CorruptedDataError("Could not read quest data file") from e
 
-    return items
+
+def iter_items(filename="data/items.txt"):
+    """
+    Yield items one at a time while reading the file incrementally
+    
+    Each blank-line-delimited block is parsed and validated as soon as it
+    has been read, so the first items are available before the rest of
+    the file is read and the whole file is never held in memory.
+    
+    Yields: Item data dictionaries, in file order
+    Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+    """
+    if not os.path.exists(filename):
+        raise MissingDataFileError(f"Item file {filename} not found")
+
+    try:
+        f = open(filename, "r")
+    except OSError as e:
+        raise CorruptedDataError("Could not read item data file") from e
+
+    with f:
+        try:
+            for block in iter_data_blocks(f):
+                yield parse_record_block(parse_item_block, block, "item")
+        except OSError as e:
+            raise CorruptedDataError("Could not read item data file") from e
+
+
+def load_catalog_file(filename, kind, use_cache=True):
+    """
+    Load one quests or items file
+    
+    Args:
+        filename: Path to the data file
+        kind: "quest" or "item"
+        use_cache: Passed on to load_quests/load_items
+    
+    Returns: Dictionary {record_id: record_dict}
+    Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+    """
+    if kind == "quest":
+        return load_quests(filename, use_cache=use_cache)
+    if kind == "item":
+        return load_items(filename, use_cache=use_cache)
+    raise ValueError(f"Unknown catalog kind: {kind}")
+
+
+def load_catalog_dir(path, kind, workers=None, use_cache=True):
+    """
+    Load and merge every shard file (*.txt) in a directory
+    
+    Shards are parsed in a process pool when more than one worker and
+    more than one shard are available, otherwise serially in this process.
+    
+    Args:
+        path: Directory containing shard files
+        kind: "quest" or "item"
+        workers: Number of worker processes (default: CPU count)
+        use_cache: Passed on to load_quests/load_items for each shard
+    
+    Returns: Dictionary {record_id: record_dict} for all shards
+    Raises:
+        MissingDataFileError if the directory does not exist
+        InvalidDataFormatError if a shard is invalid or an ID appears
+            in more than one shard
+        CorruptedDataError if a shard cannot be read
+    """
+    if kind not in ("quest", "item"):
+        raise ValueError(f"Unknown catalog kind: {kind}")
+    if not os.path.isdir(path):
+        raise MissingDataFileError(f"Catalog directory {path} not found")
+
+    shards = sorted(
+        os.path.join(path, name) for name in os.listdir(path)
+        if name.endswith(".txt")
+    )
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(shards))
+
+    if workers <= 1:
+        results = [load_catalog_file(shard, kind, use_cache) for shard in shards]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(load_catalog_file, shards,
+                                    [kind] * len(shards),
+                                    [use_cache] * len(shards)))
+
+    merged = {}
+    origin = {}
+    for shard, records in zip(shards, results):
+        for record_id, record in records.items():
+            if record_id in merged:
+                raise InvalidDataFormatError(
+                    f"Duplicate {kind} ID {record_id} in "
+                    f"{origin[record_id]} and {shard}")
+            merged[record_id] = record
+            origin[record_id] = shard
+    return merged
 
 
 def validate_quest_data(quest_dict):
@@ -171,7 +323,7 @@ def validate_item_data(item_dict):
         if key not in item_dict:
             raise InvalidDataFormatError(f"Missing item field: {key}")
 
-    if item_dict["type"] not in ("weapon", "armor", "consumable"):
+    if item_dict["type"] not in ITEM_TYPES:
         raise InvalidDataFormatError("Invalid item type")
 
     try:
@@ -215,45 +367,958 @@ def create_default_data_files():
                 "DESCRIPTION: Restores a small amount of health.\n"
             )
 
+# ============================================================================
+# CATALOG VALIDATION REPORTS
+# ============================================================================
+
+def validate_catalog_file(filename, kind):
+    """
+    Check a whole quests or items file and report every problem found
+    
+    Unlike load_quests/load_items, which stop at the first bad block,
+    this reads the file once and collects all errors: bad lines, bad
+    numbers, unknown item types, bad effects, missing fields, duplicate
+    IDs and (for quests) prerequisites that do not exist.
+    
+    Args:
+        filename: Path to the data file
+        kind: "quest" or "item"
+    
+    Returns: Dictionary with:
+            - file, kind
+            - blocks: number of blocks in the file
+            - records: number of blocks that parsed successfully
+            - errors: list of {'file', 'line', 'record_id', 'message'}
+              sorted by line number
+            - valid: True if no errors were found
+    Raises: MissingDataFileError, CorruptedDataError if the file can't be read
+    """
+    import quest_handler  # deferred: quest_handler imports game_data indirectly
+
+    if kind == "quest":
+        parser, table, id_field = parse_quest_block, QUEST_FIELD_TABLE, "quest_id"
+    elif kind == "item":
+        parser, table, id_field = parse_item_block, ITEM_FIELD_TABLE, "item_id"
+    else:
+        raise ValueError(f"Unknown catalog kind: {kind}")
+
+    if not os.path.exists(filename):
+        raise MissingDataFileError(f"Data file {filename} not found")
+
+    errors = []
+    records = {}
+    record_lines = {}
+    block_count = 0
+
+    def add_error(line, record_id, message):
+        errors.append({"file": filename, "line": line,
+                       "record_id": record_id, "message": message})
+
+    try:
+        with open(filename, "r") as f:
+            for first_line, block in iter_numbered_blocks(f):
+                block_count += 1
+                try:
+                    record = parser(block)
+                except InvalidDataFormatError:
+                    record_id = find_block_field(block, table, id_field)
+                    for index, message in find_block_errors(block, table, kind):
+                        line = first_line if index is None else first_line + index
+                        add_error(line, record_id, message)
+                    continue
+
+                record_id = record[id_field]
+                if record_id in records:
+                    add_error(first_line, record_id,
+                              f"Duplicate {kind} ID {record_id} "
+                              f"(first defined on line {record_lines[record_id]})")
+                    continue
+                records[record_id] = record
+                record_lines[record_id] = first_line
+    except OSError as e:
+        raise CorruptedDataError(f"Could not read data file {filename}") from e
+
+    if kind == "quest":
+        try:
+            quest_handler.validate_quest_prerequisites(records)
+        except QuestNotFoundError:
+            for quest_id, quest in records.items():
+                prereq = quest["prerequisite"]
+                if prereq != "NONE" and prereq not in records:
+                    add_error(record_lines[quest_id], quest_id,
+                              f"Prerequisite quest {prereq} not found")
+
+    errors.sort(key=lambda error: error["line"])
+    return {
+        "file": filename,
+        "kind": kind,
+        "blocks": block_count,
+        "records": len(records),
+        "errors": errors,
+        "valid": not errors,
+    }
+
+
+def find_block_field(lines, table, field):
+    """
+    Find the raw text value of one field in a block, without validating
+    
+    Returns: The value string, or None if the field is absent
+    """
+    fields = table[0]
+    for line in lines:
+        key, sep, value = line.partition(": ")
+        entry = fields.get(key.strip().upper())
+        if sep and entry is not None and entry[0] == field:
+            return value.strip()
+    return None
+
+
+def find_block_errors(lines, table, kind):
+    """
+    List every problem in a block that parse_block would reject
+    
+    Args:
+        lines: List of strings representing one record
+        table: Field table from build_field_table
+        kind: "quest" or "item"
+    
+    Returns: List of (line_index, message); line_index is the index of
+             the offending line in the block, or None for block-level
+             problems such as missing fields
+    """
+    fields, required = table
+    problems = []
+    seen = set()
+    for index, line in enumerate(lines):
+        key, sep, value = line.partition(": ")
+        if not sep:
+            problems.append((index, f"Bad {kind} line format: {line}"))
+            continue
+        entry = fields.get(key.strip().upper())
+        if entry is None:
+            continue
+
+        field, converter = entry
+        seen.add(field)
+        value = value.strip()
+        try:
+            if converter is not None:
+                converter(value)
+            if kind == "item" and field == "effect":
+                parse_effect_string(value)
+        except (ValueError, InvalidDataFormatError) as e:
+            problems.append((index, f"Invalid value for {kind} field {field}: "
+                                    f"{value!r} ({e})"))
+
+    for field in required:
+        if field not in seen:
+            problems.append((None, f"Missing {kind} field: {field}"))
+    return problems
+
+# ============================================================================
+# COMPILED CATALOG CACHE
+# ============================================================================
+
+def read_catalog_cache(filename, fields):
+    """
+    Load a catalog from its compiled cache file if the cache is fresh
+    
+    The cache is fresh when it was written by this cache/marshal version
+    for a source file with the same modification time and size.
+    
+    Args:
+        filename: Path to the source data file
+        fields: Field names in row order (QUEST_FIELDS or ITEM_FIELDS)
+    
+    Returns: Dictionary {record_id: record_dict}, or None if the cache is
+             missing, stale or unreadable
+    """
+    try:
+        source_stat = os.stat(filename)
+        with open(filename + CACHE_SUFFIX, "rb") as f:
+            blob = f.read()
+    except OSError:
+        return None
+
+    if len(blob) < _CACHE_HEADER.size:
+        return None
+
+    expected = (_CACHE_MAGIC, CACHE_VERSION, marshal.version,
+                source_stat.st_mtime_ns, source_stat.st_size)
+    if _CACHE_HEADER.unpack_from(blob) != expected:
+        return None
+
+    try:
+        rows = marshal.loads(memoryview(blob)[_CACHE_HEADER.size:])
+    except (EOFError, ValueError, TypeError):
+        return None
+
+    records = {}
+    for row in rows:
+        if len(row) != len(fields):
+            return None
+        records[row[0]] = dict(zip(fields, row))
+    return records
+
+
+def write_catalog_cache(filename, source_stat, fields, records):
+    """
+    Write a compiled cache file for a parsed catalog
+    
+    The cache is written to a temporary file and renamed into place, so
+    readers never see a half-written cache. Failing to write the cache
+    (e.g. read-only data directory) is not an error.
+    
+    Args:
+        filename: Path to the source data file
+        source_stat: os.stat() of the source taken before it was parsed
+        fields: Field names in row order (QUEST_FIELDS or ITEM_FIELDS)
+        records: Dictionary {record_id: record_dict}
+    
+    Returns: True if the cache was written, False otherwise
+    """
+    cache_path = filename + CACHE_SUFFIX
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    rows = tuple(
+        tuple(record[field] for field in fields)
+        for record in records.values()
+    )
+    header = _CACHE_HEADER.pack(_CACHE_MAGIC, CACHE_VERSION, marshal.version,
+                                source_stat.st_mtime_ns, source_stat.st_size)
+    try:
+        with open(temp_path, "wb") as f:
+            f.write(header + marshal.dumps(rows))
+        os.replace(temp_path, cache_path)
+    except (OSError, ValueError):
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        return False
+    return True
+
+# ============================================================================
+# COMPACT RECORDS
+# ============================================================================
+
+class CatalogRecord(Mapping):
+    """
+    Read-only catalog record stored in __slots__
+    
+    Supports dict-style access (record["title"], record.get("cost"),
+    "key" in record, iteration over field names) so existing code that
+    expects quest/item dicts keeps working.
+    """
+    __slots__ = ()
+    _fields = ()
+    _field_set = frozenset()
+
+    def __init__(self, *values):
+        if len(values) != len(self._fields):
+            raise TypeError(f"{type(self).__name__} takes "
+                            f"{len(self._fields)} values")
+        for name, value in zip(self._fields, values):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __getitem__(self, key):
+        if key in self._field_set:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        return key in self._field_set
+
+    def __iter__(self):
+        return iter(self._fields)
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __reduce__(self):
+        return (type(self), tuple(getattr(self, name) for name in self._fields))
+
+    def __repr__(self):
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{type(self).__name__}({values})"
+
+    def to_dict(self):
+        """Return the record as a plain dictionary"""
+        return {name: getattr(self, name) for name in self._fields}
+
+
+class QuestRecord(CatalogRecord):
+    """Compact quest record (fields in QUEST_FIELDS order)"""
+    __slots__ = QUEST_FIELDS
+    _fields = QUEST_FIELDS
+    _field_set = frozenset(QUEST_FIELDS)
+
+
+class ItemRecord(CatalogRecord):
+    """Compact item record (fields in ITEM_FIELDS order)"""
+    __slots__ = ITEM_FIELDS
+    _fields = ITEM_FIELDS
+    _field_set = frozenset(ITEM_FIELDS)
+
+
+def parse_effect_string(effect):
+    """
+    Parse an item effect string into (stat_name, value) pairs
+    
+    Args:
+        effect: String in format "stat_name:value", or several such
+                effects separated by commas ("strength:5,magic:3")
+    
+    Returns: Tuple of (stat_name, value) tuples; stat names are interned
+    Raises: InvalidDataFormatError if the effect string is malformed
+    """
+    effects = []
+    for part in effect.split(","):
+        stat_name, sep, value = part.partition(":")
+        stat_name = stat_name.strip()
+        if not sep or not stat_name:
+            raise InvalidDataFormatError(f"Invalid effect string: {effect}")
+        try:
+            effects.append((sys.intern(stat_name), int(value)))
+        except ValueError as e:
+            raise InvalidDataFormatError(f"Invalid effect string: {effect}") from e
+    return tuple(effects)
+
+
+def make_quest_record(quest):
+    """
+    Convert a quest dictionary to a QuestRecord
+    
+    IDs, prerequisites and other repeated strings are interned so they
+    are shared between records.
+    """
+    return QuestRecord(
+        sys.intern(quest["quest_id"]), quest["title"], quest["description"],
+        quest["reward_xp"], quest["reward_gold"], quest["required_level"],
+        sys.intern(quest["prerequisite"]),
+    )
+
+
+def make_item_record(item):
+    """
+    Convert an item dictionary to an ItemRecord
+    
+    IDs, types and effect strings are interned so they are shared
+    between records.
+    """
+    effects = item.get("effects")
+    if effects is None:
+        effects = parse_effect_string(item["effect"])
+    slot = item.get("slot")
+    if slot is None:
+        slot = DEFAULT_ITEM_SLOTS.get(item["type"], "")
+    return ItemRecord(
+        sys.intern(item["item_id"]), item["name"], sys.intern(item["type"]),
+        sys.intern(item["effect"]), item["cost"], item["description"],
+        tuple((sys.intern(stat), value) for stat, value in effects),
+        sys.intern(slot),
+    )
+
+
+def make_compact_catalog(records, kind):
+    """
+    Convert a {record_id: record_dict} catalog to compact records
+    
+    Args:
+        records: Dictionary of quest or item dicts
+        kind: "quest" or "item"
+    
+    Returns: Dictionary {record_id: QuestRecord|ItemRecord}
+    """
+    make_record = make_quest_record if kind == "quest" else make_item_record
+    compact = {}
+    for record_id, record in records.items():
+        compact[sys.intern(record_id)] = make_record(record)
+    return compact
+
+# ============================================================================
+# COLUMNAR VIEWS (requires NumPy)
+# ============================================================================
+
+class CatalogColumns:
+    """
+    Columnar view of a loaded catalog for vectorized queries
+    
+    columns maps a column name to a NumPy array with one entry per record
+    (or per effect, for the effect_* columns of items). Categorical
+    columns hold integer codes; their labels are in categories[name].
+    """
+    
+    def __init__(self, ids, columns, categories):
+        self.ids = ids
+        self.columns = columns
+        self.categories = categories
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def __len__(self):
+        return len(self.ids)
+
+    def code(self, column, label):
+        """
+        Get the integer code used for a label in a categorical column
+        
+        Returns: Integer code, or -1 if the label does not occur
+        """
+        labels = self.categories[column]
+        return labels.index(label) if label in labels else -1
+
+    def ids_where(self, mask):
+        """Return the record IDs selected by a boolean mask, as a list"""
+        return self.ids[mask].tolist()
+
+
+def require_numpy():
+    """Raise ImportError if NumPy is not installed"""
+    if np is None:
+        raise ImportError("NumPy is required for columnar catalog views")
+
+
+def build_item_columns(items):
+    """
+    Build a columnar view of an items catalog
+    
+    Per item columns: cost, type (codes, labels from ITEM_TYPES).
+    Per effect columns (one entry per (stat, value) pair of every item):
+    effect_item (row index of the item), effect_stat (codes), effect_value.
+    
+    Args:
+        items: Dictionary {item_id: item} from load_items
+    
+    Returns: CatalogColumns
+    Raises: ImportError if NumPy is not installed
+    """
+    require_numpy()
+    count = len(items)
+    type_codes = {item_type: code for code, item_type in enumerate(ITEM_TYPES)}
+    stat_codes = {}
+
+    cost = np.empty(count, dtype=np.int64)
+    item_type = np.empty(count, dtype=np.int8)
+    effect_item = []
+    effect_stat = []
+    effect_value = []
+
+    for row, item in enumerate(items.values()):
+        cost[row] = item["cost"]
+        item_type[row] = type_codes.get(item["type"], -1)
+        effects = item.get("effects")
+        if effects is None:
+            effects = parse_effect_string(item["effect"])
+        for stat_name, value in effects:
+            effect_item.append(row)
+            effect_stat.append(stat_codes.setdefault(stat_name, len(stat_codes)))
+            effect_value.append(value)
+
+    columns = {
+        "cost": cost,
+        "type": item_type,
+        "effect_item": np.array(effect_item, dtype=np.intp),
+        "effect_stat": np.array(effect_stat, dtype=np.int16),
+        "effect_value": np.array(effect_value, dtype=np.int64),
+    }
+    categories = {"type": ITEM_TYPES, "effect_stat": tuple(stat_codes)}
+    return CatalogColumns(np.array(list(items), dtype=object), columns, categories)
+
+
+def build_quest_columns(quests):
+    """
+    Build a columnar view of a quests catalog
+    
+    Columns: reward_xp, reward_gold, required_level, and
+    has_prerequisite (bool).
+    
+    Args:
+        quests: Dictionary {quest_id: quest} from load_quests
+    
+    Returns: CatalogColumns
+    Raises: ImportError if NumPy is not installed
+    """
+    require_numpy()
+    count = len(quests)
+    reward_xp = np.empty(count, dtype=np.int64)
+    reward_gold = np.empty(count, dtype=np.int64)
+    required_level = np.empty(count, dtype=np.int64)
+    has_prerequisite = np.empty(count, dtype=bool)
+
+    for row, quest in enumerate(quests.values()):
+        reward_xp[row] = quest["reward_xp"]
+        reward_gold[row] = quest["reward_gold"]
+        required_level[row] = quest["required_level"]
+        has_prerequisite[row] = quest["prerequisite"] != "NONE"
+
+    columns = {
+        "reward_xp": reward_xp,
+        "reward_gold": reward_gold,
+        "required_level": required_level,
+        "has_prerequisite": has_prerequisite,
+    }
+    return CatalogColumns(np.array(list(quests), dtype=object), columns, {})
+
+# ============================================================================
+# LAZY CATALOGS
+# ============================================================================
+
+class LazyCatalog(Mapping):
+    """
+    Read-only {record_id: record_dict} mapping backed by a memory-mapped
+    data file
+    
+    Opening the catalog scans the file once to record the byte range of
+    every block. A block is only parsed (with parse_quest_block or
+    parse_item_block) the first time its record is accessed; the parsed
+    record is then cached.
+    """
+    
+    def __init__(self, filename, kind="item"):
+        """
+        Map a data file and index its blocks
+        
+        Args:
+            filename: Path to a quests or items data file
+            kind: "quest" or "item"
+        
+        Raises: MissingDataFileError, CorruptedDataError,
+                InvalidDataFormatError if a block has no ID line
+        """
+        if kind == "quest":
+            self._parser = parse_quest_block
+            self._id_key = b"QUEST_ID"
+        elif kind == "item":
+            self._parser = parse_item_block
+            self._id_key = b"ITEM_ID"
+        else:
+            raise ValueError(f"Unknown catalog kind: {kind}")
+
+        if not os.path.exists(filename):
+            raise MissingDataFileError(f"Data file {filename} not found")
+
+        self.filename = filename
+        self.kind = kind
+        self._map = None
+        self._index = {}
+        self._records = {}
+
+        try:
+            with open(filename, "rb") as f:
+                if os.fstat(f.fileno()).st_size > 0:
+                    self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except OSError as e:
+            raise CorruptedDataError(f"Could not read data file {filename}") from e
+
+        if self._map is not None:
+            self._build_index()
+
+    def _build_index(self):
+        """Record the (start, end) byte offsets of every block by ID"""
+        for start, end in iter_block_spans(self._map):
+            record_id = None
+            for line in self._map[start:end].splitlines():
+                stripped = line.strip()
+                if b": " in stripped:
+                    key, value = stripped.split(b": ", 1)
+                    if key.strip().upper() == self._id_key:
+                        record_id = value.strip().decode("utf-8")
+                        break
+            if record_id is None:
+                raise InvalidDataFormatError(
+                    f"Missing {self.kind} field: {self._id_key.decode().lower()}")
+            self._index[record_id] = (start, end)
+
+    def __getitem__(self, record_id):
+        record = self._records.get(record_id)
+        if record is not None:
+            return record
+
+        start, end = self._index[record_id]
+        if self._map is None:
+            raise ValueError("Catalog has been closed")
+        lines = self._map[start:end].decode("utf-8").splitlines()
+        block = [line.strip() for line in lines if line.strip()]
+        record = parse_record_block(self._parser, block, self.kind)
+        self._records[record_id] = record
+        return record
+
+    def __contains__(self, record_id):
+        return record_id in self._index
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    @property
+    def parsed_count(self):
+        """Number of records that have been parsed so far"""
+        return len(self._records)
+
+    def close(self):
+        """Release the memory map (already parsed records stay usable)"""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+# ============================================================================
+# HOT RELOAD
+# ============================================================================
+
+class CatalogWatcher:
+    """
+    Keeps a quests or items catalog in sync with its data file
+    
+    When the file changes, only blocks whose bytes changed are parsed
+    again; unchanged blocks reuse their previously parsed record. The new
+    catalog is validated completely before it replaces the current one,
+    so readers of watcher.data always see a complete, valid catalog.
+    """
+    
+    def __init__(self, filename, kind="quest", on_change=None):
+        """
+        Load the catalog and remember its block hashes
+        
+        Args:
+            filename: Path to a quests or items data file
+            kind: "quest" or "item"
+            on_change: Optional callback(report) run after each reload
+        
+        Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+        """
+        if kind == "quest":
+            self._parser = parse_quest_block
+            self._id_field = "quest_id"
+        elif kind == "item":
+            self._parser = parse_item_block
+            self._id_field = "item_id"
+        else:
+            raise ValueError(f"Unknown catalog kind: {kind}")
+
+        self.filename = filename
+        self.kind = kind
+        self.on_change = None
+        self.data = {}
+        self.last_error = None
+        self._records_by_hash = {}
+        self._hash_by_id = {}
+        self._signature = None
+        self._lock = threading.Lock()
+        self._stop_event = None
+        self._thread = None
+        self.reload()
+        self.on_change = on_change
+
+    def _file_signature(self):
+        """Return (mtime_ns, size) of the data file"""
+        if not os.path.exists(self.filename):
+            raise MissingDataFileError(f"Data file {self.filename} not found")
+        try:
+            stat = os.stat(self.filename)
+        except OSError as e:
+            raise CorruptedDataError(f"Could not read data file {self.filename}") from e
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def reload(self):
+        """
+        Re-read the data file, parsing only new or changed blocks
+        
+        Returns: Dictionary with sorted lists of 'added', 'removed' and
+                 'changed' record IDs
+        Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+                (the current catalog is kept if the new file is invalid)
+        """
+        with self._lock:
+            signature = self._file_signature()
+            try:
+                with open(self.filename, "rb") as f:
+                    raw = f.read()
+            except OSError as e:
+                raise CorruptedDataError(
+                    f"Could not read data file {self.filename}") from e
+
+            new_data = {}
+            records_by_hash = {}
+            hash_by_id = {}
+            for start, end in iter_block_spans(raw):
+                block_bytes = raw[start:end]
+                digest = hashlib.blake2b(block_bytes, digest_size=16).digest()
+                record = self._records_by_hash.get(digest)
+                if record is None:
+                    record = records_by_hash.get(digest)
+                if record is None:
+                    lines = block_bytes.decode("utf-8").splitlines()
+                    block = [line.strip() for line in lines if line.strip()]
+                    record = parse_record_block(self._parser, block, self.kind)
+                records_by_hash[digest] = record
+                record_id = record[self._id_field]
+                new_data[record_id] = record
+                hash_by_id[record_id] = digest
+
+            old_hashes = self._hash_by_id
+            report = {
+                "added": sorted(hash_by_id.keys() - old_hashes.keys()),
+                "removed": sorted(old_hashes.keys() - hash_by_id.keys()),
+                "changed": sorted(
+                    record_id for record_id, digest in hash_by_id.items()
+                    if record_id in old_hashes and old_hashes[record_id] != digest
+                ),
+            }
+
+            # Swap in the new catalog in one assignment
+            self.data = new_data
+            self._records_by_hash = records_by_hash
+            self._hash_by_id = hash_by_id
+            self._signature = signature
+
+        if self.on_change is not None and any(report.values()):
+            self.on_change(report)
+        return report
+
+    def check(self):
+        """
+        Reload the catalog if the data file changed since the last load
+        
+        Returns: Change report (see reload), or None if the file is unchanged
+        Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+        """
+        if self._file_signature() == self._signature:
+            return None
+        return self.reload()
+
+    def start(self, interval=1.0):
+        """
+        Poll the data file in a background thread every interval seconds
+        
+        Errors while reloading (or raised by on_change) are stored in
+        last_error, the previous catalog stays active and polling
+        continues.
+        """
+        if self._thread is not None:
+            return
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._poll_loop,
+                                        args=(interval,), daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background polling thread"""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+    def _poll_loop(self, interval):
+        """Background thread body for start()"""
+        while not self._stop_event.wait(interval):
+            try:
+                self.check()
+                self.last_error = None
+            except Exception as e:
+                # Includes errors from on_change; keep polling
+                self.last_error = e
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
-def parse_quest_block(lines):
+def iter_data_blocks(lines):
     """
-    Parse a block of lines into a quest dictionary
+    Group lines into blank-line-delimited blocks
     
     Args:
-        lines: List of strings representing one quest
+        lines: Iterable of lines (an open file is read lazily)
     
-    Returns: Dictionary with quest data
+    Yields: Lists of stripped, non-empty lines, one list per block
+    """
+    block = []
+    for line in lines:
+        stripped = line.strip()
+        if stripped:
+            block.append(stripped)
+        elif block:
+            yield block
+            block = []
+
+    # Last block (if file doesn't end with blank line)
+    if block:
+        yield block
+
+
+def iter_block_spans(data):
+    """
+    Find blank-line-delimited blocks in raw file bytes
+    
+    Args:
+        data: bytes or mmap holding a whole data file
+    
+    Yields: (start, end) byte offsets of each block
+    """
+    start = None
+    pos = 0
+    size = len(data)
+    while pos < size:
+        newline = data.find(b"\n", pos)
+        end = size if newline == -1 else newline + 1
+        if data[pos:end].strip():
+            if start is None:
+                start = pos
+        elif start is not None:
+            yield start, pos
+            start = None
+        pos = end
+
+    if start is not None:
+        yield start, size
+
+
+def iter_numbered_blocks(lines):
+    """
+    Group lines into blank-line-delimited blocks, keeping line numbers
+    
+    Args:
+        lines: Iterable of lines (an open file is read lazily)
+    
+    Yields: (first_line_number, block) where block is a list of stripped,
+            non-empty lines and line numbers start at 1
+    """
+    block = []
+    first_line = None
+    for line_number, line in enumerate(lines, 1):
+        stripped = line.strip()
+        if stripped:
+            if not block:
+                first_line = line_number
+            block.append(stripped)
+        elif block:
+            yield first_line, block
+            block = []
+
+    if block:
+        yield first_line, block
+
+
+def parse_record_block(parser, lines, kind):
+    """
+    Run a block parser, reporting any failure as InvalidDataFormatError
+    
+    Args:
+        parser: parse_quest_block or parse_item_block
+        lines: List of strings representing one record
+        kind: "quest" or "item" (used in the error message)
+    
+    Returns: Parsed record dictionary
     Raises: InvalidDataFormatError if parsing fails
     """
-    quest = {}
+    try:
+        return parser(lines)
+    except InvalidDataFormatError:
+        raise
+    except Exception as e:
+        raise InvalidDataFormatError(f"Invalid {kind} data format") from e
+
+
+def parse_item_type(value):
+    """
+    Convert an item TYPE value, rejecting unknown types
+    
+    Returns: The type string
+    Raises: InvalidDataFormatError if the type is not weapon/armor/consumable
+    """
+    if value not in ITEM_TYPES:
+        raise InvalidDataFormatError("Invalid item type")
+    return value
+
+
+def build_field_table(schema):
+    """
+    Build the lookup table used by parse_block from a field schema
+    
+    Args:
+        schema: Tuple of (file_key, field_name, converter, required);
+                converter is None for plain text fields
+    
+    Returns: Tuple of ({file_key: (field_name, converter)}, required_fields)
+    """
+    fields = {}
+    required = []
+    for key, field, converter, is_required in schema:
+        fields[key] = (field, converter)
+        if is_required:
+            required.append(field)
+    return fields, tuple(required)
+
+
+def parse_block(lines, table, kind):
+    """
+    Parse a block of "KEY: value" lines using a field table
+    
+    Every field is converted and checked exactly once; no separate
+    validation pass is needed afterwards.
+    
+    Args:
+        lines: List of strings representing one record
+        table: Field table from build_field_table
+        kind: "quest" or "item" (used in error messages)
+    
+    Returns: Dictionary with record data
+    Raises: InvalidDataFormatError if a line, value or required field is bad
+    """
+    fields, required = table
+    record = {}
     for line in lines:
-        if ": " not in line:
-            raise InvalidDataFormatError("Bad quest line format")
-        key, value = line.split(": ", 1)
-        key = key.strip().upper()
+        key, sep, value = line.partition(": ")
+        if not sep:
+            raise InvalidDataFormatError(f"Bad {kind} line format")
+        entry = fields.get(key)
+        if entry is None:
+            entry = fields.get(key.strip().upper())
+            if entry is None:
+                continue
+
+        field, converter = entry
         value = value.strip()
+        if converter is None:
+            record[field] = value
+        else:
+            try:
+                record[field] = converter(value)
+            except ValueError as e:
+                raise InvalidDataFormatError(
+                    f"Invalid value for {kind} field {field}") from e
 
-        if key == "QUEST_ID":
-            quest["quest_id"] = value
-        elif key == "TITLE":
-            quest["title"] = value
-        elif key == "DESCRIPTION":
-            quest["description"] = value
-        elif key == "REWARD_XP":
-            quest["reward_xp"] = int(value)
-        elif key == "REWARD_GOLD":
-            quest["reward_gold"] = int(value)
-        elif key == "REQUIRED_LEVEL":
-            quest["required_level"] = int(value)
-        elif key == "PREREQUISITE":
-            quest["prerequisite"] = value
+    for field in required:
+        if field not in record:
+            raise InvalidDataFormatError(f"Missing {kind} field: {field}")
+    return record
 
-    validate_quest_data(quest)
-    return quest
+
+def parse_quest_block(lines):
+    """
+    Parse a block of lines into a quest dictionary
+    
+    Args:
+        lines: List of strings representing one quest
+    
+    Returns: Dictionary with quest data
+    Raises: InvalidDataFormatError if parsing fails
+    """
+    return parse_block(lines, QUEST_FIELD_TABLE, "quest")
 
 
 def parse_item_block(lines):
@@ -263,9 +1328,103 @@ def parse_item_block(lines):
     Args:
         lines: List of strings representing one item
     
-    Returns: Dictionary with item data
+    Returns: Dictionary with item data, including the parsed 'effects'
+             and the equipment 'slot'
     Raises: InvalidDataFormatError if parsing fails
     """
+    item = parse_block(lines, ITEM_FIELD_TABLE, "item")
+    item["effects"] = parse_effect_string(item["effect"])
+    if "slot" not in item:
+        item["slot"] = DEFAULT_ITEM_SLOTS.get(item["type"], "")
+    return item
+
+
+# Block schemas: (file key, field name, converter, required).
+# A converter of None keeps the value as text.
+QUEST_SCHEMA = (
+    ("QUEST_ID", "quest_id", None, True),
+    ("TITLE", "title", None, True),
+    ("DESCRIPTION", "description", None, True),
+    ("REWARD_XP", "reward_xp", int, True),
+    ("REWARD_GOLD", "reward_gold", int, True),
+    ("REQUIRED_LEVEL", "required_level", int, True),
+    ("PREREQUISITE", "prerequisite", None, True),
+)
+ITEM_SCHEMA = (
+    ("ITEM_ID", "item_id", None, True),
+    ("NAME", "name", None, True),
+    ("TYPE", "type", parse_item_type, True),
+    ("EFFECT", "effect", None, True),
+    ("COST", "cost", int, True),
+    ("DESCRIPTION", "description", None, True),
+    ("SLOT", "slot", sys.intern, False),
+)
+
+QUEST_FIELD_TABLE = build_field_table(QUEST_SCHEMA)
+ITEM_FIELD_TABLE = build_field_table(ITEM_SCHEMA)
+
+# ============================================================================
+# TESTING / BENCHMARKS
+# ============================================================================
+
+def write_synthetic_items(filename, count, prefix="item"):
+    """
+    Write a generated items file (used by the benchmarks below)
+    
+    Args:
+        filename: Path of the file to create
+        count: Number of items to generate
+        prefix: Prefix for generated item IDs
+    """
+    types = ("weapon", "armor", "consumable")
+    stats = ("strength", "max_health", "health")
+    with open(filename, "w") as f:
+        for i in range(count):
+            f.write(
+                f"ITEM_ID: {prefix}_{i}\n"
+                f"NAME: Generated Item {i}\n"
+                f"TYPE: {types[i % 3]}\n"
+                f"EFFECT: {stats[i % 3]}:{i % 50 + 1}\n"
+                f"COST: {i % 500 + 10}\n"
+                f"DESCRIPTION: Generated item number {i}\n"
+                "\n"
+            )
+
+
+def benchmark_catalog_dir(shards=8, items_per_shard=25000, workers=None):
+    """
+    Compare serial load_items against load_catalog_dir on a generated
+    multi-shard corpus (caches disabled so both sides parse every shard)
+    
+    Returns: Dictionary with 'serial' and 'parallel' times in seconds
+    """
+    with tempfile.TemporaryDirectory() as path:
+        for shard in range(shards):
+            write_synthetic_items(os.path.join(path, f"shard_{shard}.txt"),
+                                  items_per_shard, prefix=f"s{shard}")
+
+        start = time.perf_counter()
+        serial = {}
+        for name in sorted(os.listdir(path)):
+            serial.update(load_items(os.path.join(path, name), use_cache=False))
+        serial_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        parallel = load_catalog_dir(path, "item", workers=workers, use_cache=False)
+        parallel_time = time.perf_counter() - start
+
+    assert parallel == serial
+    return {"serial": serial_time, "parallel": parallel_time}
+
+
+def legacy_parse_item_block(lines):
+    """
+    The if/elif item parser the schema parser replaced, kept only as the
+    baseline for benchmark_block_parser
+    
+    Like the old loader path it validates the item twice: once inside
+    the parser and once more afterwards.
+    """
     item = {}
     for line in lines:
         if ": " not in line:
@@ -287,12 +1446,53 @@ def parse_item_block(lines):
         elif key == "DESCRIPTION":
             item["description"] = value
 
+    validate_item_data(item)
     validate_item_data(item)
     return item
 
-# ============================================================================
-# TESTING
-# ============================================================================
+
+def benchmark_block_parser(count=100000):
+    """
+    Time the schema-driven parser against the old if/elif parser on a
+    generated items file
+    
+    'schema' is parse_block with the item field table (each field
+    converted and checked once); 'legacy' is legacy_parse_item_block
+    (if/elif chain plus two validate_item_data passes). Neither includes
+    the effect parsing parse_item_block does on top.
+    
+    Returns: Dictionary of microseconds per block for each parser
+    """
+    with tempfile.TemporaryDirectory() as path:
+        filename = os.path.join(path, "items.txt")
+        write_synthetic_items(filename, count)
+        with open(filename, "r") as f:
+            blocks = list(iter_data_blocks(f))
+
+    start = time.perf_counter()
+    for block in blocks:
+        parse_block(block, ITEM_FIELD_TABLE, "item")
+    schema = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for block in blocks:
+        legacy_parse_item_block(block)
+    legacy = time.perf_counter() - start
+
+    return {
+        "schema": schema / count * 1e6,
+        "legacy": legacy / count * 1e6,
+    }
+
 
 if __name__ == "__main__":
     print("=== GAME DATA MODULE TEST ===")
+
+    timings = benchmark_catalog_dir()
+    print(f"Catalog dir load: serial {timings['serial']:.2f}s, "
+          f"parallel {timings['parallel']:.2f}s "
+          f"({timings['serial'] / timings['parallel']:.1f}x)")
+
+    per_block = benchmark_block_parser()
+    print(f"Block parser: {per_block['schema']:.2f} us/block schema-driven, "
+          f"{per_block['legacy']:.2f} us/block old if/elif + revalidation")
@@ -9,11 +9,13 @@ AI Usage: [Document any AI assistance used]
 This module handles inventory management, item usage, and equipment.
 """
 
+import game_data
 from custom_exceptions import (
     InventoryFullError,
     ItemNotFoundError,
     InsufficientResourcesError,
-    InvalidItemTypeError
+    InvalidItemTypeError,
+    InvalidDataFormatError
 )
 
 # Maximum inventory size
@@ -94,10 +96,262 @@ def clear_inventory(character):
     
     Returns: List of removed items
     """
-    removed = list(character.get("inventory", []))
-    character["inventory"] = []
+    inventory = character.get("inventory", [])
+    removed = list(inventory)
+    if isinstance(inventory, StackedInventory):
+        character["inventory"] = StackedInventory()
+    else:
+        character["inventory"] = []
     return removed
 
+# ============================================================================
+# STACKED INVENTORY
+# ============================================================================
+
+class StackedInventory:
+    """
+    Inventory stored as item_id -> quantity stacks
+    
+    A drop-in replacement for the inventory list: len(), "in", count(),
+    append(), remove() and iteration behave as they do for the list
+    (every item still takes one slot), but membership, counts and
+    removal are O(1) instead of scans. Iteration yields each item as
+    many times as it is held, grouped by stack. Two inventories (or an
+    inventory and a list) are equal when they hold the same items in any
+    order.
+    """
+    __slots__ = ("_counts", "_size")
+
+    def __init__(self, items=()):
+        self._counts = {}
+        self._size = 0
+        for item_id in items:
+            self.add(item_id)
+
+    @classmethod
+    def from_save_string(cls, text):
+        """Build an inventory from the save file's comma-separated list"""
+        return cls(text.split(",") if text else ())
+
+    def to_save_string(self):
+        """Return the comma-separated list used in save files"""
+        return ",".join(self)
+
+    def add(self, item_id, quantity=1):
+        """Add quantity copies of an item"""
+        if quantity < 1:
+            raise ValueError("Quantity must be at least 1")
+        self._counts[item_id] = self._counts.get(item_id, 0) + quantity
+        self._size += quantity
+
+    def append(self, item_id):
+        """Add one item (list-compatible)"""
+        self.add(item_id)
+
+    def extend(self, items):
+        """Add several items (list-compatible)"""
+        for item_id in items:
+            self.add(item_id)
+
+    def remove(self, item_id, quantity=1):
+        """
+        Remove quantity copies of an item
+        
+        Raises: ValueError if fewer than quantity are held (as list.remove)
+        """
+        held = self._counts.get(item_id, 0)
+        if quantity < 1 or held < quantity:
+            raise ValueError(f"{item_id} x{quantity} not in inventory")
+        if held == quantity:
+            del self._counts[item_id]
+        else:
+            self._counts[item_id] = held - quantity
+        self._size -= quantity
+
+    def count(self, item_id):
+        """Return how many of an item are held"""
+        return self._counts.get(item_id, 0)
+
+    def stacks(self):
+        """Return (item_id, quantity) pairs"""
+        return self._counts.items()
+
+    def clear(self):
+        """Remove every item"""
+        self._counts.clear()
+        self._size = 0
+
+    def copy(self):
+        """Return an independent copy"""
+        clone = StackedInventory()
+        clone._counts = dict(self._counts)
+        clone._size = self._size
+        return clone
+
+    def __contains__(self, item_id):
+        return item_id in self._counts
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        for item_id, quantity in list(self._counts.items()):
+            for _ in range(quantity):
+                yield item_id
+
+    def __eq__(self, other):
+        if isinstance(other, StackedInventory):
+            return self._counts == other._counts
+        if isinstance(other, list):
+            return self._size == len(other) and self == StackedInventory(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"StackedInventory({self._counts!r})"
+
+
+def stack_inventory(character):
+    """
+    Switch a character's inventory list to a StackedInventory
+    
+    Returns: The character's StackedInventory
+    """
+    inventory = character.get("inventory", [])
+    if not isinstance(inventory, StackedInventory):
+        inventory = StackedInventory(inventory)
+        character["inventory"] = inventory
+    return inventory
+
+# ============================================================================
+# INVENTORY TRANSACTIONS
+# ============================================================================
+
+class InventoryTransaction:
+    """
+    Stages many inventory and gold changes and applies them all at once
+    
+    Nothing is changed until commit(), which checks the end result once
+    (items available, capacity, gold) and then updates the inventory in
+    a single pass. If the check fails, the character is left untouched.
+    Items added and removed in the same transaction cancel out, so a
+    swap works even with a full inventory.
+    
+    Usage:
+        with InventoryTransaction(character) as tx:
+            tx.remove("iron_ore", 3)
+            tx.add("iron_sword")
+            tx.add_gold(-25)
+    
+    Leaving the block normally commits; an exception discards the
+    staged changes.
+    """
+    
+    def __init__(self, character):
+        self.character = character
+        self.rollback()
+
+    def add(self, item_id, quantity=1):
+        """Stage adding quantity copies of an item"""
+        if quantity < 1:
+            raise ValueError("Quantity must be at least 1")
+        self.added[item_id] = self.added.get(item_id, 0) + quantity
+
+    def remove(self, item_id, quantity=1):
+        """Stage removing quantity copies of an item"""
+        if quantity < 1:
+            raise ValueError("Quantity must be at least 1")
+        self.removed[item_id] = self.removed.get(item_id, 0) + quantity
+
+    def add_gold(self, amount):
+        """Stage a gold change (negative to spend)"""
+        self.gold += amount
+
+    def validate(self):
+        """
+        Check that the staged changes can be applied
+        
+        Raises:
+            ItemNotFoundError if more of an item would be removed than held
+            InventoryFullError if the inventory would exceed MAX_INVENTORY_SIZE
+            InsufficientResourcesError if gold would go negative
+        """
+        inventory = self.character.get("inventory", [])
+        if isinstance(inventory, StackedInventory) or not self.removed:
+            held = inventory
+        else:
+            held = StackedInventory(inventory)
+        for item_id, quantity in self.removed.items():
+            if held.count(item_id) + self.added.get(item_id, 0) < quantity:
+                raise ItemNotFoundError(f"Not enough {item_id} in inventory")
+
+        size = len(inventory) + sum(self.added.values()) - sum(self.removed.values())
+        if size > MAX_INVENTORY_SIZE and size > len(inventory):
+            # An already over-full inventory may still shrink
+            raise InventoryFullError("Inventory is full")
+
+        if self.character.get("gold", 0) + self.gold < 0:
+            raise InsufficientResourcesError("Not enough gold")
+
+    def commit(self):
+        """
+        Validate and apply the staged changes, then clear them
+        
+        Returns: True if committed
+        Raises: See validate(); nothing is changed if it fails
+        """
+        self.validate()
+        character = self.character
+        inventory = character.setdefault("inventory", [])
+        # Removals first satisfied by this transaction's own additions
+        added = dict(self.added)
+        removed = {}
+        for item_id, quantity in self.removed.items():
+            cancelled = min(quantity, added.get(item_id, 0))
+            if cancelled:
+                added[item_id] -= cancelled
+            if quantity > cancelled:
+                removed[item_id] = quantity - cancelled
+
+        if isinstance(inventory, StackedInventory):
+            for item_id, quantity in removed.items():
+                inventory.remove(item_id, quantity)
+            for item_id, quantity in added.items():
+                if quantity:
+                    inventory.add(item_id, quantity)
+        else:
+            kept = []
+            for item_id in inventory:
+                if removed.get(item_id):
+                    removed[item_id] -= 1
+                else:
+                    kept.append(item_id)
+            for item_id, quantity in added.items():
+                kept.extend([item_id] * quantity)
+            inventory[:] = kept
+
+        if self.gold:
+            character["gold"] = character.get("gold", 0) + self.gold
+        self.rollback()
+        return True
+
+    def rollback(self):
+        """Discard the staged changes"""
+        self.added = {}
+        self.removed = {}
+        self.gold = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+        return False
+
 # ============================================================================
 # ITEM USAGE
 # ============================================================================
@@ -126,9 +380,8 @@ def use_item(character, item_id, item_data):
     if item_data.get("type") != "consumable":
         raise InvalidItemTypeError("Only consumable items can be used")
 
-    effect = item_data.get("effect", "")
-    stat_name, value = parse_item_effect(effect)
-    apply_stat_effect(character, stat_name, value)
+    for stat_name, value in get_item_effects(item_data):
+        apply_stat_effect(character, stat_name, value)
 
     # Remove the item after use
     remove_item_from_inventory(character, item_id)
@@ -150,6 +403,9 @@ def equip_weapon(character, item_id, item_data):
     - Unequip current weapon (remove bonus)
     - Add old weapon back to inventory
     
+    Equivalent to equip_item(..., slot="weapon"); also keeps
+    equipped_weapon and weapon_bonus (strength bonus) up to date.
+    
     Returns: String describing equipment change
     Raises:
         ItemNotFoundError if item not in inventory
@@ -161,25 +417,7 @@ def equip_weapon(character, item_id, item_data):
     if item_data.get("type") != "weapon":
         raise InvalidItemTypeError("Item is not a weapon")
 
-    # Unequip current weapon if any
-    if "equipped_weapon" in character:
-        old_weapon = character["equipped_weapon"]
-        old_bonus = character.get("weapon_bonus", 0)
-        character["strength"] -= old_bonus
-        character.pop("equipped_weapon", None)
-        character["weapon_bonus"] = 0
-        add_item_to_inventory(character, old_weapon)
-
-    stat_name, value = parse_item_effect(item_data.get("effect", "strength:0"))
-    if stat_name == "strength":
-        character["strength"] += value
-        character["weapon_bonus"] = value
-    else:
-        # If effect isn't strength, still apply generic stat
-        apply_stat_effect(character, stat_name, value)
-
-    character["equipped_weapon"] = item_id
-    remove_item_from_inventory(character, item_id)
+    equip_item(character, item_id, item_data, "weapon")
     return f"Equipped weapon {item_id}."
 
 
@@ -198,6 +436,9 @@ def equip_armor(character, item_id, item_data):
     - Unequip current armor (remove bonus)
     - Add old armor back to inventory
     
+    Equivalent to equip_item(..., slot="armor"); also keeps
+    equipped_armor and armor_bonus (max_health bonus) up to date.
+    
     Returns: String describing equipment change
     Raises:
         ItemNotFoundError if item not in inventory
@@ -209,28 +450,7 @@ def equip_armor(character, item_id, item_data):
     if item_data.get("type") != "armor":
         raise InvalidItemTypeError("Item is not armor")
 
-    # Unequip current armor if any
-    if "equipped_armor" in character:
-        old_armor = character["equipped_armor"]
-        old_bonus = character.get("armor_bonus", 0)
-        character["max_health"] -= old_bonus
-        if character["health"] > character["max_health"]:
-            character["health"] = character["max_health"]
-        character.pop("equipped_armor", None)
-        character["armor_bonus"] = 0
-        add_item_to_inventory(character, old_armor)
-
-    stat_name, value = parse_item_effect(item_data.get("effect", "max_health:0"))
-    if stat_name == "max_health":
-        character["max_health"] += value
-        character["armor_bonus"] = value
-        if character["health"] > character["max_health"]:
-            character["health"] = character["max_health"]
-    else:
-        apply_stat_effect(character, stat_name, value)
-
-    character["equipped_armor"] = item_id
-    remove_item_from_inventory(character, item_id)
+    equip_item(character, item_id, item_data, "armor")
     return f"Equipped armor {item_id}."
 
 
@@ -241,19 +461,7 @@ def unequip_weapon(character):
     Returns: Item ID that was unequipped, or None if no weapon equipped
     Raises: InventoryFullError if inventory is full
     """
-    if "equipped_weapon" not in character:
-        return None
-
-    if len(character.get("inventory", [])) >= MAX_INVENTORY_SIZE:
-        raise InventoryFullError("Inventory is full")
-
-    item_id = character["equipped_weapon"]
-    bonus = character.get("weapon_bonus", 0)
-    character["strength"] -= bonus
-    character.pop("equipped_weapon", None)
-    character["weapon_bonus"] = 0
-    add_item_to_inventory(character, item_id)
-    return item_id
+    return unequip_item(character, "weapon")
 
 
 def unequip_armor(character):
@@ -263,23 +471,156 @@ def unequip_armor(character):
     Returns: Item ID that was unequipped, or None if no armor equipped
     Raises: InventoryFullError if inventory is full
     """
-    if "equipped_armor" not in character:
+    return unequip_item(character, "armor")
+
+# ============================================================================
+# EQUIPMENT SLOTS
+# ============================================================================
+
+# character["equipment"] maps slot name -> item_id for any set of slots
+# (weapon, offhand, armor, helmet, boots, ring1, ...). The effects each
+# slot contributes are kept in character["equipment_effects"], so
+# equipping or unequipping adds or subtracts just that item's effects
+# from stat_modifiers (see EFFECTIVE STATS) without visiting other slots.
+
+# Slots mirrored into the older single-slot keys:
+# slot -> (item key, bonus key, stat counted in the bonus)
+LEGACY_SLOT_KEYS = {
+    "weapon": ("equipped_weapon", "weapon_bonus", "strength"),
+    "armor": ("equipped_armor", "armor_bonus", "max_health"),
+}
+
+
+def get_item_slot(item_data):
+    """
+    Get the equipment slot an item goes in
+    
+    Returns: The item's 'slot', else its type's default slot, else None
+    """
+    slot = item_data.get("slot")
+    if slot:
+        return slot
+    return game_data.DEFAULT_ITEM_SLOTS.get(item_data.get("type")) or None
+
+
+def get_equipment(character):
+    """
+    Get a character's slot -> item_id map
+    
+    Characters equipped through the older equipped_weapon/weapon_bonus
+    keys (without an equipment map) are converted on first use.
+    
+    Returns: The character's equipment dictionary
+    """
+    equipment = character.get("equipment")
+    if equipment is not None:
+        return equipment
+
+    equipment = character["equipment"] = {}
+    effects = character["equipment_effects"] = {}
+    modifiers = character.setdefault("stat_modifiers", {})
+    for slot, (item_key, bonus_key, stat_name) in LEGACY_SLOT_KEYS.items():
+        if item_key in character:
+            bonus = character.get(bonus_key, 0)
+            equipment[slot] = character[item_key]
+            effects[slot] = ((stat_name, bonus),) if bonus else ()
+            # The bonus is already included in the top-level stat
+            if bonus:
+                modifiers[stat_name] = modifiers.get(stat_name, 0) + bonus
+    return equipment
+
+
+def equip_item(character, item_id, item_data, slot=None):
+    """
+    Equip an item in an equipment slot
+    
+    Whatever is in the slot is unequipped and returned to the inventory.
+    Effects on MODIFIABLE_STATS are applied as equipment modifiers and
+    taken off again on unequip. Any other effect (e.g. health) is applied
+    once, like a consumable, and stays when the item is removed.
+    
+    Args:
+        character: Character dictionary
+        item_id: Item to equip (must be in the inventory)
+        item_data: Item information dictionary
+        slot: Slot to use (default: get_item_slot(item_data)); e.g. "ring2"
+              for a second ring
+    
+    Returns: Item ID that was replaced, or None if the slot was empty
+    Raises:
+        ItemNotFoundError if item not in inventory
+        InvalidItemTypeError if the item has no slot (e.g. consumables)
+        ValueError if the item's effect string is malformed
+    """
+    if not has_item(character, item_id):
+        raise ItemNotFoundError(f"Item {item_id} not found")
+
+    if slot is None:
+        slot = get_item_slot(item_data)
+        if slot is None:
+            raise InvalidItemTypeError(f"Item {item_id} cannot be equipped")
+
+    legacy = LEGACY_SLOT_KEYS.get(slot)
+    effects = ()
+    if legacy or item_data.get("effects") is not None or item_data.get("effect"):
+        default_effect = f"{legacy[2]}:0" if legacy else ""
+        effects = tuple(get_item_effects(item_data, default_effect))
+
+    equipment = get_equipment(character)
+    # Take the new item out first, so a swap never overfills the inventory
+    remove_item_from_inventory(character, item_id)
+    replaced = equipment.get(slot)
+    if replaced is not None:
+        remove_slot_effects(character, slot)
+        add_item_to_inventory(character, replaced)
+
+    equipment[slot] = item_id
+    modifiers = tuple((stat, value) for stat, value in effects
+                      if stat in MODIFIABLE_STATS)
+    character["equipment_effects"][slot] = modifiers
+    for stat_name, value in modifiers:
+        add_stat_modifier(character, stat_name, value)
+    for stat_name, value in effects:
+        if stat_name not in MODIFIABLE_STATS:
+            apply_stat_effect(character, stat_name, value)
+    if legacy:
+        item_key, bonus_key, stat_name = legacy
+        character[item_key] = item_id
+        character[bonus_key] = sum(value for stat, value in effects if stat == stat_name)
+    return replaced
+
+
+def unequip_item(character, slot):
+    """
+    Remove the item in a slot and return it to the inventory
+    
+    Returns: Item ID that was unequipped, or None if the slot was empty
+    Raises: InventoryFullError if inventory is full
+    """
+    equipment = get_equipment(character)
+    item_id = equipment.get(slot)
+    if item_id is None:
         return None
 
     if len(character.get("inventory", [])) >= MAX_INVENTORY_SIZE:
         raise InventoryFullError("Inventory is full")
 
-    item_id = character["equipped_armor"]
-    bonus = character.get("armor_bonus", 0)
-    character["max_health"] -= bonus
-    if character["health"] > character["max_health"]:
-        character["health"] = character["max_health"]
-
-    character.pop("equipped_armor", None)
-    character["armor_bonus"] = 0
+    remove_slot_effects(character, slot)
     add_item_to_inventory(character, item_id)
     return item_id
 
+
+def remove_slot_effects(character, slot):
+    """Empty a slot and take its effects off the character's stats"""
+    del character["equipment"][slot]
+    for stat_name, value in character["equipment_effects"].pop(slot, ()):
+        add_stat_modifier(character, stat_name, -value)
+    legacy = LEGACY_SLOT_KEYS.get(slot)
+    if legacy:
+        item_key, bonus_key, _ = legacy
+        character.pop(item_key, None)
+        character[bonus_key] = 0
+
 # ============================================================================
 # SHOP SYSTEM
 # ============================================================================
@@ -330,6 +671,148 @@ def sell_item(character, item_id, item_data):
     character["gold"] = character.get("gold", 0) + sell_price
     return sell_price
 
+
+def purchase_items(character, basket, item_data_dict):
+    """
+    Purchase several items, with quantities, in one step
+    
+    Args:
+        character: Character dictionary
+        basket: Iterable of (item_id, quantity) pairs
+        item_data_dict: Dictionary of all item data (needs 'cost')
+    
+    Returns: Receipt (see build_receipt); gold is the total spent
+    Raises:
+        ItemNotFoundError if an item is not in item_data_dict
+        InsufficientResourcesError if the basket costs more than the gold held
+        InventoryFullError if the items don't all fit
+        (nothing is bought if any check fails)
+    """
+    receipt = build_receipt(basket, item_data_dict, lambda cost: cost)
+    if character.get("gold", 0) < receipt["total"]:
+        raise InsufficientResourcesError("Not enough gold")
+
+    tx = InventoryTransaction(character)
+    for line in receipt["lines"]:
+        tx.add(line["item_id"], line["quantity"])
+    tx.add_gold(-receipt["total"])
+    tx.commit()
+    receipt["gold_remaining"] = character["gold"]
+    return receipt
+
+
+def sell_items(character, basket, item_data_dict):
+    """
+    Sell several items, with quantities, for half their cost each
+    
+    Args:
+        character: Character dictionary
+        basket: Iterable of (item_id, quantity) pairs
+        item_data_dict: Dictionary of all item data (needs 'cost')
+    
+    Returns: Receipt (see build_receipt); gold is the total received
+    Raises: ItemNotFoundError if an item is unknown or not held in the
+            requested quantity (nothing is sold in that case)
+    """
+    receipt = build_receipt(basket, item_data_dict, lambda cost: cost // 2)
+    tx = InventoryTransaction(character)
+    for line in receipt["lines"]:
+        tx.remove(line["item_id"], line["quantity"])
+    tx.add_gold(receipt["total"])
+    tx.commit()
+    receipt["gold_remaining"] = character["gold"]
+    return receipt
+
+
+def build_receipt(basket, item_data_dict, unit_price):
+    """
+    Price a basket of items
+    
+    Args:
+        basket: Iterable of (item_id, quantity) pairs
+        item_data_dict: Dictionary of all item data
+        unit_price: Function mapping an item's cost to the price per unit
+    
+    Returns: Dictionary with 'lines' (one per basket entry: item_id, name,
+             quantity, unit_price, subtotal) and 'total'
+    Raises: ItemNotFoundError for unknown items, ValueError for
+            quantities below 1
+    """
+    lines = []
+    total = 0
+    for item_id, quantity in basket:
+        if quantity < 1:
+            raise ValueError("Quantity must be at least 1")
+        item_data = item_data_dict.get(item_id)
+        if item_data is None:
+            raise ItemNotFoundError(f"Unknown item {item_id}")
+        price = unit_price(item_data.get("cost", 0))
+        subtotal = price * quantity
+        lines.append({
+            "item_id": item_id,
+            "name": item_data.get("name", item_id),
+            "quantity": quantity,
+            "unit_price": price,
+            "subtotal": subtotal,
+        })
+        total += subtotal
+    return {"lines": lines, "total": total}
+
+# ============================================================================
+# EFFECTIVE STATS
+# ============================================================================
+
+# A character's top-level stats (character["strength"] etc.) are its
+# effective stats: base value plus equipment modifiers. They are kept up
+# to date incrementally whenever equipment changes, so combat code reads
+# them directly with nothing to recompute. The equipment share of each
+# stat is kept in character["stat_modifiers"], which gives back the base
+# value. Level ups and consumables change the top-level stat only, i.e.
+# they change the base.
+MODIFIABLE_STATS = ("max_health", "strength", "magic")
+
+
+def add_stat_modifier(character, stat_name, value):
+    """
+    Add an equipment modifier to a stat (negative to take one off)
+    
+    Updates both stat_modifiers and the effective top-level stat; health
+    is capped at the new max_health.
+    """
+    if not value:
+        return
+    modifiers = character.setdefault("stat_modifiers", {})
+    total = modifiers.get(stat_name, 0) + value
+    if total:
+        modifiers[stat_name] = total
+    else:
+        modifiers.pop(stat_name, None)
+
+    character[stat_name] = character.get(stat_name, 0) + value
+    if stat_name == "max_health" and character.get("health", 0) > character["max_health"]:
+        character["health"] = character["max_health"]
+
+
+def get_effective_stats(character):
+    """
+    Get a character's stats including equipment modifiers
+    
+    Returns: Dictionary {stat: value} for MODIFIABLE_STATS
+    """
+    return {stat: character.get(stat, 0) for stat in MODIFIABLE_STATS}
+
+
+def get_base_stats(character):
+    """
+    Get a character's stats without equipment modifiers
+    
+    Returns: Dictionary {stat: value} for MODIFIABLE_STATS
+    """
+    get_equipment(character)  # legacy weapon/armor bonuses become modifiers
+    modifiers = character.get("stat_modifiers", {})
+    return {stat: character.get(stat, 0) - modifiers.get(stat, 0)
+            for stat in MODIFIABLE_STATS}
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
@@ -353,6 +836,30 @@ def parse_item_effect(effect_string):
     return stat_name, value
 
 
+def get_item_effects(item_data, default_effect=""):
+    """
+    Get an item's effects as (stat_name, value) pairs
+    
+    Items loaded by game_data carry their effects pre-parsed under
+    'effects'; only item dicts built elsewhere fall back to parsing the
+    'effect' string.
+    
+    Args:
+        item_data: Item information dictionary
+        default_effect: Effect string to use if the item has none
+    
+    Returns: Tuple of (stat_name, value) tuples
+    Raises: ValueError if the effect string is malformed
+    """
+    effects = item_data.get("effects")
+    if effects is not None:
+        return effects
+    try:
+        return game_data.parse_effect_string(item_data.get("effect", default_effect))
+    except InvalidDataFormatError as e:
+        raise ValueError("Invalid effect string") from e
+
+
 def apply_stat_effect(character, stat_name, value):
     """
     Apply a stat modification to character
@@ -394,11 +901,15 @@ def display_inventory(character, item_data_dict):
         print("(empty)")
         return
 
-    counted = {}
-    for item_id in inventory:
-        counted[item_id] = counted.get(item_id, 0) + 1
+    if isinstance(inventory, StackedInventory):
+        counted = inventory.stacks()
+    else:
+        counted = {}
+        for item_id in inventory:
+            counted[item_id] = counted.get(item_id, 0) + 1
+        counted = counted.items()
 
-    for item_id, qty in counted.items():
+    for item_id, qty in counted:
         data = item_data_dict.get(item_id, {})
         name = data.get("name", item_id)
         item_type = data.get("type", "unknown")
@@ -0,0 +1,773 @@
+"""
+Test Character Persistence
+Tests saving, loading and bulk character features of character_manager
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+from custom_exceptions import (
+    CharacterNotFoundError, InvalidSaveDataError, CharacterDeadError
+)
+
+# ============================================================================
+# ATOMIC SAVE TESTS
+# ============================================================================
+
+def test_save_is_atomic_when_rename_fails(tmp_path, monkeypatch):
+    """Test that a failed save leaves the previous save intact"""
+    save_dir = str(tmp_path)
+    char = character_manager.create_character("Atomic", "Warrior")
+    character_manager.save_character(char, save_dir)
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    char["gold"] = 999
+    monkeypatch.setattr(character_manager.os, "replace", failing_replace)
+    with pytest.raises(OSError):
+        character_manager.save_character(char, save_dir)
+    monkeypatch.undo()
+
+    assert os.listdir(save_dir) == ["Atomic_save.txt"]
+    assert character_manager.load_character("Atomic", save_dir)["gold"] == 100
+
+def test_save_without_fsync(tmp_path):
+    """Test that the fsync knob can be turned off per call"""
+    char = character_manager.create_character("NoSync", "Mage")
+    assert character_manager.save_character(char, str(tmp_path), fsync=False)
+    assert character_manager.load_character("NoSync", str(tmp_path)) == char
+
+def test_group_commit(tmp_path):
+    """Test that a group commit saves every staged character once"""
+    save_dir = str(tmp_path)
+    first = character_manager.create_character("GroupA", "Rogue")
+    second = character_manager.create_character("GroupB", "Cleric")
+
+    with character_manager.GroupCommit(save_dir) as group:
+        group.add(first)
+        first["gold"] = 5
+        group.add(first)
+        group.add(second)
+
+    assert sorted(os.listdir(save_dir)) == ["GroupA_save.txt", "GroupB_save.txt"]
+    assert character_manager.load_character("GroupA", save_dir)["gold"] == 5
+    assert character_manager.load_character("GroupB", save_dir) == second
+    assert group.commit() == 0
+
+def test_group_commit_writes_everything_before_syncing(tmp_path, monkeypatch):
+    """Test that no temp file is synced until all of them are written"""
+    save_dir = str(tmp_path)
+    temp_counts = []
+    fsync = os.fsync
+
+    def recording_fsync(fd):
+        temp_counts.append(sum(name.endswith(".tmp") for name in os.listdir(save_dir)))
+        fsync(fd)
+
+    monkeypatch.setattr(character_manager.os, "fsync", recording_fsync)
+    with character_manager.GroupCommit(save_dir, fsync=True) as group:
+        for i in range(3):
+            group.add(character_manager.create_character(f"Synced{i}", "Rogue"))
+
+    # Three file syncs with every temp file present, then one directory sync
+    assert temp_counts == [3, 3, 3, 0]
+    assert len(character_manager.list_saved_characters(save_dir)) == 3
+
+# ============================================================================
+# STORAGE BACKEND TESTS
+# ============================================================================
+
+@pytest.fixture(params=["text", "sqlite"])
+def backend(request, tmp_path):
+    """Each storage backend, backed by a temporary location"""
+    if request.param == "text":
+        store = character_manager.TextSaveBackend(str(tmp_path / "saves"))
+    else:
+        store = character_manager.SQLiteSaveBackend(str(tmp_path / "saves.db"))
+    yield store
+    store.close()
+
+def test_backend_round_trip(backend):
+    """Test save/load/list/delete through the module functions"""
+    char = character_manager.create_character("Backend", "Warrior")
+    char["inventory"] = ["health_potion", "iron_sword"]
+
+    assert character_manager.save_character(char, backend=backend)
+    assert character_manager.load_character("Backend", backend=backend) == char
+    assert character_manager.list_saved_characters(backend=backend) == ["Backend"]
+
+    assert character_manager.delete_character("Backend", backend=backend)
+    with pytest.raises(CharacterNotFoundError):
+        character_manager.load_character("Backend", backend=backend)
+    with pytest.raises(CharacterNotFoundError):
+        character_manager.delete_character("Backend", backend=backend)
+
+def test_backend_bulk_operations(backend):
+    """Test save_many/load_many"""
+    chars = [character_manager.create_character(f"Bulk{i}", "Mage")
+             for i in range(5)]
+
+    assert backend.save_many(chars) == 5
+    loaded = backend.load_many(["Bulk0", "Bulk3", "Missing"])
+    assert sorted(loaded) == ["Bulk0", "Bulk3"]
+    assert loaded["Bulk3"] == chars[3]
+    assert sorted(backend.list_names()) == [f"Bulk{i}" for i in range(5)]
+
+def test_backend_listing_filters_and_pages(backend):
+    """Test that list_saved_characters passes prefix/sort/paging to backends"""
+    for name in ("Alice", "Albert", "Bob", "Alfred"):
+        character_manager.save_character(
+            character_manager.create_character(name, "Warrior"), backend=backend)
+
+    def listed(**kwargs):
+        return character_manager.list_saved_characters(backend=backend, **kwargs)
+
+    assert listed() == ["Albert", "Alfred", "Alice", "Bob"]
+    assert listed(prefix="Al") == ["Albert", "Alfred", "Alice"]
+    assert listed(prefix="Al", limit=1) == ["Albert"]
+    assert listed(prefix="Al", offset=1, limit=1) == ["Alfred"]
+    assert listed(offset=3) == ["Bob"]
+    with pytest.raises(ValueError):
+        listed(sort_by="size")
+
+    if isinstance(backend, character_manager.SQLiteSaveBackend):
+        character_manager.save_character(
+            character_manager.create_character("Albert", "Mage"), backend=backend)
+        assert listed(sort_by="modified") == ["Albert", "Alfred", "Bob", "Alice"]
+        assert listed(sort_by="modified", prefix="Ali") == ["Alice"]
+
+def test_sqlite_save_many_is_transactional(tmp_path):
+    """Test that a failing bulk save writes nothing"""
+    store = character_manager.SQLiteSaveBackend(str(tmp_path / "saves.db"))
+    good = character_manager.create_character("Good", "Rogue")
+    bad = {"name": "Bad"}
+
+    with pytest.raises(KeyError):
+        store.save_many([good, bad])
+    assert store.list_names() == []
+    store.close()
+
+# ============================================================================
+# SAVE MANIFEST TESTS
+# ============================================================================
+
+def no_scandir(path):
+    raise AssertionError("directory was scanned")
+
+def test_manifest_tracks_saves_without_rescanning(tmp_path, monkeypatch):
+    """Test that saves and deletes update the manifest in place"""
+    save_dir = str(tmp_path / "saves")
+    for name in ("Alice", "Albert", "Bob"):
+        character_manager.save_character(
+            character_manager.create_character(name, "Warrior"), save_dir)
+    assert character_manager.list_saved_characters(save_dir) == [
+        "Albert", "Alice", "Bob"]
+
+    monkeypatch.setattr(character_manager.os, "scandir", no_scandir)
+    character_manager.save_character(
+        character_manager.create_character("Alfred", "Mage"), save_dir)
+    character_manager.delete_character("Bob", save_dir)
+
+    assert character_manager.character_exists("Alfred", save_dir)
+    assert not character_manager.character_exists("Bob", save_dir)
+    assert character_manager.list_saved_characters(save_dir, prefix="Al") == [
+        "Albert", "Alfred", "Alice"]
+    assert character_manager.list_saved_characters(
+        save_dir, prefix="Al", offset=1, limit=1) == ["Alfred"]
+    assert character_manager.list_saved_characters(
+        save_dir, sort_by="modified")[0] == "Alfred"
+
+def test_manifest_rebuilt_after_external_change(tmp_path):
+    """Test that files added behind the manifest's back are picked up"""
+    save_dir = str(tmp_path / "saves")
+    character_manager.save_character(
+        character_manager.create_character("Inside", "Rogue"), save_dir)
+    assert character_manager.list_saved_characters(save_dir) == ["Inside"]
+
+    with open(os.path.join(save_dir, "Outside_save.txt"), "w") as f:
+        f.write("NAME: Outside\n")
+    stat = os.stat(save_dir)
+    os.utime(save_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert character_manager.list_saved_characters(save_dir) == ["Inside", "Outside"]
+
+def test_manifest_file_reused_by_new_process(tmp_path, monkeypatch):
+    """Test that a stored manifest avoids a directory scan"""
+    save_dir = str(tmp_path / "saves")
+    character_manager.save_character(
+        character_manager.create_character("Stored", "Cleric"), save_dir)
+    manifest = character_manager.get_save_manifest(save_dir)
+    character_manager.save_character(
+        character_manager.create_character("Later", "Cleric"), save_dir)
+    assert manifest.flush()
+
+    monkeypatch.setattr(character_manager.os, "scandir", no_scandir)
+    fresh = character_manager.SaveManifest(save_dir)
+    assert fresh.names() == ["Later", "Stored"]
+
+def test_list_saved_characters_missing_directory(tmp_path):
+    """Test that a missing save directory lists no characters"""
+    assert character_manager.list_saved_characters(str(tmp_path / "none")) == []
+
+# ============================================================================
+# DELTA SAVE TESTS
+# ============================================================================
+
+def test_delta_save_appends_changed_fields(tmp_path):
+    """Test that a delta save only journals the fields that changed"""
+    save_dir = str(tmp_path)
+    char = character_manager.create_character("Delta", "Warrior")
+    character_manager.save_character(char, save_dir, delta=True)
+    snapshot = open(os.path.join(save_dir, "Delta_save.txt")).read()
+
+    char["gold"] = 150
+    character_manager.save_character(char, save_dir, delta=True)
+    character_manager.save_character(char, save_dir, delta=True)  # no change
+    char["inventory"].append("health_potion")
+    character_manager.save_character(char, save_dir, delta=True)
+
+    journal_path = character_manager.get_journal_path("Delta", save_dir)
+    journal = open(journal_path).read()
+    assert journal.count("END") == 2
+    assert "GOLD: 150" in journal and "LEVEL" not in journal
+    assert open(os.path.join(save_dir, "Delta_save.txt")).read() == snapshot
+
+    loaded = character_manager.load_character("Delta", save_dir)
+    assert loaded == char
+
+def test_delta_journal_compaction(tmp_path, monkeypatch):
+    """Test that the journal is folded into a new snapshot"""
+    save_dir = str(tmp_path)
+    monkeypatch.setattr(character_manager, "JOURNAL_COMPACT_ENTRIES", 3)
+    char = character_manager.create_character("Compact", "Mage")
+    journal_path = character_manager.get_journal_path("Compact", save_dir)
+
+    for gold in range(1, 5):
+        char["gold"] = gold
+        character_manager.save_character(char, save_dir, delta=True)
+    assert open(journal_path).read().count("END") == 3
+
+    char["gold"] = 99
+    character_manager.save_character(char, save_dir, delta=True)
+    assert not os.path.exists(journal_path)
+    assert character_manager.load_character("Compact", save_dir)["gold"] == 99
+
+def test_delta_partial_entry_ignored(tmp_path):
+    """Test that an incomplete journal entry is not replayed"""
+    save_dir = str(tmp_path)
+    char = character_manager.create_character("Partial", "Rogue")
+    character_manager.save_character(char, save_dir, delta=True)
+    char["gold"] = 7
+    character_manager.save_character(char, save_dir, delta=True)
+
+    journal_path = character_manager.get_journal_path("Partial", save_dir)
+    save_id = open(journal_path).readline().split(":")[1].strip()
+    with open(journal_path, "a") as f:
+        f.write(f"ENTRY: {save_id}\nGOLD: 1000\n")
+
+    assert character_manager.load_character("Partial", save_dir)["gold"] == 7
+
+def test_delta_append_after_torn_entry(tmp_path):
+    """Test that a torn entry is dropped before the next append"""
+    save_dir = str(tmp_path)
+    char = character_manager.create_character("Torn", "Rogue")
+    character_manager.save_character(char, save_dir, delta=True)
+    char["gold"] = 7
+    character_manager.save_character(char, save_dir, delta=True)
+
+    # Crash mid-append: the entry stops partway through its END line
+    journal_path = character_manager.get_journal_path("Torn", save_dir)
+    save_id = open(journal_path).readline().split(":")[1].strip()
+    with open(journal_path, "a") as f:
+        f.write(f"ENTRY: {save_id}\nGOLD: 500\nLEVEL: 9\nE")
+
+    # A restarted process loads the character and saves again
+    with character_manager._saved_states_lock:
+        character_manager._saved_states.clear()
+    loaded = character_manager.load_character("Torn", save_dir)
+    assert loaded["gold"] == 7
+    loaded["magic"] = 42
+    character_manager.save_character(loaded, save_dir, delta=True)
+
+    reloaded = character_manager.load_character("Torn", save_dir)
+    assert reloaded == loaded
+    assert reloaded["gold"] == 7 and reloaded["level"] == 1
+    assert "GOLD: 500" not in open(journal_path).read()
+
+def test_delta_saves_of_different_characters_overlap(tmp_path, monkeypatch):
+    """Test that a slow delta save does not hold up other characters"""
+    import threading
+    save_dir = str(tmp_path)
+    started, release = threading.Event(), threading.Event()
+    write_save_file = character_manager.write_save_file
+
+    def stall_slow(path, text, fsync):
+        if "Slow" in path:
+            started.set()
+            release.wait(5)
+        write_save_file(path, text, fsync)
+
+    def save(name):
+        character = character_manager.create_character(name, "Mage")
+        return threading.Thread(target=character_manager.save_character,
+                                args=(character, save_dir), kwargs={"delta": True})
+
+    monkeypatch.setattr(character_manager, "write_save_file", stall_slow)
+    slow, fast = save("Slow"), save("Fast")
+    slow.start()
+    try:
+        assert started.wait(5)
+        fast.start()
+        fast.join(2)
+        assert not fast.is_alive()
+    finally:
+        release.set()
+        slow.join()
+        fast.join()
+    assert character_manager.list_saved_characters(save_dir) == ["Fast", "Slow"]
+
+def test_full_save_discards_journal(tmp_path):
+    """Test that a normal save replaces delta-mode state"""
+    save_dir = str(tmp_path)
+    char = character_manager.create_character("Mixed", "Cleric")
+    character_manager.save_character(char, save_dir, delta=True)
+    char["gold"] = 1
+    character_manager.save_character(char, save_dir, delta=True)
+
+    char["gold"] = 2
+    character_manager.save_character(char, save_dir)
+    assert not os.path.exists(character_manager.get_journal_path("Mixed", save_dir))
+    assert character_manager.load_character("Mixed", save_dir)["gold"] == 2
+
+    character_manager.delete_character("Mixed", save_dir)
+    assert os.listdir(save_dir) == []
+
+# ============================================================================
+# WRITE-BEHIND QUEUE TESTS
+# ============================================================================
+
+def test_save_queue_coalesces_and_flushes(tmp_path):
+    """Test that repeated saves of one character are written once"""
+    save_dir = str(tmp_path)
+    queue = character_manager.SaveQueue(save_dir, flush_interval=60)
+    char = character_manager.create_character("Queued", "Warrior")
+
+    for gold in (10, 20, 30):
+        char["gold"] = gold
+        queue.enqueue(char)
+    char["gold"] = 999   # changed after enqueue: not part of the save
+
+    assert queue.depth == 1
+    assert queue.flush() == 1
+    assert character_manager.load_character("Queued", save_dir)["gold"] == 30
+
+    stats = queue.metrics()
+    assert stats["enqueued"] == 3
+    assert stats["coalesced"] == 2
+    assert stats["written"] == 1
+    assert stats["queue_depth"] == 0
+    queue.close()
+
+def test_save_queue_drains_on_close(tmp_path):
+    """Test that close() writes everything still queued"""
+    save_dir = str(tmp_path)
+    with character_manager.SaveQueue(save_dir, flush_interval=60) as queue:
+        for i in range(3):
+            queue.enqueue(character_manager.create_character(f"Drain{i}", "Mage"))
+
+    assert sorted(character_manager.list_saved_characters(save_dir)) == [
+        "Drain0", "Drain1", "Drain2"]
+    with pytest.raises(RuntimeError):
+        queue.enqueue(character_manager.create_character("Late", "Mage"))
+
+def test_save_queue_background_flush(tmp_path):
+    """Test that the worker flushes when max_pending is reached"""
+    import time
+
+    save_dir = str(tmp_path)
+    queue = character_manager.SaveQueue(save_dir, flush_interval=60, max_pending=2)
+    queue.enqueue(character_manager.create_character("BgA", "Rogue"))
+    queue.enqueue(character_manager.create_character("BgB", "Rogue"))
+
+    deadline = time.time() + 5
+    while queue.metrics()["written"] < 2 and time.time() < deadline:
+        time.sleep(0.01)
+    assert queue.metrics()["written"] == 2
+    queue.close()
+
+def test_save_queue_keeps_failed_saves(tmp_path, monkeypatch):
+    """Test that a failed batch stays queued and is reported"""
+    queue = character_manager.SaveQueue(str(tmp_path), flush_interval=60)
+    queue.enqueue(character_manager.create_character("Retry", "Cleric"))
+
+    def failing_commit(self):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(character_manager.GroupCommit, "commit", failing_commit)
+    with pytest.raises(OSError):
+        queue.flush()
+    assert queue.depth == 1
+    assert isinstance(queue.metrics()["last_error"], OSError)
+
+    monkeypatch.undo()
+    queue.close()
+    assert character_manager.load_character("Retry", str(tmp_path))["name"] == "Retry"
+
+def test_save_queue_backs_off_after_failure():
+    """Test that a failing backend with a full queue is not retried in a loop"""
+    import time
+
+    class FailingBackend:
+        calls = 0
+
+        def save_many(self, characters):
+            self.calls += 1
+            raise OSError("backend down")
+
+    backend = FailingBackend()
+    queue = character_manager.SaveQueue(flush_interval=0.2, max_pending=2,
+                                        backend=backend)
+    queue.enqueue(character_manager.create_character("DownA", "Mage"))
+    queue.enqueue(character_manager.create_character("DownB", "Mage"))
+    time.sleep(0.5)
+    assert 1 <= backend.calls <= 4
+    assert queue.depth == 2
+
+    with pytest.raises(OSError):
+        queue.close()
+    with pytest.raises(OSError):
+        queue.close()   # a second close retries instead of failing oddly
+    assert backend.calls <= 6
+
+def test_save_queue_drains_at_exit(tmp_path):
+    """Test that a queue nobody closed is still written when the process exits"""
+    import subprocess
+    save_dir = str(tmp_path)
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    script = (
+        "import character_manager\n"
+        f"queue = character_manager.SaveQueue({save_dir!r}, flush_interval=60)\n"
+        "queue.enqueue(character_manager.create_character('Forgotten', 'Rogue'))\n"
+    )
+    subprocess.run([sys.executable, "-c", script], cwd=root, check=True)
+    assert character_manager.load_character("Forgotten", save_dir)["name"] == "Forgotten"
+
+# ============================================================================
+# BINARY SAVE FORMAT TESTS
+# ============================================================================
+
+def make_binary_test_character():
+    char = character_manager.create_character("Binary", "Rogue")
+    char["gold"] = 123456
+    char["inventory"] = ["health_potion", "health_potion", "iron_sword"]
+    char["active_quests"] = ["goblin_camp"]
+    char["completed_quests"] = ["first_steps", "rat_problem"]
+    return char
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_binary_save_round_trip(tmp_path, monkeypatch, compress):
+    """Test that binary saves load back through load_character"""
+    monkeypatch.setattr(character_manager, "BINARY_SAVE_COMPRESS", compress)
+    save_dir = str(tmp_path)
+    char = make_binary_test_character()
+
+    character_manager.save_character(char, save_dir, save_format="binary")
+    with open(character_manager.get_save_path("Binary", save_dir), "rb") as f:
+        assert f.read().startswith(character_manager.BINARY_SAVE_MAGIC)
+
+    assert character_manager.load_character("Binary", save_dir) == char
+    assert character_manager.list_saved_characters(save_dir) == ["Binary"]
+
+def test_binary_save_is_smaller_than_text():
+    """Test that the binary encoding shares repeated IDs"""
+    char = make_binary_test_character()
+    binary = character_manager.encode_binary_save(char)
+    text = character_manager.format_character_save(char)
+    assert len(binary) < len(text.encode("utf-8"))
+    assert character_manager.decode_binary_save(binary) == char
+
+def test_binary_save_negative_values_and_unknown_fields():
+    """Test zigzag integers and that unknown field tags are skipped"""
+    char = make_binary_test_character()
+    char["gold"] = -5
+    data = bytearray(character_manager.encode_binary_save(char))
+    # Append a field from a hypothetical newer writer: tag 99, 3 bytes
+    data += bytes((99, 3)) + b"xyz"
+    assert character_manager.decode_binary_save(bytes(data)) == char
+
+def test_binary_save_rejects_bad_data(tmp_path):
+    """Test that corrupted or too-new binary saves are rejected"""
+    char = make_binary_test_character()
+    data = character_manager.encode_binary_save(char)
+    magic = character_manager.BINARY_SAVE_MAGIC
+
+    with pytest.raises(InvalidSaveDataError):
+        character_manager.decode_binary_save(data[:-4])
+    with pytest.raises(InvalidSaveDataError):
+        character_manager.decode_binary_save(magic + bytes((99, 0)) + data[len(magic) + 2:])
+
+    path = character_manager.get_save_path("Binary", str(tmp_path))
+    with open(path, "wb") as f:
+        f.write(data[:-4])
+    with pytest.raises(InvalidSaveDataError):
+        character_manager.load_character("Binary", str(tmp_path))
+
+def test_group_commit_binary_format(tmp_path):
+    """Test that group commits can write binary saves"""
+    save_dir = str(tmp_path)
+    char = make_binary_test_character()
+    with character_manager.GroupCommit(save_dir, save_format="binary") as group:
+        group.add(char)
+    assert character_manager.load_character("Binary", save_dir) == char
+
+# ============================================================================
+# BULK LOAD / SAVE TESTS
+# ============================================================================
+
+def test_save_and_load_characters_in_bulk(tmp_path, monkeypatch):
+    """Test bulk saves and loads, including manifest updates"""
+    save_dir = str(tmp_path / "saves")
+    os.makedirs(save_dir)
+    character_manager.list_saved_characters(save_dir)   # build the manifest
+    chars = [character_manager.create_character(f"Bulk{i}", "Mage") for i in range(20)]
+
+    results = list(character_manager.save_characters(chars, save_dir, workers=4))
+    assert sorted(name for name, _, _ in results) == sorted(c["name"] for c in chars)
+    assert all(ok and error is None for _, ok, error in results)
+
+    monkeypatch.setattr(character_manager.os, "scandir", no_scandir)
+    assert len(character_manager.list_saved_characters(save_dir)) == 20
+
+    loaded = {name: char for name, char, error in
+              character_manager.load_characters([c["name"] for c in chars],
+                                                save_dir, workers=4)}
+    assert loaded == {c["name"]: c for c in chars}
+
+def test_save_characters_runs_without_reading_results(tmp_path):
+    """Test that saves happen even if the results are never (fully) read"""
+    import time
+
+    save_dir = str(tmp_path / "saves")
+    os.makedirs(save_dir)
+    character_manager.list_saved_characters(save_dir)   # build the manifest
+    chars = [character_manager.create_character(f"Eager{i}", "Rogue") for i in range(12)]
+
+    results = character_manager.save_characters(chars[:6], save_dir, workers=2)
+    next(results)
+    del results                                         # stop reading early
+    character_manager.save_characters(chars[6:], save_dir, workers=2)  # never read
+
+    deadline = time.time() + 5
+    while (len(character_manager.list_saved_characters(save_dir)) < 12
+           and time.time() < deadline):
+        time.sleep(0.01)
+    assert character_manager.list_saved_characters(save_dir) == sorted(
+        c["name"] for c in chars)
+
+def test_load_characters_reports_errors_without_aborting(tmp_path):
+    """Test that missing and corrupted saves are reported per character"""
+    save_dir = str(tmp_path)
+    character_manager.save_character(
+        character_manager.create_character("Good", "Cleric"), save_dir)
+    with open(character_manager.get_save_path("Broken", save_dir), "w") as f:
+        f.write("NAME: Broken\nLEVEL: not_a_number\n")
+
+    results = {name: (char, error) for name, char, error in
+               character_manager.load_characters(["Good", "Missing", "Broken"],
+                                                 save_dir, workers=2)}
+    assert results["Good"][0]["name"] == "Good"
+    assert isinstance(results["Missing"][1], CharacterNotFoundError)
+    assert isinstance(results["Broken"][1], InvalidSaveDataError)
+    assert results["Missing"][0] is None
+
+def test_bulk_operations_with_backend(backend):
+    """Test that the bulk functions go through a storage backend"""
+    chars = [character_manager.create_character(f"Bk{i}", "Rogue") for i in range(5)]
+    saved = list(character_manager.save_characters(chars, workers=2, backend=backend))
+    assert len(saved) == 5 and all(error is None for _, _, error in saved)
+
+    loaded = list(character_manager.load_characters(["Bk0", "Bk4", "Nobody"],
+                                                    workers=2, backend=backend))
+    errors = {name: error for name, _, error in loaded}
+    assert errors["Bk0"] is None and errors["Bk4"] is None
+    assert isinstance(errors["Nobody"], CharacterNotFoundError)
+
+# ============================================================================
+# SLOTTED CHARACTER TESTS
+# ============================================================================
+
+def test_compact_character_behaves_like_dict():
+    """Test that Character supports the dictionary interface"""
+    char = character_manager.create_character("Slim", "Warrior", compact=True)
+    plain = character_manager.create_character("Slim", "Warrior")
+
+    assert isinstance(char, character_manager.Character)
+    assert char == plain
+    assert list(char) == list(plain)
+    assert len(char) == len(plain)
+    assert char["class"] == char.character_class == "Warrior"
+    assert char.get("missing", 7) == 7 and "missing" not in char
+
+    char["gold"] += 50
+    assert char.gold == 150
+    char["equipped_weapon"] = "iron_sword"   # not a fixed field
+    assert char["equipped_weapon"] == "iron_sword"
+    assert char.to_dict()["equipped_weapon"] == "iron_sword"
+
+    del char["magic"]
+    assert "magic" not in char
+    with pytest.raises(KeyError):
+        char["magic"]
+    with pytest.raises(AttributeError):
+        char.unknown_attribute = 1
+
+def test_compact_character_copy_and_pickle():
+    """Test that copies and pickles keep every field"""
+    import pickle
+
+    char = character_manager.create_character("Pickled", "Mage", compact=True)
+    char["weapon_bonus"] = 3
+    assert pickle.loads(pickle.dumps(char)) == char
+    clone = char.copy()
+    clone["gold"] = 0
+    assert char["gold"] == 100 and clone["weapon_bonus"] == 3
+
+def test_compact_character_save_load_and_operations(tmp_path):
+    """Test that Characters save, load, validate and level up"""
+    save_dir = str(tmp_path)
+    char = character_manager.create_character("Slot", "Cleric", compact=True)
+    character_manager.gain_experience(char, 250)
+    character_manager.add_gold(char, 25)
+    assert character_manager.validate_character_data(char)
+
+    character_manager.save_character(char, save_dir)
+    loaded = character_manager.load_character("Slot", save_dir, compact=True)
+    assert isinstance(loaded, character_manager.Character)
+    assert loaded == char
+    assert loaded.level == char["level"] > 1
+
+# ============================================================================
+# EXPERIENCE TESTS
+# ============================================================================
+
+def loop_gain_experience(character, xp_amount):
+    """The original one-level-at-a-time gain_experience, for comparison"""
+    character["experience"] += xp_amount
+    while character["experience"] >= character["level"] * 100:
+        character["experience"] -= character["level"] * 100
+        character["level"] += 1
+        character["max_health"] += 10
+        character["strength"] += 2
+        character["magic"] += 2
+        character["health"] = character["max_health"]
+
+@pytest.mark.parametrize("level", [1, 2, 7, 50, 333])
+def test_gain_experience_matches_level_loop(level):
+    """Test the closed-form level up against the original loop"""
+    amounts = list(range(0, 3000, 7)) + [99, 100, 199, 300, 10**5, 10**6 + 1,
+                                         level * 100 - 1, level * 100]
+    for xp in amounts:
+        for start_xp in (0, 42, level * 100 - 1):
+            fast = character_manager.create_character("Fast", "Mage")
+            fast.update(level=level, experience=start_xp, health=5)
+            slow = dict(fast)
+            if xp > 0:
+                loop_gain_experience(slow, xp)
+            character_manager.gain_experience(fast, xp)
+            assert fast == slow, (level, start_xp, xp)
+
+def test_gain_experience_huge_grant():
+    """Test that a huge XP grant is applied without looping per level"""
+    char = character_manager.create_character("Admin", "Warrior")
+    character_manager.gain_experience(char, 10**15)
+    level = char["level"]
+    assert level > 4 * 10**6
+    assert 0 <= char["experience"] < level * 100
+    assert char["max_health"] == 120 + 10 * (level - 1)
+    assert char["health"] == char["max_health"]
+
+def test_gain_experience_batch():
+    """Test batch XP grants, including the all-or-nothing dead check"""
+    chars = [character_manager.create_character(f"B{i}", "Rogue") for i in range(3)]
+    assert character_manager.gain_experience_batch(chars, [50, 100, 1000]) == [0, 1, 4]
+    assert [c["level"] for c in chars] == [1, 2, 5]
+    assert character_manager.gain_experience_batch(chars, 0) == [0, 0, 0]
+
+    chars[1]["health"] = 0
+    before = [dict(c) for c in chars]
+    with pytest.raises(CharacterDeadError):
+        character_manager.gain_experience_batch(chars, 500)
+    assert [dict(c) for c in chars] == before
+
+    with pytest.raises(ValueError):
+        character_manager.gain_experience_batch(chars, [1, 2])
+
+# ============================================================================
+# CHARACTER POOL TESTS
+# ============================================================================
+
+def make_pool_population():
+    chars = []
+    for i, cls in enumerate(["Warrior", "Mage", "Rogue", "Cleric"] * 5):
+        char = character_manager.create_character(f"P{i}", cls)
+        char.update(level=1 + i * 3, experience=i * 37, gold=i * 10,
+                    health=(0 if i % 6 == 0 else char["health"] - i))
+        char["inventory"] = [f"item{i}"]
+        chars.append(char)
+    chars[3]["equipped_weapon"] = "iron_sword"
+    return chars
+
+def test_character_pool_round_trip():
+    """Test converting characters to a pool and back"""
+    pytest.importorskip("numpy")
+    chars = make_pool_population()
+    pool = character_manager.CharacterPool(chars)
+    assert len(pool) == len(chars)
+    assert pool.to_characters() == chars
+    assert pool.character("P3")["equipped_weapon"] == "iron_sword"
+    assert type(pool.character("P3")["gold"]) is int
+    with pytest.raises(CharacterNotFoundError):
+        pool.character("Nobody")
+
+def test_character_pool_matches_character_operations():
+    """Test vectorized operations against the per-character functions"""
+    pytest.importorskip("numpy")
+    chars = make_pool_population()
+    pool = character_manager.CharacterPool(chars)
+    xp = [(i * 977) % 5000 for i in range(len(chars))]
+
+    gained = pool.gain_experience(xp)
+    healed = pool.heal(25)
+    revived = pool.revive()
+    totals = pool.add_gold(5)
+
+    for i, char in enumerate(chars):
+        if character_manager.is_character_dead(char):
+            expected_gain = 0
+        else:
+            before = char["level"]
+            character_manager.gain_experience(char, xp[i])
+            expected_gain = char["level"] - before
+        assert gained[i] == expected_gain
+        assert healed[i] == character_manager.heal_character(char, 25)
+        assert revived[i] == character_manager.revive_character(char)
+        assert totals[i] == character_manager.add_gold(char, 5)
+    assert pool.to_characters() == chars
+    assert not pool.is_dead().any()
+
+def test_character_pool_gold_is_all_or_nothing():
+    """Test that a gold tax that would go negative changes nothing"""
+    pytest.importorskip("numpy")
+    pool = character_manager.CharacterPool(make_pool_population())
+    before = pool.columns["gold"].copy()
+    with pytest.raises(ValueError):
+        pool.add_gold(-50)
+    assert (pool.columns["gold"] == before).all()
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
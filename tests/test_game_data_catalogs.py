@@ -0,0 +1,545 @@
+"""
+Test Game Data Catalogs
+Tests catalog caching and loading features of game_data
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import game_data
+from custom_exceptions import InvalidDataFormatError
+
+QUEST_TEXT = (
+    "QUEST_ID: first_steps\n"
+    "TITLE: First Steps\n"
+    "DESCRIPTION: Begin\n"
+    "REWARD_XP: 50\n"
+    "REWARD_GOLD: 25\n"
+    "REQUIRED_LEVEL: 1\n"
+    "PREREQUISITE: NONE\n"
+    "\n"
+    "QUEST_ID: second_steps\n"
+    "TITLE: Second Steps\n"
+    "DESCRIPTION: Continue\n"
+    "REWARD_XP: 100\n"
+    "REWARD_GOLD: 40\n"
+    "REQUIRED_LEVEL: 2\n"
+    "PREREQUISITE: first_steps\n"
+)
+
+ITEM_TEXT = (
+    "ITEM_ID: health_potion\n"
+    "NAME: Health Potion\n"
+    "TYPE: consumable\n"
+    "EFFECT: health:20\n"
+    "COST: 25\n"
+    "DESCRIPTION: Heals\n"
+    "\n"
+    "ITEM_ID: iron_sword\n"
+    "NAME: Iron Sword\n"
+    "TYPE: weapon\n"
+    "EFFECT: strength:5\n"
+    "COST: 100\n"
+    "DESCRIPTION: Sharp\n"
+)
+
+
+def write_file(path, text):
+    with open(path, "w") as f:
+        f.write(text)
+    return str(path)
+
+# ============================================================================
+# COMPILED CACHE TESTS
+# ============================================================================
+
+def test_cache_is_written_and_reused(tmp_path):
+    """Test that a second load is served from the compiled cache"""
+    path = write_file(tmp_path / "quests.txt", QUEST_TEXT)
+
+    quests = game_data.load_quests(path)
+    assert os.path.exists(path + game_data.CACHE_SUFFIX)
+
+    cached = game_data.read_catalog_cache(path, game_data.QUEST_FIELDS)
+    assert cached == quests
+    assert game_data.load_quests(path) == quests
+    assert quests["second_steps"]["reward_xp"] == 100
+
+def test_cache_rebuilt_when_source_changes(tmp_path):
+    """Test that a stale cache is ignored and rebuilt"""
+    path = write_file(tmp_path / "items.txt", ITEM_TEXT)
+    game_data.load_items(path)
+
+    write_file(path, ITEM_TEXT.replace("COST: 100", "COST: 1234"))
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    items = game_data.load_items(path)
+    assert items["iron_sword"]["cost"] == 1234
+    cached = game_data.read_catalog_cache(path, game_data.ITEM_FIELDS)
+    assert cached["iron_sword"]["cost"] == 1234
+
+def test_corrupted_cache_falls_back_to_parsing(tmp_path):
+    """Test that an unreadable cache file is ignored"""
+    path = write_file(tmp_path / "items.txt", ITEM_TEXT)
+    expected = game_data.load_items(path, use_cache=False)
+    game_data.load_items(path)
+
+    with open(path + game_data.CACHE_SUFFIX, "r+b") as f:
+        f.seek(game_data._CACHE_HEADER.size)
+        f.write(b"\xff\xff\xff")
+
+    assert game_data.load_items(path) == expected
+
+def test_cache_not_written_for_invalid_data(tmp_path):
+    """Test that invalid files raise and leave no cache behind"""
+    path = write_file(tmp_path / "bad.txt", "not valid quest data\n")
+
+    with pytest.raises(InvalidDataFormatError):
+        game_data.load_quests(path)
+    assert not os.path.exists(path + game_data.CACHE_SUFFIX)
+
+# ============================================================================
+# STREAMING API TESTS
+# ============================================================================
+
+def test_iter_items_yields_records_in_order(tmp_path):
+    """Test that iter_items yields one validated item per block"""
+    path = write_file(tmp_path / "items.txt", ITEM_TEXT)
+
+    items = list(game_data.iter_items(path))
+    assert [item["item_id"] for item in items] == ["health_potion", "iron_sword"]
+    assert items[1]["cost"] == 100
+    assert game_data.load_items(path, use_cache=False) == {
+        item["item_id"]: item for item in items
+    }
+
+def test_iter_quests_is_lazy(tmp_path):
+    """Test that records before a bad block are yielded before the error"""
+    path = write_file(tmp_path / "quests.txt",
+                      QUEST_TEXT + "\nQUEST_ID: broken\nREWARD_XP: lots\n")
+
+    stream = game_data.iter_quests(path)
+    assert next(stream)["quest_id"] == "first_steps"
+    assert next(stream)["quest_id"] == "second_steps"
+    with pytest.raises(InvalidDataFormatError):
+        next(stream)
+
+def test_iter_quests_missing_file():
+    """Test that iterating a missing file raises MissingDataFileError"""
+    from custom_exceptions import MissingDataFileError
+
+    with pytest.raises(MissingDataFileError):
+        list(game_data.iter_quests("nonexistent_file.txt"))
+
+# ============================================================================
+# LAZY CATALOG TESTS
+# ============================================================================
+
+def test_lazy_catalog_parses_on_access(tmp_path):
+    """Test that LazyCatalog indexes all blocks but parses only on access"""
+    path = write_file(tmp_path / "items.txt", ITEM_TEXT)
+
+    with game_data.LazyCatalog(path, "item") as catalog:
+        assert len(catalog) == 2
+        assert "iron_sword" in catalog
+        assert catalog.parsed_count == 0
+
+        sword = catalog["iron_sword"]
+        assert sword["cost"] == 100
+        assert catalog.parsed_count == 1
+        assert catalog["iron_sword"] is sword
+
+        assert dict(catalog) == game_data.load_items(path, use_cache=False)
+
+def test_lazy_catalog_quests_and_missing_keys(tmp_path):
+    """Test quest catalogs and lookups of unknown IDs"""
+    path = write_file(tmp_path / "quests.txt", QUEST_TEXT)
+
+    catalog = game_data.LazyCatalog(path, "quest")
+    assert list(catalog) == ["first_steps", "second_steps"]
+    assert catalog.get("second_steps")["prerequisite"] == "first_steps"
+    assert catalog.get("unknown") is None
+    with pytest.raises(KeyError):
+        catalog["unknown"]
+    catalog.close()
+
+def test_lazy_catalog_block_without_id(tmp_path):
+    """Test that a block with no ID line is rejected while indexing"""
+    path = write_file(tmp_path / "items.txt", ITEM_TEXT + "\nNAME: Orphan\n")
+
+    with pytest.raises(InvalidDataFormatError):
+        game_data.LazyCatalog(path, "item")
+
+# ============================================================================
+# SHARDED CATALOG TESTS
+# ============================================================================
+
+def test_load_catalog_dir_merges_shards(tmp_path):
+    """Test that shards are merged the same serially and in a pool"""
+    game_data.write_synthetic_items(str(tmp_path / "a.txt"), 30, prefix="a")
+    game_data.write_synthetic_items(str(tmp_path / "b.txt"), 20, prefix="b")
+    write_file(tmp_path / "notes.md", "ignored")
+
+    serial = game_data.load_catalog_dir(str(tmp_path), "item", workers=1)
+    parallel = game_data.load_catalog_dir(str(tmp_path), "item", workers=2)
+
+    assert len(serial) == 50
+    assert parallel == serial
+    assert serial["b_3"]["item_id"] == "b_3"
+
+def test_load_catalog_dir_duplicate_ids(tmp_path):
+    """Test that an ID defined in two shards is rejected"""
+    write_file(tmp_path / "a.txt", ITEM_TEXT)
+    write_file(tmp_path / "b.txt", ITEM_TEXT)
+
+    with pytest.raises(InvalidDataFormatError):
+        game_data.load_catalog_dir(str(tmp_path), "item", workers=1)
+
+def test_load_catalog_dir_missing_directory():
+    """Test that a missing shard directory raises MissingDataFileError"""
+    from custom_exceptions import MissingDataFileError
+
+    with pytest.raises(MissingDataFileError):
+        game_data.load_catalog_dir("no_such_directory", "quest")
+
+# ============================================================================
+# HOT RELOAD TESTS
+# ============================================================================
+
+def touch_later(path):
+    """Bump a file's mtime so a change is always detected"""
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+def test_watcher_reports_added_removed_changed(tmp_path):
+    """Test that a reload reports per-ID differences"""
+    path = write_file(tmp_path / "quests.txt", QUEST_TEXT)
+    watcher = game_data.CatalogWatcher(path, "quest")
+    first = watcher.data["first_steps"]
+
+    assert watcher.check() is None
+
+    new_text = QUEST_TEXT.replace("REWARD_XP: 100", "REWARD_XP: 150")
+    new_text = new_text.replace("first_steps", "opening") + (
+        "\nQUEST_ID: extra\nTITLE: Extra\nDESCRIPTION: More\n"
+        "REWARD_XP: 1\nREWARD_GOLD: 1\nREQUIRED_LEVEL: 1\nPREREQUISITE: NONE\n"
+    )
+    write_file(path, new_text)
+    touch_later(path)
+
+    report = watcher.check()
+    assert report == {
+        "added": ["extra", "opening"],
+        "removed": ["first_steps"],
+        "changed": ["second_steps"],
+    }
+    assert watcher.data["second_steps"]["reward_xp"] == 150
+    assert "first_steps" not in watcher.data
+    assert first["quest_id"] == "first_steps"
+
+def test_watcher_reuses_unchanged_blocks(tmp_path):
+    """Test that unchanged blocks are not parsed again"""
+    path = write_file(tmp_path / "items.txt", ITEM_TEXT)
+    watcher = game_data.CatalogWatcher(path, "item")
+    potion = watcher.data["health_potion"]
+
+    write_file(path, ITEM_TEXT.replace("COST: 100", "COST: 90"))
+    touch_later(path)
+    report = watcher.check()
+
+    assert report["changed"] == ["iron_sword"]
+    assert watcher.data["health_potion"] is potion
+    assert watcher.data["iron_sword"]["cost"] == 90
+
+def test_watcher_keeps_old_data_on_invalid_file(tmp_path):
+    """Test that an invalid update leaves the current catalog in place"""
+    path = write_file(tmp_path / "items.txt", ITEM_TEXT)
+    reports = []
+    watcher = game_data.CatalogWatcher(path, "item", on_change=reports.append)
+    before = watcher.data
+
+    write_file(path, ITEM_TEXT.replace("TYPE: weapon", "TYPE: banana"))
+    touch_later(path)
+    with pytest.raises(InvalidDataFormatError):
+        watcher.check()
+
+    assert watcher.data is before
+    assert reports == []
+
+def test_watcher_thread_survives_callback_errors(tmp_path):
+    """Test that a failing on_change is recorded and polling continues"""
+    import time
+
+    path = write_file(tmp_path / "items.txt", ITEM_TEXT)
+    calls = []
+
+    def on_change(report):
+        calls.append(report)
+        if len(calls) == 1:
+            raise RuntimeError("callback failed")
+
+    watcher = game_data.CatalogWatcher(path, "item", on_change=on_change)
+    watcher.start(interval=0.01)
+    try:
+        for cost in (90, 80):
+            # Swap the file in whole so the poller never reads a partial write
+            staged = write_file(tmp_path / "staged.txt",
+                                ITEM_TEXT.replace("COST: 100", f"COST: {cost}"))
+            touch_later(staged)
+            os.replace(staged, path)
+            deadline = time.time() + 5
+            while watcher.data["iron_sword"]["cost"] != cost and time.time() < deadline:
+                time.sleep(0.01)
+            assert watcher.data["iron_sword"]["cost"] == cost
+    finally:
+        watcher.stop()
+    assert len(calls) == 2
+    assert watcher.last_error is None
+
+# ============================================================================
+# SCHEMA PARSER TESTS
+# ============================================================================
+
+def test_parse_item_block_converts_fields_once():
+    """Test that the schema parser converts and checks every field"""
+    item = game_data.parse_item_block(ITEM_TEXT.split("\n\n")[1].splitlines())
+
+    assert item == {
+        "item_id": "iron_sword", "name": "Iron Sword", "type": "weapon",
+        "effect": "strength:5", "cost": 100, "description": "Sharp",
+        "effects": (("strength", 5),), "slot": "weapon",
+    }
+
+def test_schema_parser_matches_legacy_parser():
+    """Test that the benchmark baseline parses the same items"""
+    for block in ITEM_TEXT.split("\n\n"):
+        lines = block.strip().splitlines()
+        assert game_data.parse_block(lines, game_data.ITEM_FIELD_TABLE, "item") == \
+            game_data.legacy_parse_item_block(lines)
+
+def test_parse_block_errors():
+    """Test the errors raised by the schema parser"""
+    lines = QUEST_TEXT.split("\n\n")[0].splitlines()
+
+    with pytest.raises(InvalidDataFormatError):
+        game_data.parse_quest_block(lines[:-1])
+    with pytest.raises(InvalidDataFormatError):
+        game_data.parse_quest_block(lines + ["no separator"])
+    with pytest.raises(InvalidDataFormatError):
+        game_data.parse_quest_block([l.replace(": 50", ": fifty") for l in lines])
+    with pytest.raises(InvalidDataFormatError):
+        game_data.parse_item_block(["TYPE: banana"])
+
+def test_parse_block_custom_schema():
+    """Test optional fields and case-insensitive keys"""
+    table = game_data.build_field_table((
+        ("ID", "id", None, True),
+        ("POWER", "power", int, False),
+    ))
+
+    assert game_data.parse_block(["id: a", "EXTRA: x"], table, "thing") == {"id": "a"}
+    assert game_data.parse_block(["ID: a", "POWER: 3"], table, "thing") == {
+        "id": "a", "power": 3,
+    }
+
+# ============================================================================
+# COMPACT RECORD TESTS
+# ============================================================================
+
+def test_compact_records_behave_like_dicts(tmp_path):
+    """Test that compact records support dict-style access"""
+    path = write_file(tmp_path / "items.txt", ITEM_TEXT)
+    items = game_data.load_items(path, compact=True)
+    plain = game_data.load_items(path)
+
+    sword = items["iron_sword"]
+    assert isinstance(sword, game_data.ItemRecord)
+    assert sword["cost"] == 100
+    assert sword.get("type") == "weapon"
+    assert sword.get("missing", "default") == "default"
+    assert "effect" in sword
+    assert sword == plain["iron_sword"]
+    assert sword.to_dict() == plain["iron_sword"]
+    assert sword.effects == (("strength", 5),)
+    assert not hasattr(sword, "__dict__")
+
+    with pytest.raises(KeyError):
+        sword["missing"]
+    with pytest.raises(AttributeError):
+        sword.cost = 1
+
+def test_compact_quests_work_with_quest_handler(tmp_path):
+    """Test that quest_handler accepts compact quest records"""
+    import character_manager
+    import quest_handler
+
+    path = write_file(tmp_path / "quests.txt", QUEST_TEXT)
+    quests = game_data.load_quests(path, compact=True)
+    char = character_manager.create_character("CompactTest", "Mage")
+
+    quest_handler.accept_quest(char, "first_steps", quests)
+    assert quest_handler.complete_quest(char, "first_steps", quests) == {
+        "xp": 50, "gold": 25,
+    }
+    assert quest_handler.get_quest_prerequisite_chain("second_steps", quests) == [
+        "first_steps", "second_steps",
+    ]
+
+def test_compact_records_share_interned_strings(tmp_path):
+    """Test that repeated strings are shared between records"""
+    path = write_file(tmp_path / "quests.txt", QUEST_TEXT)
+    quests = game_data.load_quests(path, compact=True)
+
+    assert quests["second_steps"]["prerequisite"] is quests["first_steps"]["quest_id"]
+
+# ============================================================================
+# PRE-PARSED EFFECT TESTS
+# ============================================================================
+
+def test_items_load_with_parsed_effects(tmp_path):
+    """Test that load_items stores effects as (stat, value) pairs"""
+    text = ITEM_TEXT.replace("EFFECT: strength:5", "EFFECT: strength:5, magic:-2")
+    path = write_file(tmp_path / "items.txt", text)
+
+    items = game_data.load_items(path)
+    assert items["health_potion"]["effects"] == (("health", 20),)
+    assert items["iron_sword"]["effects"] == (("strength", 5), ("magic", -2))
+    assert game_data.load_items(path) == items
+    assert game_data.load_items(path, compact=True)["iron_sword"].effects == (
+        ("strength", 5), ("magic", -2),
+    )
+
+def test_invalid_effect_rejected_at_load(tmp_path):
+    """Test that malformed effect strings fail when the file is loaded"""
+    path = write_file(tmp_path / "items.txt",
+                      ITEM_TEXT.replace("EFFECT: health:20", "EFFECT: health"))
+
+    with pytest.raises(InvalidDataFormatError):
+        game_data.load_items(path)
+
+def test_inventory_uses_parsed_effects(tmp_path):
+    """Test that inventory functions consume pre-parsed effects"""
+    import character_manager
+    import inventory_system
+
+    text = ITEM_TEXT.replace("EFFECT: strength:5", "EFFECT: strength:5,magic:3")
+    items = game_data.load_items(write_file(tmp_path / "items.txt", text))
+    char = character_manager.create_character("EffectTest", "Warrior")
+    strength, magic = char["strength"], char["magic"]
+
+    # A stale effect string shows that the parsed effects are used
+    sword = dict(items["iron_sword"], effect="broken")
+    inventory_system.add_item_to_inventory(char, "iron_sword")
+    inventory_system.equip_weapon(char, "iron_sword", sword)
+
+    assert char["strength"] == strength + 5
+    assert char["weapon_bonus"] == 5
+    assert char["magic"] == magic + 3
+
+# ============================================================================
+# VALIDATION REPORT TESTS
+# ============================================================================
+
+def test_validation_report_clean_file(tmp_path):
+    """Test the report for a valid file"""
+    path = write_file(tmp_path / "quests.txt", QUEST_TEXT)
+
+    report = game_data.validate_catalog_file(path, "quest")
+    assert report["valid"] is True
+    assert report["blocks"] == 2
+    assert report["records"] == 2
+    assert report["errors"] == []
+
+def test_validation_report_collects_all_errors(tmp_path):
+    """Test that every problem is reported with its line number"""
+    text = (
+        QUEST_TEXT.replace("REWARD_GOLD: 40", "REWARD_GOLD: forty")   # line 13
+        + "\n"
+        + QUEST_TEXT.split("\n\n")[0]                                 # line 17
+        + "\n\nQUEST_ID: orphan\nTITLE: Orphan\nDESCRIPTION: x\n"   # line 25
+        "REWARD_XP: 1\nREWARD_GOLD: 1\nREQUIRED_LEVEL: 1\n"
+        "PREREQUISITE: lost_quest\n"
+        "\nQUEST_ID: partial\nbroken line\n"                           # line 33-34
+    )
+    path = write_file(tmp_path / "quests.txt", text)
+
+    report = game_data.validate_catalog_file(path, "quest")
+    found = [(error["line"], error["record_id"]) for error in report["errors"]]
+
+    assert report["valid"] is False
+    assert report["blocks"] == 5
+    assert report["records"] == 2
+    assert (13, "second_steps") in found
+    assert (17, "first_steps") in found
+    assert (25, "orphan") in found
+    assert (34, "partial") in found
+    # Six missing fields reported at the start of the block
+    assert sum(1 for line, _ in found if line == 33) == 6
+    assert all(error["file"] == path for error in report["errors"])
+
+def test_validation_report_items(tmp_path):
+    """Test item-specific checks: unknown type and bad effect"""
+    text = ITEM_TEXT.replace("TYPE: weapon", "TYPE: banana")
+    text = text.replace("EFFECT: health:20", "EFFECT: health")
+    path = write_file(tmp_path / "items.txt", text)
+
+    report = game_data.validate_catalog_file(path, "item")
+    assert [error["line"] for error in report["errors"]] == [4, 10]
+    assert report["records"] == 0
+
+# ============================================================================
+# COLUMNAR VIEW TESTS
+# ============================================================================
+
+def test_item_columns(tmp_path):
+    """Test vectorized queries over the item catalog"""
+    np = pytest.importorskip("numpy")
+    text = ITEM_TEXT.replace("EFFECT: strength:5", "EFFECT: strength:5,magic:2")
+    items = game_data.load_items(write_file(tmp_path / "items.txt", text))
+
+    columns = game_data.build_item_columns(items)
+    assert len(columns) == 2
+    assert columns["cost"].tolist() == [25, 100]
+
+    weapons = columns["type"] == columns.code("type", "weapon")
+    assert columns.ids_where(weapons) == ["iron_sword"]
+    assert columns.ids_where(columns["cost"] < 50) == ["health_potion"]
+
+    strength = columns["effect_stat"] == columns.code("effect_stat", "strength")
+    assert columns["effect_value"][strength].tolist() == [5]
+    assert columns["effect_item"].tolist() == [0, 1, 1]
+    assert columns.code("effect_stat", "luck") == -1
+
+def test_quest_columns(tmp_path):
+    """Test vectorized queries over the quest catalog"""
+    np = pytest.importorskip("numpy")
+    quests = game_data.load_quests(write_file(tmp_path / "quests.txt", QUEST_TEXT))
+
+    columns = game_data.build_quest_columns(quests)
+    assert int(columns["reward_xp"].sum()) == 150
+    assert columns["has_prerequisite"].tolist() == [False, True]
+    level_two = columns["required_level"] >= 2
+    assert columns.ids_where(level_two) == ["second_steps"]
+
+# ============================================================================
+# IMPORT TESTS
+# ============================================================================
+
+@pytest.mark.parametrize("module", [
+    "custom_exceptions", "game_data", "character_manager",
+    "inventory_system", "quest_handler", "combat_system", "main",
+])
+def test_module_imports_on_its_own(module):
+    """Test that each module imports first in a fresh interpreter (no cycles)"""
+    import subprocess
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run([sys.executable, "-c", f"import {module}"],
+                            cwd=root, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
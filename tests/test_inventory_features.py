@@ -0,0 +1,413 @@
+"""
+Test Inventory Features
+Tests for stacked inventories, inventory transactions, bulk shopping,
+effective stats and equipment slots
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import inventory_system
+from inventory_system import StackedInventory, InventoryTransaction
+from custom_exceptions import (
+    InventoryFullError, ItemNotFoundError, InsufficientResourcesError,
+    InvalidItemTypeError
+)
+
+# ============================================================================
+# STACKED INVENTORY TESTS
+# ============================================================================
+
+def make_stacked_character():
+    char = character_manager.create_character("Stacker", "Warrior")
+    char["inventory"] = ["health_potion", "iron_sword", "health_potion"]
+    inventory_system.stack_inventory(char)
+    return char
+
+def test_stacked_inventory_list_compatibility():
+    """Test that a StackedInventory supports the list operations used"""
+    inventory = StackedInventory(["a", "b", "a"])
+    assert len(inventory) == 3
+    assert "a" in inventory and "c" not in inventory
+    assert inventory.count("a") == 2 and inventory.count("c") == 0
+    assert sorted(inventory) == ["a", "a", "b"]
+    assert inventory == ["b", "a", "a"]
+    assert inventory != ["a", "b"]
+
+    inventory.append("c")
+    inventory.remove("a")
+    assert dict(inventory.stacks()) == {"a": 1, "b": 1, "c": 1}
+    with pytest.raises(ValueError):
+        inventory.remove("missing")
+    with pytest.raises(ValueError):
+        inventory.remove("b", 2)
+
+def test_stacked_inventory_save_string_round_trip():
+    """Test conversion to and from the save file list format"""
+    inventory = StackedInventory.from_save_string("potion,sword,potion")
+    assert inventory.count("potion") == 2
+    assert StackedInventory.from_save_string(inventory.to_save_string()) == inventory
+    assert len(StackedInventory.from_save_string("")) == 0
+
+def test_inventory_functions_with_stacks():
+    """Test the inventory API on a stacked inventory"""
+    char = make_stacked_character()
+    assert inventory_system.has_item(char, "iron_sword")
+    assert inventory_system.count_item(char, "health_potion") == 2
+    assert inventory_system.get_inventory_space_remaining(char) == \
+        inventory_system.MAX_INVENTORY_SIZE - 3
+
+    inventory_system.remove_item_from_inventory(char, "health_potion")
+    assert inventory_system.count_item(char, "health_potion") == 1
+    with pytest.raises(ItemNotFoundError):
+        inventory_system.remove_item_from_inventory(char, "dragon_scale")
+
+    for _ in range(inventory_system.get_inventory_space_remaining(char)):
+        inventory_system.add_item_to_inventory(char, "arrow")
+    with pytest.raises(InventoryFullError):
+        inventory_system.add_item_to_inventory(char, "arrow")
+
+    removed = inventory_system.clear_inventory(char)
+    assert len(removed) == inventory_system.MAX_INVENTORY_SIZE
+    assert isinstance(char["inventory"], StackedInventory)
+
+def test_stacked_inventory_save_and_display(tmp_path, capsys):
+    """Test that stacked characters validate, save and display"""
+    char = make_stacked_character()
+    assert character_manager.validate_character_data(char)
+    character_manager.save_character(char, str(tmp_path))
+    loaded = character_manager.load_character("Stacker", str(tmp_path))
+    assert loaded["inventory"] == char["inventory"]
+
+    items = {"health_potion": {"name": "Health Potion", "type": "consumable"}}
+    inventory_system.display_inventory(char, items)
+    assert "Health Potion (consumable) x2" in capsys.readouterr().out
+
+# ============================================================================
+# INVENTORY TRANSACTION TESTS
+# ============================================================================
+
+@pytest.fixture(params=["list", "stacked"])
+def trader(request):
+    """A character with a list or stacked inventory"""
+    char = character_manager.create_character("Trader", "Rogue")
+    char["inventory"] = ["iron_ore", "iron_ore", "iron_ore", "herb"]
+    if request.param == "stacked":
+        inventory_system.stack_inventory(char)
+    return char
+
+def test_transaction_commits_all_changes(trader):
+    """Test crafting: remove ingredients, add the result, pay gold"""
+    with InventoryTransaction(trader) as tx:
+        tx.remove("iron_ore", 3)
+        tx.add("iron_sword")
+        tx.add_gold(-25)
+    assert sorted(trader["inventory"]) == ["herb", "iron_sword"]
+    assert trader["gold"] == 75
+
+def test_transaction_loot_drop_is_one_check(trader):
+    """Test a large loot drop that only partly fits is rejected whole"""
+    tx = InventoryTransaction(trader)
+    tx.add("arrow", inventory_system.MAX_INVENTORY_SIZE)
+    before = list(trader["inventory"])
+    with pytest.raises(InventoryFullError):
+        tx.commit()
+    assert sorted(trader["inventory"]) == sorted(before)
+
+    tx.rollback()
+    tx.add("arrow", inventory_system.MAX_INVENTORY_SIZE - len(before))
+    tx.commit()
+    assert len(trader["inventory"]) == inventory_system.MAX_INVENTORY_SIZE
+
+def test_transaction_failures_change_nothing(trader):
+    """Test missing items and missing gold roll back everything"""
+    before = (sorted(trader["inventory"]), trader["gold"])
+
+    with pytest.raises(ItemNotFoundError):
+        with InventoryTransaction(trader) as tx:
+            tx.add("iron_sword")
+            tx.remove("iron_ore", 4)
+    with pytest.raises(InsufficientResourcesError):
+        with InventoryTransaction(trader) as tx:
+            tx.remove("herb")
+            tx.add_gold(-1000)
+    with pytest.raises(RuntimeError):
+        with InventoryTransaction(trader) as tx:
+            tx.remove("herb")
+            raise RuntimeError("trade cancelled")
+
+    assert (sorted(trader["inventory"]), trader["gold"]) == before
+
+def test_transaction_swap_when_full(trader):
+    """Test that an add and a remove cancel out against capacity"""
+    space = inventory_system.get_inventory_space_remaining(trader)
+    for _ in range(space):
+        inventory_system.add_item_to_inventory(trader, "rock")
+
+    with InventoryTransaction(trader) as tx:
+        tx.remove("herb")
+        tx.add("gem")
+        tx.add("coin")
+        tx.remove("coin")
+    assert inventory_system.has_item(trader, "gem")
+    assert not inventory_system.has_item(trader, "herb")
+    assert not inventory_system.has_item(trader, "coin")
+    assert len(trader["inventory"]) == inventory_system.MAX_INVENTORY_SIZE
+
+# ============================================================================
+# BULK SHOP TESTS
+# ============================================================================
+
+SHOP_ITEMS = {
+    "health_potion": {"name": "Health Potion", "cost": 25},
+    "iron_sword": {"name": "Iron Sword", "cost": 101},
+}
+
+def test_purchase_items_receipt(trader):
+    """Test buying several items with quantities in one step"""
+    trader["gold"] = 500
+    receipt = inventory_system.purchase_items(
+        trader, [("health_potion", 10), ("iron_sword", 2)], SHOP_ITEMS)
+
+    assert receipt["total"] == 452
+    assert receipt["gold_remaining"] == trader["gold"] == 48
+    assert receipt["lines"][0] == {"item_id": "health_potion", "name": "Health Potion",
+                                   "quantity": 10, "unit_price": 25, "subtotal": 250}
+    assert inventory_system.count_item(trader, "health_potion") == 10
+    assert inventory_system.count_item(trader, "iron_sword") == 2
+
+def test_purchase_items_checks_everything_first(trader):
+    """Test that a basket that fails any check buys nothing"""
+    before = (sorted(trader["inventory"]), trader["gold"])
+    with pytest.raises(InsufficientResourcesError):
+        inventory_system.purchase_items(trader, [("health_potion", 5)], SHOP_ITEMS)
+
+    trader["gold"] = 10**6
+    with pytest.raises(InventoryFullError):
+        inventory_system.purchase_items(trader, [("health_potion", 17)], SHOP_ITEMS)
+    with pytest.raises(ItemNotFoundError):
+        inventory_system.purchase_items(
+            trader, [("health_potion", 1), ("dragon", 1)], SHOP_ITEMS)
+    assert sorted(trader["inventory"]) == before[0]
+    assert trader["gold"] == 10**6
+
+def test_sell_items_receipt(trader):
+    """Test selling quantities at half price, all or nothing"""
+    trader["gold"] = 200
+    inventory_system.purchase_items(trader, [("iron_sword", 1)], SHOP_ITEMS)
+    trader["inventory"].extend(["health_potion"] * 3)
+
+    with pytest.raises(ItemNotFoundError):
+        inventory_system.sell_items(trader, [("health_potion", 4)], SHOP_ITEMS)
+
+    gold = trader["gold"]
+    receipt = inventory_system.sell_items(
+        trader, [("health_potion", 3), ("iron_sword", 1)], SHOP_ITEMS)
+    assert receipt["total"] == 3 * 12 + 50
+    assert trader["gold"] == gold + 86
+    assert not inventory_system.has_item(trader, "health_potion")
+
+def test_sell_items_from_overfull_inventory(trader):
+    """Test that an inventory over capacity can still sell items"""
+    trader["inventory"].extend(["health_potion"] * 21)
+    assert len(trader["inventory"]) == 25
+
+    inventory_system.sell_items(trader, [("health_potion", 1)], SHOP_ITEMS)
+    assert len(trader["inventory"]) == 24
+    with pytest.raises(InventoryFullError):
+        inventory_system.purchase_items(trader, [("health_potion", 1)], SHOP_ITEMS)
+
+# ============================================================================
+# EFFECTIVE STATS TESTS
+# ============================================================================
+
+SWORD = {"type": "weapon", "effect": "strength:5"}
+PLATE = {"type": "armor", "effect": "max_health:30"}
+
+def test_equipment_modifiers_separate_base_and_effective():
+    """Test that equipment shows up in effective but not base stats"""
+    char = character_manager.create_character("Knight", "Warrior")
+    base = inventory_system.get_base_stats(char)
+    char["inventory"] = ["iron_sword", "plate"]
+
+    inventory_system.equip_weapon(char, "iron_sword", SWORD)
+    inventory_system.equip_armor(char, "plate", PLATE)
+    assert inventory_system.get_base_stats(char) == base
+    assert char["stat_modifiers"] == {"strength": 5, "max_health": 30}
+    assert inventory_system.get_effective_stats(char) == {
+        "max_health": base["max_health"] + 30,
+        "strength": base["strength"] + 5,
+        "magic": base["magic"],
+    }
+
+    # Level ups raise the base; the modifier stays on top
+    character_manager.gain_experience(char, 100)
+    assert inventory_system.get_base_stats(char)["strength"] == base["strength"] + 2
+    assert char["strength"] == base["strength"] + 7
+
+    inventory_system.unequip_weapon(char)
+    inventory_system.unequip_armor(char)
+    assert char["stat_modifiers"] == {}
+    assert char["strength"] == base["strength"] + 2
+    assert char["health"] <= char["max_health"]
+
+def test_calculate_damage_uses_effective_strength():
+    """Test that combat reads strength with equipment included"""
+    import combat_system
+
+    char = character_manager.create_character("Fighter", "Warrior")
+    enemy = combat_system.create_enemy("goblin")
+    battle = combat_system.SimpleBattle(char, enemy)
+    unarmed = battle.calculate_damage(char, enemy)
+
+    char["inventory"].append("iron_sword")
+    inventory_system.equip_weapon(char, "iron_sword", SWORD)
+    assert battle.calculate_damage(char, enemy) == unarmed + 5
+
+# ============================================================================
+# EQUIPMENT SLOT TESTS
+# ============================================================================
+
+GEAR = {
+    "iron_helm": {"type": "armor", "slot": "helmet", "effect": "max_health:10,strength:1"},
+    "swift_boots": {"type": "armor", "slot": "boots", "effect": "magic:2"},
+    "ruby_ring": {"type": "armor", "slot": "ring", "effect": "strength:3,magic:3"},
+    "buckler": {"type": "weapon", "slot": "offhand", "effect": "max_health:5"},
+    "potion": {"type": "consumable", "effect": "health:20"},
+}
+
+def make_geared_character():
+    char = character_manager.create_character("Geared", "Cleric")
+    char["inventory"] = list(GEAR) + ["ruby_ring"]
+    return char
+
+def test_equip_items_in_many_slots():
+    """Test multi-effect items aggregated across arbitrary slots"""
+    char = make_geared_character()
+    base = inventory_system.get_base_stats(char)
+
+    for item_id in ("iron_helm", "swift_boots", "buckler"):
+        inventory_system.equip_item(char, item_id, GEAR[item_id])
+    inventory_system.equip_item(char, "ruby_ring", GEAR["ruby_ring"], "ring1")
+    inventory_system.equip_item(char, "ruby_ring", GEAR["ruby_ring"], "ring2")
+
+    assert char["equipment"] == {"helmet": "iron_helm", "boots": "swift_boots",
+                                 "offhand": "buckler", "ring1": "ruby_ring",
+                                 "ring2": "ruby_ring"}
+    assert char["stat_modifiers"] == {"max_health": 15, "strength": 7, "magic": 8}
+    assert inventory_system.get_base_stats(char) == base
+    assert char["strength"] == base["strength"] + 7
+    assert "equipped_weapon" not in char
+
+    assert inventory_system.unequip_item(char, "ring1") == "ruby_ring"
+    assert inventory_system.unequip_item(char, "ring1") is None
+    assert char["stat_modifiers"]["strength"] == 4
+    for slot in list(char["equipment"]):
+        inventory_system.unequip_item(char, slot)
+    assert char["stat_modifiers"] == {}
+    assert inventory_system.get_effective_stats(char) == base
+
+def test_equip_item_swaps_and_rejects_consumables():
+    """Test slot replacement on a full inventory and unequippable items"""
+    char = make_geared_character()
+    char["inventory"].append("steel_helm")
+    while inventory_system.get_inventory_space_remaining(char):
+        char["inventory"].append("rock")
+    steel = {"type": "armor", "slot": "helmet", "effect": "max_health:20"}
+
+    inventory_system.equip_item(char, "iron_helm", GEAR["iron_helm"])
+    assert inventory_system.equip_item(char, "steel_helm", steel) == "iron_helm"
+    assert char["stat_modifiers"] == {"max_health": 20}
+    assert inventory_system.has_item(char, "iron_helm")
+
+    with pytest.raises(InvalidItemTypeError):
+        inventory_system.equip_item(char, "potion", GEAR["potion"])
+
+def test_equip_item_health_effect_is_applied_once():
+    """Test that a health effect is capped and not taken back on unequip"""
+    char = make_geared_character()
+    char["inventory"].append("vital_charm")
+    charm = {"type": "armor", "slot": "neck", "effect": "health:30,max_health:10"}
+    char["health"] = 5
+    max_health = char["max_health"]
+
+    inventory_system.equip_item(char, "vital_charm", charm)
+    assert char["equipment_effects"]["neck"] == (("max_health", 10),)
+    assert char["max_health"] == max_health + 10
+    assert char["health"] == 35
+
+    inventory_system.unequip_item(char, "neck")
+    assert char["stat_modifiers"] == {}
+    assert char["max_health"] == max_health
+    assert char["health"] == 35
+
+    # At full health the effect is capped, and unequipping can't kill
+    char["health"] = max_health
+    inventory_system.equip_item(char, "vital_charm", {"type": "armor", "slot": "neck",
+                                                      "effect": "health:30"})
+    assert char["health"] == max_health
+    inventory_system.unequip_item(char, "neck")
+    assert char["health"] == max_health
+
+def test_weapon_wrappers_keep_legacy_keys():
+    """Test equip_weapon/unequip_weapon on top of the slot map"""
+    char = character_manager.create_character("Legacy", "Warrior")
+    strength = char["strength"]
+    char["inventory"] = ["old_sword", "new_sword"]
+
+    inventory_system.equip_weapon(char, "old_sword", {"type": "weapon", "effect": "strength:3"})
+    inventory_system.equip_weapon(char, "new_sword",
+                                  {"type": "weapon", "effect": "strength:5,magic:1"})
+    assert char["equipped_weapon"] == char["equipment"]["weapon"] == "new_sword"
+    assert char["weapon_bonus"] == 5
+    assert char["strength"] == strength + 5
+    assert inventory_system.has_item(char, "old_sword")
+
+    assert inventory_system.unequip_weapon(char) == "new_sword"
+    assert char["strength"] == strength and char["weapon_bonus"] == 0
+    assert "equipped_weapon" not in char
+
+def test_legacy_equipped_weapon_is_converted():
+    """Test characters equipped before the slot map existed"""
+    char = character_manager.create_character("Old", "Warrior")
+    char["equipped_weapon"] = "axe"
+    char["weapon_bonus"] = 4
+    char["strength"] += 4
+
+    assert inventory_system.get_base_stats(char)["strength"] == 15
+    assert inventory_system.get_effective_stats(char)["strength"] == 19
+    assert inventory_system.unequip_weapon(char) == "axe"
+    assert char["strength"] == 15
+    assert char["stat_modifiers"] == {}
+    assert inventory_system.get_base_stats(char)["strength"] == 15
+
+def test_item_slots_from_catalog(tmp_path):
+    """Test the optional SLOT field in item files"""
+    import game_data
+
+    path = tmp_path / "items.txt"
+    path.write_text(
+        "ITEM_ID: iron_helm\nNAME: Iron Helm\nTYPE: armor\n"
+        "EFFECT: max_health:10\nCOST: 40\nDESCRIPTION: Dented\nSLOT: helmet\n\n"
+        "ITEM_ID: club\nNAME: Club\nTYPE: weapon\n"
+        "EFFECT: strength:2\nCOST: 5\nDESCRIPTION: Heavy\n\n"
+        "ITEM_ID: potion\nNAME: Potion\nTYPE: consumable\n"
+        "EFFECT: health:20\nCOST: 25\nDESCRIPTION: Red\n"
+    )
+    for compact in (False, True):
+        items = game_data.load_items(str(path), compact=compact)
+        assert items["iron_helm"]["slot"] == "helmet"
+        assert items["club"]["slot"] == "weapon"
+        assert items["potion"]["slot"] == ""
+
+    char = character_manager.create_character("Cataloged", "Warrior")
+    char["inventory"] = ["iron_helm"]
+    inventory_system.equip_item(char, "iron_helm", items["iron_helm"])
+    assert char["equipment"] == {"helmet": "iron_helm"}
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])